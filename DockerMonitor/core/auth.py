@@ -50,7 +50,7 @@ def verify_token(token: str) -> str | None:
             return None
         
         # 허용된 이메일인지 확인
-        if email not in settings.allowed_email_list:
+        if email not in _allowed()[0]:
             return None
         
         return email
@@ -64,6 +64,25 @@ def hash_email(email: str) -> str:
     return hashlib.sha256(f"{email}:{settings.docker_token_secret}".encode()).hexdigest()
 
 
+# (allowed_emails, docker_token_secret) → (허용 이메일 집합, 유효 세션 토큰 집합)
+_allowed_cache: tuple = (None, None, frozenset(), frozenset())
+
+
+def _allowed() -> tuple[frozenset, frozenset]:
+    """허용 이메일 / 세션 토큰 집합 - 설정 값이 바뀐 경우에만 다시 계산"""
+    global _allowed_cache
+    emails_raw, secret = settings.allowed_emails, settings.docker_token_secret
+    if _allowed_cache[0] != emails_raw or _allowed_cache[1] != secret:
+        emails = frozenset(settings.allowed_email_list)
+        _allowed_cache = (emails_raw, secret, emails, frozenset(hash_email(e) for e in emails))
+    return _allowed_cache[2], _allowed_cache[3]
+
+
+def is_valid_session(session_token: str | None) -> bool:
+    """세션 쿠키 검증 - 미리 계산한 토큰 집합 조회 (요청마다 해시 계산 없음)"""
+    return bool(session_token) and session_token in _allowed()[1]
+
+
 async def auth_callback(request: Request, token: str = None):
     """토큰 기반 인증 콜백 - shwoo_server에서 리다이렉트됨"""
     if not token:
@@ -81,28 +100,48 @@ async def auth_callback(request: Request, token: str = None):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>접근 거부 - Docker Monitor</title>
-    <script src="https://cdn.tailwindcss.com"></script>
     <style>
         body {{
+            margin: 0;
+            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
             background: linear-gradient(135deg, #0a0a0a 0%, #1a1a2e 50%, #16213e 100%);
             min-height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
         }}
         .glass {{
             background: rgba(255, 255, 255, 0.05);
             backdrop-filter: blur(10px);
             border: 1px solid rgba(255, 255, 255, 0.1);
+            border-radius: 1rem;
+            padding: 2rem;
+            max-width: 28rem;
+            width: 100%;
+            margin: 0 1rem;
+            text-align: center;
+        }}
+        .icon {{ font-size: 3.75rem; margin-bottom: 1rem; }}
+        h1 {{ font-size: 1.5rem; font-weight: 700; color: #f87171; margin: 0 0 1rem; }}
+        p {{ color: #9ca3af; margin: 0 0 1.5rem; }}
+        a {{
+            display: inline-block;
+            padding: 0.75rem 1.5rem;
+            border-radius: 0.5rem;
+            background: linear-gradient(to right, #3b82f6, #a855f7);
+            color: #fff;
+            font-weight: 500;
+            text-decoration: none;
         }}
+        a:hover {{ opacity: 0.9; }}
     </style>
 </head>
-<body class="flex items-center justify-center">
-    <div class="glass rounded-2xl p-8 max-w-md w-full mx-4 text-center">
-        <div class="text-6xl mb-4">🔒</div>
-        <h1 class="text-2xl font-bold text-red-400 mb-4">접근이 거부되었습니다</h1>
-        <p class="text-gray-400 mb-6">유효하지 않거나 만료된 인증 토큰입니다.</p>
-        <a href="{shwoo_url}" 
-           class="inline-block px-6 py-3 rounded-lg bg-gradient-to-r from-blue-500 to-purple-500 text-white font-medium hover:opacity-90 transition-opacity">
-            Shwoo 사이트로 돌아가기
-        </a>
+<body>
+    <div class="glass">
+        <div class="icon">🔒</div>
+        <h1>접근이 거부되었습니다</h1>
+        <p>유효하지 않거나 만료된 인증 토큰입니다.</p>
+        <a href="{shwoo_url}">Shwoo 사이트로 돌아가기</a>
     </div>
 </body>
 </html>
@@ -3,7 +3,7 @@
 .env 파일 또는 환경 변수에서 로딩
 """
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import Dict, List
 
 
 class Settings(BaseSettings):
@@ -29,6 +29,98 @@ class Settings(BaseSettings):
     # 모니터링 간격 (초)
     monitor_interval: int = 5
 
+    # Executor 풀 크기 (lane별 워커 수)
+    read_pool_workers: int = 8
+    mutation_pool_workers: int = 4
+    long_pool_workers: int = 2
+
+    # 로그 follow 등 장시간 블로킹 스트림 전용 스레드 수 (= 동시 스트림 상한)
+    stream_pool_workers: int = 32
+
+    # Executor 대기열 상한 (워커 수를 넘어 대기할 수 있는 작업 수)
+    read_queue_limit: int = 64
+    mutation_queue_limit: int = 32
+    long_queue_limit: int = 8
+
+    # 동시에 실행할 수 있는 이미지 Pull 수
+    max_concurrent_pulls: int = 2
+
+    # 백그라운드 Job 동시 실행 수 / 보관할 완료 Job 이력 수
+    job_workers: int = 4
+    job_history_size: int = 100
+
+    # json-file 로그 직접 읽기: 호스트의 /var/lib/docker/containers 마운트 경로 (빈 값이면 데몬 API 사용)
+    docker_containers_dir: str = ""
+
+    # 다중 컨테이너 로그 병합 시 재정렬 대기 시간 (ms) - 컨테이너 간 시계/전달 지연 보정
+    log_merge_window_ms: int = 500
+    # 병합 스트림 최대 컨테이너 수 (컨테이너당 STREAM 스레드 2개 - lane 여유에 따라 추가로 제한됨)
+    log_merge_max_containers: int = 12
+
+    # 로그 링 버퍼: 컨테이너당 보관 줄 수 / 유휴 정리 시간 (초) / 최대 컨테이너 수
+    # (최대 컨테이너 수는 버퍼 follower가 STREAM_POOL_WORKERS의 1/4을 넘지 않도록 추가로 제한됨)
+    log_buffer_lines: int = 2000
+    log_buffer_idle_seconds: int = 300
+    log_buffer_max_containers: int = 4
+
+    # 로그 검색 색인: 수집 대상 (이름/ID 콤마 구분, "*"는 실행 중인 전체, 빈 값이면 API로 추가한 것만)
+    log_index_containers: str = ""
+    # 색인 보존 한도 (전체 줄 수 / 기간 초) / 수집 시작 시 가져올 과거 줄 수
+    log_index_max_lines: int = 200000
+    log_index_retention_seconds: int = 86400
+    log_index_backfill_lines: int = 1000
+
+    # 정규식 검색 프로세스 수 / 타임아웃 (초)
+    log_search_processes: int = 2
+    log_search_regex_timeout: float = 10
+
+    # 로그 아카이브: 저장 디렉터리 (빈 값이면 비활성) / 수집 대상 (이름/ID 콤마 구분, "*"는 전체)
+    log_archive_dir: str = ""
+    log_archive_containers: str = ""
+    # 아카이브 블록 기록 주기 (초) / 세그먼트 보존 기간 (일, 0이면 무제한)
+    log_archive_flush_seconds: int = 10
+    log_archive_retention_days: int = 7
+
+    # 로그 패턴 카운터: {"라벨": "정규식"} JSON (비어 있으면 비활성) / 대상 컨테이너 / 이력 보관 (분)
+    # 대상마다 follow가 STREAM 스레드 2개를 점유하므로 기본은 비움 ("*"는 실행 중인 전체)
+    log_patterns: Dict[str, str] = {}
+    log_pattern_containers: str = ""
+    log_metrics_history_minutes: int = 60
+
+    # 터미널 출력 묶음: flush 창 (ms) / 프레임 최대 크기 / 소켓 읽기를 멈추는 미전송 버퍼 크기 (바이트)
+    terminal_flush_ms: float = 5
+    terminal_flush_bytes: int = 65536
+    terminal_max_buffer_bytes: int = 262144
+
+    # 터미널 세션: 동시 세션 수 / 클라이언트가 없는 세션 유지 시간 (초) / 세션별 스크롤백 (바이트)
+    terminal_max_sessions: int = 20
+    terminal_idle_timeout: int = 300
+    terminal_scrollback_bytes: int = 262144
+
+    # 컨테이너 일괄 액션 기본 병렬도 / 컨테이너별 결과 대기 시간 (초, 초과해도 액션은 취소되지 않음)
+    bulk_action_parallelism: int = 4
+    bulk_action_timeout: float = 60
+
+    # 일괄 exec 기본 병렬도 / 컨테이너별 타임아웃 (초) / 컨테이너별 최대 출력 (바이트)
+    batch_exec_parallelism: int = 8
+    batch_exec_timeout: float = 60
+    batch_exec_max_output_bytes: int = 1048576
+
+    # Compose 변경 명령(up, pull 등) 타임아웃 (초) - Job으로 실행되므로 HTTP 요청과 무관
+    compose_action_timeout: int = 1800
+    # 동시에 실행할 수 있는 Compose 변경 명령 수 (같은 프로젝트는 항상 순서대로 실행)
+    compose_max_concurrent: int = 2
+    # 롤링 재시작: 한 단계 안에서 동시에 재시작할 서비스 수 / 컨테이너별 준비 대기 시간 (초)
+    compose_rolling_parallelism: int = 2
+    compose_rolling_ready_timeout: float = 120
+    # 파싱해 둘 Compose 파일(경로 조합) 수 - 넘으면 가장 오래 쓰지 않은 항목과 그 파일 감시를 정리
+    compose_file_cache_size: int = 32
+
+    # 페이지 첫 응답에 넣을 리소스 목록 조회 대기 시간 (초) - 넘으면 브라우저가 API로 조회
+    page_state_timeout: float = 1.0
+    # 템플릿 파일 변경 감지 (개발용) - 끄면 시작 시 컴파일한 템플릿을 계속 사용
+    template_auto_reload: bool = False
+
     @property
     def allowed_email_list(self) -> List[str]:
         """콤마로 구분된 이메일 문자열을 리스트로 변환"""
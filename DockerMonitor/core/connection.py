@@ -1,28 +1,51 @@
 """
 Docker 연결 관리 모듈 - 단일 클라이언트 생성 및 생명주기 관리
+
+docker-py(requests, urllib3 포함)는 import 비용이 커서 첫 연결 시점에 executor 스레드에서 로드한다.
 """
-import docker
 import asyncio
 import logging
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
+
+from core import executors
+
+if TYPE_CHECKING:
+    import docker
 
 logger = logging.getLogger(__name__)
 
-_client: Optional[docker.DockerClient] = None
-_executor = ThreadPoolExecutor(max_workers=4)
+_client: Optional["docker.DockerClient"] = None
+_executor = executors.get(executors.READ)
+# 연결 재시도 간격 상한 (초)
+_MAX_RETRY_DELAY = 30
+
+
+def _create_client_sync() -> "docker.DockerClient":
+    """(스레드) docker-py 로드 + 클라이언트 생성 + ping"""
+    import docker
+
+    # HTTP 커넥션 풀을 전체 워커 수에 맞춰 워커가 커넥션을 기다리지 않도록 함
+    client = docker.from_env(max_pool_size=executors.total_workers())
+    client.ping()
+    return client
+
 
+def is_connected() -> bool:
+    """현재 클라이언트가 있는지 (데몬 호출 없음 - readiness 확인용)"""
+    return _client is not None
 
-def get_client() -> docker.DockerClient:
+
+def get_client() -> "docker.DockerClient":
     """현재 Docker 클라이언트 반환"""
     if not _client:
         raise RuntimeError("Docker client not connected. Call connect() first.")
     return _client
 
 
-def get_executor() -> ThreadPoolExecutor:
-    """공유 ThreadPoolExecutor 반환"""
-    return _executor
+def get_executor(lane: str = executors.READ) -> ThreadPoolExecutor:
+    """lane별 공유 ThreadPoolExecutor 반환 (기본: 읽기 전용 lane)"""
+    return executors.get(lane)
 
 
 async def connect():
@@ -30,9 +53,8 @@ async def connect():
     global _client
     loop = asyncio.get_running_loop()
     try:
-        _client = await loop.run_in_executor(_executor, docker.from_env)
-        await loop.run_in_executor(_executor, _client.ping)
-        
+        _client = await loop.run_in_executor(_executor, _create_client_sync)
+
         # 모든 서비스에 클라이언트 주입
         from services import init_services
         init_services(_client)
@@ -44,6 +66,19 @@ async def connect():
         raise
 
 
+async def connect_with_retry():
+    """연결될 때까지 재시도 (1초부터 두 배씩, 최대 _MAX_RETRY_DELAY초) - 시작 시 백그라운드 태스크로 실행"""
+    delay = 1
+    while _client is None:
+        try:
+            await connect()
+            return
+        except Exception:
+            logger.info(f"Retrying Docker connection in {delay}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _MAX_RETRY_DELAY)
+
+
 async def disconnect():
     """Docker 연결 종료"""
     global _client
@@ -17,6 +17,16 @@ class DockerConnectionError(DockerMonitorException):
         super().__init__(message=message, code="DOCKER_CONNECTION_ERROR")
 
 
+class ExecutorSaturatedError(DockerMonitorException):
+    """Executor 대기열 포화"""
+    def __init__(self, lane: str):
+        super().__init__(
+            message=f"요청이 너무 많습니다. 잠시 후 다시 시도하세요 ({lane} 작업 대기열 포화)",
+            code="EXECUTOR_SATURATED"
+        )
+        self.lane = lane
+
+
 class ContainerNotFoundError(DockerMonitorException):
     """컨테이너를 찾을 수 없음"""
     def __init__(self, container_id: str):
@@ -57,6 +67,82 @@ class NetworkNotFoundError(DockerMonitorException):
         self.network_id = network_id
 
 
+class JobNotFoundError(DockerMonitorException):
+    """Job을 찾을 수 없음"""
+    def __init__(self, job_id: str):
+        super().__init__(
+            message=f"작업을 찾을 수 없습니다: {job_id}",
+            code="JOB_NOT_FOUND"
+        )
+        self.job_id = job_id
+
+
+class InvalidSearchQueryError(DockerMonitorException):
+    """유효하지 않은 로그 검색어"""
+    def __init__(self, message: str):
+        super().__init__(message=message, code="INVALID_SEARCH_QUERY")
+
+
+class TooManyLogTargetsError(DockerMonitorException):
+    """병합 로그 대상 컨테이너 수 초과 (STREAM lane 여유 / LOG_MERGE_MAX_CONTAINERS)"""
+    def __init__(self, requested: int, limit: int):
+        super().__init__(
+            message=f"컨테이너가 너무 많습니다 ({requested}개 요청, 지금은 최대 {limit}개)",
+            code="TOO_MANY_TARGETS"
+        )
+        self.requested = requested
+        self.limit = limit
+
+
+class LogSearchTimeoutError(DockerMonitorException):
+    """정규식 검색 시간 초과 (검색어 오류가 아님)"""
+    def __init__(self, message: str = "정규식 검색 시간이 초과되었습니다"):
+        super().__init__(message=message, code="LOG_SEARCH_TIMEOUT")
+
+
+class LogArchiveError(DockerMonitorException):
+    """로그 아카이브 작업 실패"""
+    def __init__(self, message: str):
+        super().__init__(message=message, code="LOG_ARCHIVE_ERROR")
+
+
+class ArchiveSegmentNotFoundError(DockerMonitorException):
+    """로그 아카이브 세그먼트를 찾을 수 없음"""
+    def __init__(self, container: str, segment: str):
+        super().__init__(
+            message=f"로그 아카이브 세그먼트를 찾을 수 없습니다: {container}/{segment}",
+            code="ARCHIVE_SEGMENT_NOT_FOUND"
+        )
+        self.container = container
+        self.segment = segment
+
+
+class TerminalSessionNotFoundError(DockerMonitorException):
+    """터미널 세션을 찾을 수 없음"""
+    def __init__(self, session_id: str):
+        super().__init__(
+            message=f"터미널 세션을 찾을 수 없습니다: {session_id}",
+            code="TERMINAL_SESSION_NOT_FOUND"
+        )
+        self.session_id = session_id
+
+
+class TerminalSessionLimitError(DockerMonitorException):
+    """동시 터미널 세션 수 초과"""
+    def __init__(self, limit: int):
+        super().__init__(
+            message=f"동시에 열 수 있는 터미널 세션 수({limit})를 초과했습니다",
+            code="TERMINAL_SESSION_LIMIT"
+        )
+        self.limit = limit
+
+
+class ComposeFileError(DockerMonitorException):
+    """Compose 파일을 읽거나 해석할 수 없음 (없는 파일, YAML 오류, 순환 의존성 등)"""
+    def __init__(self, message: str):
+        super().__init__(message=message, code="COMPOSE_FILE_ERROR")
+
+
 class InvalidActionError(DockerMonitorException):
     """유효하지 않은 액션"""
     def __init__(self, action: str, valid_actions: list[str] = None):
@@ -0,0 +1,131 @@
+"""
+Executor 풀 관리 모듈 - 작업 성격(읽기/변경/장기 실행/스트림)별로 분리된 스레드 풀
+
+느린 변경 작업(stop/restart, 이미지 Pull 등)이 목록/Stats 조회를 굶기지 않도록
+lane마다 독립된 ThreadPoolExecutor와 대기열 상한을 둔다.
+"""
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Any
+
+from core.config import settings
+from core.exceptions import ExecutorSaturatedError
+
+logger = logging.getLogger(__name__)
+
+READ = "read"
+MUTATION = "mutation"
+LONG = "long"
+STREAM = "stream"
+
+
+class LaneExecutor(ThreadPoolExecutor):
+    """대기열 상한과 사용량 메트릭을 가진 ThreadPoolExecutor"""
+
+    def __init__(self, name: str, max_workers: int, queue_limit: int):
+        super().__init__(max_workers=max_workers, thread_name_prefix=f"docker-{name}")
+        self.name = name
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self._lock = threading.Lock()
+        self._pending = 0      # 대기 + 실행 중
+        self._active = 0       # 실행 중
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        """작업 제출 - 대기열이 가득 차면 ExecutorSaturatedError"""
+        with self._lock:
+            if self._pending >= self.max_workers + self.queue_limit:
+                self._rejected += 1
+                raise ExecutorSaturatedError(self.name)
+            self._pending += 1
+            self._submitted += 1
+
+        enqueued_at = time.monotonic()
+
+        def _run():
+            wait = time.monotonic() - enqueued_at
+            with self._lock:
+                self._active += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            try:
+                return fn(*args, **kwargs)
+            except BaseException:
+                with self._lock:
+                    self._failed += 1
+                raise
+            finally:
+                with self._lock:
+                    self._active -= 1
+
+        try:
+            future = super().submit(_run)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+        # 완료/취소 모두에서 pending 감소 (대기 중 취소된 작업 포함)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def available(self) -> int:
+        """지금 거부 없이 받을 수 있는 작업 수 (워커 + 대기열 상한 - 대기/실행 중)"""
+        with self._lock:
+            return max(self.max_workers + self.queue_limit - self._pending, 0)
+
+    def _on_done(self, future: Future):
+        with self._lock:
+            self._pending -= 1
+            if not future.cancelled():
+                self._completed += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        """현재 풀 상태 스냅샷"""
+        with self._lock:
+            started = self._completed + self._active
+            return {
+                "name": self.name,
+                "workers": self.max_workers,
+                "queue_limit": self.queue_limit,
+                "active": self._active,
+                "queued": max(self._pending - self._active, 0),
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "avg_wait_ms": round(self._total_wait / started * 1000, 2) if started else 0.0,
+                "max_wait_ms": round(self._max_wait * 1000, 2),
+            }
+
+
+_executors: Dict[str, LaneExecutor] = {
+    READ: LaneExecutor(READ, settings.read_pool_workers, settings.read_queue_limit),
+    MUTATION: LaneExecutor(MUTATION, settings.mutation_pool_workers, settings.mutation_queue_limit),
+    LONG: LaneExecutor(LONG, settings.long_pool_workers, settings.long_queue_limit),
+    # 스트림은 연결 수명 동안 스레드를 점유하므로 대기열 없이 즉시 거부
+    STREAM: LaneExecutor(STREAM, settings.stream_pool_workers, 0),
+}
+
+
+def get(lane: str = READ) -> LaneExecutor:
+    """lane 이름으로 executor 반환"""
+    return _executors[lane]
+
+
+def total_workers() -> int:
+    """전체 워커 수 - docker-py HTTP 커넥션 풀 크기 산정용"""
+    return sum(ex.max_workers for ex in _executors.values())
+
+
+def get_metrics() -> Dict[str, Dict[str, Any]]:
+    """모든 lane의 메트릭 반환"""
+    return {name: ex.metrics() for name, ex in _executors.items()}
+
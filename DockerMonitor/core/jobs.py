@@ -0,0 +1,208 @@
+"""
+백그라운드 작업(Job) 관리 모듈 - 오래 걸리는 Docker 작업을 HTTP 요청과 분리
+
+엔드포인트는 Job을 제출하고 즉시 202 + job id를 반환한다.
+진행 상황과 로그는 구독자(WebSocket)에게 스트리밍되며, 완료된 Job은 최근 이력으로 보관된다.
+"""
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 구독자 큐 크기 - 느린 구독자는 오래된 진행 이벤트부터 버림
+_SUBSCRIBER_QUEUE_SIZE = 256
+# Job 하나가 보관하는 최근 로그 줄 수
+_MAX_LOG_LINES = 500
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+class Job:
+    """백그라운드 작업 하나의 상태, 로그, 구독자 관리"""
+
+    def __init__(self, kind: str, target: str, key: Optional[str] = None):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.target = target
+        self.key = key
+        self.status = QUEUED
+        self.progress: Optional[float] = None
+        self.message = ""
+        self.detail: Dict[str, Any] = {}
+        self.logs: deque = deque(maxlen=_MAX_LOG_LINES)
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+        self._subscribers: List[asyncio.Queue] = []
+
+    @property
+    def done(self) -> bool:
+        return self.status in (SUCCEEDED, FAILED, CANCELLED)
+
+    def snapshot(self, include_logs: bool = False) -> Dict[str, Any]:
+        data = {
+            "id": self.id,
+            "kind": self.kind,
+            "target": self.target,
+            "status": self.status,
+            "progress": self.progress,
+            "message": self.message,
+            "detail": self.detail,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if include_logs:
+            data["logs"] = list(self.logs)
+        return data
+
+    # ---- 구독 ----
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        if queue in self._subscribers:
+            self._subscribers.remove(queue)
+
+    def publish(self, message: Dict[str, Any]):
+        for queue in self._subscribers:
+            if queue.full():
+                # 진행 이벤트는 손실 허용 - 가장 오래된 것을 버림
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+    # ---- 작업 함수에서 호출 ----
+
+    def log(self, line: str):
+        """로그 한 줄 기록 및 전달"""
+        self.logs.append(line)
+        self.publish({"type": "job_log", "job_id": self.id, "line": line})
+
+    def set_progress(self, progress: Optional[float] = None, message: str = None, **extra):
+        """진행률/메시지 갱신 및 전달 - extra는 작업 종류별 추가 필드"""
+        if progress is not None:
+            self.progress = progress
+        if message is not None:
+            self.message = message
+        self.publish({
+            "type": "job_progress",
+            "job_id": self.id,
+            "progress": self.progress,
+            "message": self.message,
+            **extra,
+        })
+
+    def _finish(self, status: str, result: Any = None, error: Optional[str] = None):
+        self.status = status
+        self.result = result
+        self.error = error
+        self.finished_at = time.time()
+        if status == SUCCEEDED:
+            self.progress = 100.0
+        self.publish({"type": "job_done", **self.snapshot()})
+
+
+class JobManager:
+    """Job 제출, 실행(제한된 동시성), 취소, 이력 관리"""
+
+    def __init__(self):
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._active_keys: Dict[str, Job] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(settings.job_workers)
+        return self._semaphore
+
+    def submit(
+        self,
+        kind: str,
+        target: str,
+        func: Callable[[Job], Awaitable[Any]],
+        key: Optional[str] = None,
+    ) -> Job:
+        """Job 제출 - key가 같은 Job이 진행 중이면 새로 만들지 않고 기존 Job 반환"""
+        if key and key in self._active_keys:
+            return self._active_keys[key]
+
+        job = Job(kind, target, key)
+        self._jobs[job.id] = job
+        if key:
+            self._active_keys[key] = job
+        job.task = asyncio.create_task(self._run(job, func))
+        job.task.add_done_callback(lambda _: self._on_task_done(job))
+        self._prune()
+        return job
+
+    async def _run(self, job: Job, func: Callable[[Job], Awaitable[Any]]):
+        try:
+            async with self._get_semaphore():
+                job.status = RUNNING
+                job.started_at = time.time()
+                job.publish({"type": "job_state", **job.snapshot()})
+                result = await func(job)
+            job._finish(SUCCEEDED, result=result)
+        except asyncio.CancelledError:
+            job._finish(CANCELLED, error="Job cancelled")
+        except Exception as e:
+            logger.error(f"Job {job.id} ({job.kind} {job.target}) failed: {e}")
+            job._finish(FAILED, error=str(e))
+
+    def _on_task_done(self, job: Job):
+        # 시작 전에 취소된 Task는 _run 본문이 실행되지 않으므로 여기서 마무리
+        if not job.done:
+            job._finish(CANCELLED, error="Job cancelled")
+        if job.key and self._active_keys.get(job.key) is job:
+            del self._active_keys[job.key]
+
+    def _prune(self):
+        """완료된 Job 중 오래된 것부터 정리 (이력 상한 유지)"""
+        finished = [j for j in self._jobs.values() if j.done]
+        for job in finished[:max(len(finished) - settings.job_history_size, 0)]:
+            del self._jobs[job.id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def find_active(self, key: str) -> Optional[Job]:
+        """key로 진행 중인 Job 조회"""
+        return self._active_keys.get(key)
+
+    def list(self, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Job 목록 (최근 순)"""
+        jobs = [j for j in reversed(self._jobs.values()) if kind is None or j.kind == kind]
+        return [j.snapshot() for j in jobs]
+
+    def cancel(self, job_id: str) -> bool:
+        """Job 취소 요청 - 이미 끝난 Job이면 False
+
+        executor 스레드에서 실행 중인 동기 호출은 중단되지 않고 결과만 버려진다.
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.done or job.task is None:
+            return False
+        job.task.cancel()
+        return True
+
+
+# 싱글톤 인스턴스
+job_manager = JobManager()
@@ -1,8 +1,9 @@
 import asyncio
 import logging
 import json
-from typing import Dict, Any
-from services import container_service
+import time
+from typing import Dict, Any, Optional
+from services import container_service, log_metrics_service
 from core.websocket_manager import manager as ws_manager
 from core import connection
 from core.config import settings
@@ -19,8 +20,19 @@ class DockerMonitor:
             cls._instance.is_running = False
             cls._instance._task = None
             cls._instance._prev_statuses: Dict[str, str] = {}
+            cls._instance._snapshot: Optional[Dict[str, Any]] = None
+            cls._instance._snapshot_at = 0.0
         return cls._instance
 
+    def snapshot(self, max_age: float) -> Optional[Dict[str, Any]]:
+        """마지막 브로드캐스트 내용 (containers, stats, log_metrics) - max_age초보다 오래되면 None
+
+        페이지 첫 응답에 넣어 WebSocket 연결 전에 화면을 그리는 데 쓴다.
+        """
+        if self._snapshot is None or time.time() - self._snapshot_at > max_age:
+            return None
+        return self._snapshot
+
     async def start(self):
         """백그라운드 모니터링 시작"""
         if self.is_running:
@@ -124,10 +136,18 @@ class DockerMonitor:
                     "stats": stats_data,
                 }
 
+                self._snapshot = {k: v for k, v in payload.items() if k in ("containers", "stats")}
+                self._snapshot_at = time.time()
+
                 # 상태 변경 이벤트가 있으면 포함
                 if status_events:
                     payload["status_events"] = status_events
 
+                # 로그 패턴 카운터 (최근 30분, 분 단위)
+                if log_metrics_service.enabled:
+                    payload["log_metrics"] = log_metrics_service.history(minutes=30)
+                    self._snapshot["log_metrics"] = payload["log_metrics"]
+
                 await ws_manager.broadcast(json.dumps(payload))
 
             except Exception as e:
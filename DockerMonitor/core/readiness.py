@@ -0,0 +1,68 @@
+"""
+시작 상태 / readiness 추적
+
+HTTP 서버는 Docker 연결을 기다리지 않고 바로 요청을 받는다.
+- /healthz: 프로세스가 HTTP 요청을 처리하는지 (liveness)
+- /readyz: 시작 작업이 끝났고 Docker 데몬에 연결되어 있는지 (readiness)
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Dict, Optional
+
+from core import connection
+
+logger = logging.getLogger(__name__)
+
+
+class Readiness:
+    """시작 작업(subsystem)별 상태와 시작 소요 시간"""
+
+    def __init__(self):
+        self.subsystems: Dict[str, str] = {}  # 이름 → starting / ok / failed: ...
+        self.startup_ms: Optional[float] = None
+        self._started: Optional[float] = None
+
+    def begin(self):
+        self._started = time.perf_counter()
+        self.subsystems = {}
+        self.startup_ms = None
+
+    async def _run(self, name: str, work: Awaitable[Any]):
+        self.subsystems[name] = "starting"
+        try:
+            await work
+            self.subsystems[name] = "ok"
+        except Exception as e:
+            logger.error(f"Startup of {name} failed: {e}")
+            self.subsystems[name] = f"failed: {e}"
+
+    async def start_all(self, work: Dict[str, Awaitable[Any]]):
+        """서로 독립적인 시작 작업을 동시에 실행 - 하나가 실패해도 나머지는 계속"""
+        await asyncio.gather(*(self._run(name, w) for name, w in work.items()))
+        self.startup_ms = round((time.perf_counter() - self._started) * 1000, 1)
+
+    @property
+    def startup_complete(self) -> bool:
+        return self.startup_ms is not None
+
+    @property
+    def ready(self) -> bool:
+        return (
+            self.startup_complete
+            and connection.is_connected()
+            and all(state == "ok" for state in self.subsystems.values())
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "http": True,
+            "docker": connection.is_connected(),
+            "startup_complete": self.startup_complete,
+            "startup_ms": self.startup_ms,
+            "subsystems": dict(self.subsystems),
+        }
+
+
+readiness = Readiness()
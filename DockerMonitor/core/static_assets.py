@@ -0,0 +1,128 @@
+"""
+정적 파일 핑거프린트 + 사전 압축
+
+처음 사용할 때 static 디렉토리의 파일을 한 번 읽어 내용 해시(sha256 앞 10자리)를 붙인 이름
+(app.js → app.3f2a1b9c0d.js)을 만들고, gzip / brotli 압축본을 메모리에 미리 만들어 둔다.
+템플릿은 static_url("app.js")로 핑거프린트 URL을 참조하고, 이 URL은 내용이 바뀌면 함께 바뀌므로
+Cache-Control: immutable로 1년 캐시한다 (재방문 시 정적 파일 전송 없음).
+해시 없는 원래 경로는 그대로 제공하되 no-cache(ETag 재검증)로 응답한다.
+
+brotli 패키지가 없으면 gzip만 만든다.
+"""
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+_HASH_LENGTH = 10
+_IMMUTABLE = "public, max-age=31536000, immutable"
+# 압축해도 이득이 적은 크기 (바이트)
+_MIN_COMPRESS_SIZE = 512
+_TEXT_TYPES = ("application/javascript", "application/json", "image/svg+xml")
+
+
+class _Asset:
+    """핑거프린트된 파일 하나 - 원본 / 압축본 바이트"""
+
+    def __init__(self, name: str, data: bytes):
+        digest = hashlib.sha256(data).hexdigest()[:_HASH_LENGTH]
+        root, ext = os.path.splitext(name)
+        self.name = name
+        self.fingerprinted = f"{root}.{digest}{ext}"
+        self.etag = f'"{digest}"'
+        self.media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        textual = self.media_type.startswith("text/") or self.media_type in _TEXT_TYPES
+        if textual:
+            self.media_type += "; charset=utf-8"
+        self.variants: Dict[str, bytes] = {"identity": data}
+        # 이미지/폰트 등 이미 압축된 형식은 원본만 제공
+        if textual and len(data) >= _MIN_COMPRESS_SIZE:
+            gz = gzip.compress(data, compresslevel=9, mtime=0)
+            if len(gz) < len(data):
+                self.variants["gzip"] = gz
+            if brotli is not None:
+                br = brotli.compress(data, quality=11)
+                if len(br) < len(data):
+                    self.variants["br"] = br
+
+    def select(self, accept_encoding: str) -> str:
+        """Accept-Encoding 중 가장 작은 변형 (br > gzip > identity)"""
+        accepted = set()
+        for part in accept_encoding.split(","):
+            token, _, params = part.strip().partition(";")
+            if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+                continue
+            accepted.add(token.strip().lower())
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and (encoding in accepted or "*" in accepted):
+                return encoding
+        return "identity"
+
+
+class FingerprintedStaticFiles(StaticFiles):
+    """StaticFiles + 핑거프린트 URL (사전 압축본, immutable 캐시)"""
+
+    def __init__(self, directory: str, **kwargs):
+        super().__init__(directory=directory, **kwargs)
+        self._assets: Optional[Dict[str, _Asset]] = None  # 원래 이름 → 자산
+        self._by_fingerprint: Dict[str, _Asset] = {}
+
+    def build(self):
+        """디렉토리의 파일을 읽어 핑거프린트 / 압축본 생성 (처음 사용할 때 한 번)"""
+        assets = {}
+        for root, _, files in os.walk(self.directory):
+            for filename in files:
+                path = os.path.join(root, filename)
+                name = os.path.relpath(path, self.directory).replace(os.sep, "/")
+                with open(path, "rb") as f:
+                    assets[name] = _Asset(name, f.read())
+        self._by_fingerprint = {a.fingerprinted: a for a in assets.values()}
+        self._assets = assets
+        logger.info(f"Static assets fingerprinted: {len(assets)} files (brotli={'on' if brotli else 'off'})")
+
+    def _ensure_built(self) -> Dict[str, _Asset]:
+        if self._assets is None:
+            self.build()
+        return self._assets
+
+    def url(self, name: str) -> str:
+        """템플릿용 정적 파일 URL - 알 수 없는 파일이면 원래 경로"""
+        asset = self._ensure_built().get(name)
+        return f"/static/{asset.fingerprinted if asset else name}"
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        self._ensure_built()
+        asset = self._by_fingerprint.get(path)
+        if asset is None:
+            response = await super().get_response(path, scope)
+            response.headers.setdefault("cache-control", "no-cache")
+            return response
+
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405, headers={"Allow": "GET, HEAD"})
+        request_headers = Headers(scope=scope)
+        headers = {"cache-control": _IMMUTABLE, "etag": asset.etag, "vary": "Accept-Encoding"}
+        if request_headers.get("if-none-match") == asset.etag:
+            return Response(status_code=304, headers=headers)
+        encoding = asset.select(request_headers.get("accept-encoding", ""))
+        if encoding != "identity":
+            headers["content-encoding"] = encoding
+        return Response(asset.variants[encoding], media_type=asset.media_type, headers=headers)
+
+
+static_files = FingerprintedStaticFiles(directory="static")
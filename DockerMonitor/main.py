@@ -1,13 +1,16 @@
 from fastapi import FastAPI, Request
-from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 
 from core import connection
 from core.monitor import monitor
+from core.readiness import readiness
+from services import log_search_service, log_archive_service, log_metrics_service, terminal_service
 from core.auth import auth_callback, login_redirect
-from routers import containers, websocket, networks, images, terminal, volumes, compose, system
-from routers.pages import router as pages_router
+from core.static_assets import static_files
+from routers import containers, websocket, networks, images, terminal, volumes, compose, system, jobs, logs, health
+from routers.pages import router as pages_router, warm_templates
 from middleware.error_handler import register_error_handlers
 from middleware.auth_middleware import AuthMiddleware
 
@@ -19,14 +22,32 @@ logger = logging.getLogger("main")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """앱 시작/종료 시 Docker 연결 관리"""
-    # 시작 시 Docker 연결 (단일 클라이언트 → 모든 서비스에 주입)
-    await connection.connect()
-    # 모니터링 시작
-    await monitor.start()
-    logger.info("Application started")
+    """앱 시작/종료 시 Docker 연결 관리
+
+    Docker 연결은 백그라운드에서 재시도하며 기다리지 않는다 (연결 여부는 /readyz).
+    나머지 시작 작업은 서로 독립적이므로 동시에 실행한다 - 각 작업은 연결 전에도 시작할 수 있고
+    (모니터/로그 수집 루프는 연결될 때까지 대기), 연결되면 클라이언트가 모든 서비스에 주입된다.
+    """
+    readiness.begin()
+    connect_task = asyncio.create_task(connection.connect_with_retry())
+    await readiness.start_all({
+        "monitor": monitor.start(),
+        "log_search": log_search_service.start(),
+        "log_archive": log_archive_service.start(),
+        "log_metrics": log_metrics_service.start(),
+        # 페이지 템플릿 / 정적 파일 핑거프린트 준비
+        "templates": asyncio.to_thread(warm_templates),
+        "static_assets": asyncio.to_thread(static_files.build),
+    })
+    logger.info(f"Application started in {readiness.startup_ms}ms (Docker connected: {connection.is_connected()})")
     yield
     # 종료 시 정리
+    connect_task.cancel()
+    await asyncio.gather(connect_task, return_exceptions=True)
+    await terminal_service.stop()
+    await log_metrics_service.stop()
+    await log_archive_service.stop()
+    await log_search_service.stop()
     await monitor.stop()
     await connection.disconnect()
     logger.info("Application shutdown")
@@ -42,8 +63,8 @@ register_error_handlers(app)
 
 # ============ Static Files ============
 
-# 정적 파일 마운트
-app.mount("/static", StaticFiles(directory="static"), name="static")
+# 정적 파일 마운트 (핑거프린트 URL은 사전 압축본 + immutable 캐시)
+app.mount("/static", static_files, name="static")
 
 # ============ Routers ============
 
@@ -56,6 +77,9 @@ app.include_router(terminal.router)
 app.include_router(volumes.router)
 app.include_router(compose.router)
 app.include_router(system.router)
+app.include_router(jobs.router)
+app.include_router(logs.router)
+app.include_router(health.router)
 
 # 페이지 라우터 등록
 app.include_router(pages_router)
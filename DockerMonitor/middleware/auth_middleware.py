@@ -1,42 +1,40 @@
 """
 인증 미들웨어 - shwoo_server SSO 연동
+
+순수 ASGI 미들웨어로 구현해 응답을 감싸지 않는다 (스트리밍 응답은 그대로 전달).
+HTTP 요청과 WebSocket 핸드셰이크 모두 세션 쿠키를 확인한다.
 """
-from fastapi import Request
-from fastapi.responses import RedirectResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import HTTPConnection
+from starlette.responses import RedirectResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from starlette.websockets import WebSocketClose
+
+from core.auth import is_valid_session
 
-from core.config import settings
-from core.auth import hash_email
+# WebSocket 정책 위반 종료 코드 (핸드셰이크 전이면 403으로 거절됨)
+_WS_POLICY_VIOLATION = 1008
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
+class AuthMiddleware:
     """인증 미들웨어 - 보호된 경로에 대한 접근 제어"""
-    
+
     # 인증 없이 접근 가능한 경로
-    PUBLIC_PATHS = ["/login", "/auth", "/static", "/favicon.ico"]
-    
-    async def dispatch(self, request: Request, call_next):
-        path = request.url.path
-        
-        # 공개 경로는 인증 없이 허용
-        if any(path.startswith(p) for p in self.PUBLIC_PATHS):
-            return await call_next(request)
-        
+    PUBLIC_PATHS = ("/login", "/auth", "/static", "/favicon.ico", "/healthz", "/readyz")
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] not in ("http", "websocket") or scope["path"].startswith(self.PUBLIC_PATHS):
+            await self.app(scope, receive, send)
+            return
+
         # 인증 확인 - 이메일 기반 세션 토큰 검증
-        session_token = request.cookies.get("docker_auth")
-        
-        if not session_token:
-            return RedirectResponse("/login", status_code=302)
-        
-        # 허용된 이메일 중 하나와 일치하는지 확인
-        valid_session = False
-        for email in settings.allowed_email_list:
-            expected_token = hash_email(email)
-            if session_token == expected_token:
-                valid_session = True
-                break
-        
-        if not valid_session:
-            return RedirectResponse("/login", status_code=302)
-        
-        return await call_next(request)
+        if is_valid_session(HTTPConnection(scope).cookies.get("docker_auth")):
+            await self.app(scope, receive, send)
+            return
+
+        if scope["type"] == "websocket":
+            await WebSocketClose(code=_WS_POLICY_VIOLATION)(scope, receive, send)
+        else:
+            await RedirectResponse("/login", status_code=302)(scope, receive, send)
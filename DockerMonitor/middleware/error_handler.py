@@ -5,11 +5,16 @@ import logging
 from core.exceptions import (
     DockerMonitorException,
     DockerConnectionError,
+    ExecutorSaturatedError,
     ContainerNotFoundError,
     ImageNotFoundError,
     VolumeNotFoundError,
     NetworkNotFoundError,
+    JobNotFoundError,
+    ArchiveSegmentNotFoundError,
+    TerminalSessionNotFoundError,
     InvalidActionError,
+    LogSearchTimeoutError,
 )
 from core.schemas import error_response
 
@@ -34,6 +39,24 @@ def register_error_handlers(app: FastAPI):
             content=error_response(code=exc.code, message=exc.message)
         )
 
+    @app.exception_handler(ExecutorSaturatedError)
+    async def executor_saturated_handler(request: Request, exc: ExecutorSaturatedError):
+        """Executor 대기열 포화 에러 핸들러"""
+        logger.warning(f"ExecutorSaturatedError: {exc.lane}")
+        return JSONResponse(
+            status_code=503,
+            content=error_response(code=exc.code, message=exc.message)
+        )
+
+    @app.exception_handler(LogSearchTimeoutError)
+    async def log_search_timeout_handler(request: Request, exc: LogSearchTimeoutError):
+        """정규식 검색 시간 초과 에러 핸들러"""
+        logger.warning(f"LogSearchTimeoutError: {exc.message}")
+        return JSONResponse(
+            status_code=503,
+            content=error_response(code=exc.code, message=exc.message)
+        )
+
     @app.exception_handler(ContainerNotFoundError)
     async def container_not_found_handler(request: Request, exc: ContainerNotFoundError):
         """컨테이너 없음 에러 핸들러"""
@@ -66,6 +89,30 @@ def register_error_handlers(app: FastAPI):
             content=error_response(code=exc.code, message=exc.message)
         )
 
+    @app.exception_handler(JobNotFoundError)
+    async def job_not_found_handler(request: Request, exc: JobNotFoundError):
+        """Job 없음 에러 핸들러"""
+        return JSONResponse(
+            status_code=404,
+            content=error_response(code=exc.code, message=exc.message)
+        )
+
+    @app.exception_handler(ArchiveSegmentNotFoundError)
+    async def archive_segment_not_found_handler(request: Request, exc: ArchiveSegmentNotFoundError):
+        """로그 아카이브 세그먼트 없음 에러 핸들러"""
+        return JSONResponse(
+            status_code=404,
+            content=error_response(code=exc.code, message=exc.message)
+        )
+
+    @app.exception_handler(TerminalSessionNotFoundError)
+    async def terminal_session_not_found_handler(request: Request, exc: TerminalSessionNotFoundError):
+        """터미널 세션 없음 에러 핸들러"""
+        return JSONResponse(
+            status_code=404,
+            content=error_response(code=exc.code, message=exc.message)
+        )
+
     @app.exception_handler(InvalidActionError)
     async def invalid_action_handler(request: Request, exc: InvalidActionError):
         """유효하지 않은 액션 에러 핸들러"""
@@ -1,5 +1,8 @@
+from typing import Optional
+
 from fastapi import APIRouter
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
 
 from services import compose_service
 from core.schemas import success_response, error_response
@@ -12,6 +15,12 @@ class ComposeActionRequest(BaseModel):
     config_file: str  # docker-compose.yml 경로
 
 
+class RollingRestartRequest(BaseModel):
+    config_file: str
+    parallelism: Optional[int] = Field(default=None, ge=1, le=32)  # 단계 안에서 동시에 재시작할 서비스 수
+    ready_timeout: Optional[float] = Field(default=None, gt=0)  # 컨테이너별 준비 대기 (초)
+
+
 @router.get("")
 async def list_compose_projects():
     """Compose 프로젝트 목록 API"""
@@ -20,16 +29,34 @@ async def list_compose_projects():
 
 
 @router.get("/services")
-async def get_project_services(config_file: str):
-    """특정 프로젝트의 서비스 목록 API"""
-    services = await compose_service.get_project_services(config_file)
+async def get_project_services(config_file: Optional[str] = None, project: Optional[str] = None):
+    """특정 프로젝트의 서비스 목록 API (설정 파일 경로 또는 프로젝트 이름으로 지정)"""
+    services = await compose_service.get_project_services(config_file=config_file, project=project)
     return success_response(data=services)
 
 
+@router.get("/graph")
+async def get_project_graph(config_file: Optional[str] = None, project: Optional[str] = None):
+    """서비스 의존성 그래프 API (depends_on / networks / volumes, 병렬 시작 단계)"""
+    graph = await compose_service.get_graph(config_file=config_file, project=project)
+    return success_response(data=graph)
+
+
 @router.post("/action")
 async def compose_action(req: ComposeActionRequest):
-    """Compose 프로젝트 액션 API"""
-    result = await compose_service.project_action(req.config_file, req.action)
-    if result["success"]:
-        return success_response(data=result)
-    return error_response(code="COMPOSE_ACTION_ERROR", message=result.get("error", "Unknown error"))
+    """Compose 프로젝트 액션 API - Job으로 시작하고 즉시 202 반환"""
+    if req.action not in compose_service.VALID_ACTIONS:
+        return error_response(code="COMPOSE_ACTION_ERROR", message=f"Invalid action: {req.action}")
+    job = compose_service.start_action(req.config_file, req.action)
+    return JSONResponse(status_code=202, content=success_response(data=job.snapshot()))
+
+
+@router.post("/rolling-restart")
+async def rolling_restart(req: RollingRestartRequest):
+    """의존성 순서 롤링 재시작 API - Job으로 시작하고 즉시 202 반환
+
+    Compose 파일을 먼저 읽어 그래프 오류(파일 없음, 순환 의존성)는 Job 생성 전에 400으로 반환한다.
+    """
+    await compose_service.get_graph(config_file=req.config_file)
+    job = compose_service.start_rolling_restart(req.config_file, req.parallelism, req.ready_timeout)
+    return JSONResponse(status_code=202, content=success_response(data=job.snapshot()))
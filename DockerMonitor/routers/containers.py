@@ -1,7 +1,10 @@
+from typing import List, Literal, Optional
+
 from fastapi import APIRouter
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
 
-from services import container_service
+from services import container_service, log_service
 from core import connection
 from core.schemas import success_response
 from core.exceptions import InvalidActionError, ContainerActionError
@@ -20,18 +23,34 @@ async def list_containers():
     return success_response(data=containers)
 
 
+class BulkActionRequest(BaseModel):
+    action: str
+    ids: Optional[List[str]] = None
+    label: Optional[str] = None  # e.g. "tier=web" 또는 "tier"
+    project: Optional[str] = None  # Compose 프로젝트 이름
+    parallelism: Optional[int] = Field(default=None, ge=1, le=32)
+    timeout: Optional[float] = Field(default=None, gt=0)  # 컨테이너별 타임아웃 (초)
+
+
 class UpdateResourceRequest(BaseModel):
     cpu_quota: int = None
     memory_limit: str = None  # e.g. "512m", "1g"
 
 
 @router.post("/{container_id}/action")
-async def container_action(container_id: str, req: ActionRequest):
-    """컨테이너 제어 API (start, stop, restart)"""
+async def container_action(container_id: str, req: ActionRequest, background: bool = False):
+    """컨테이너 제어 API (start, stop, restart)
+
+    background=true이면 Job으로 시작하고 즉시 202 + job id 반환.
+    """
     valid_actions = ["start", "stop", "restart"]
     if req.action not in valid_actions:
         raise InvalidActionError(action=req.action, valid_actions=valid_actions)
 
+    if background:
+        job = container_service.start_action(container_id, req.action)
+        return JSONResponse(status_code=202, content=success_response(data=job.snapshot()))
+
     success = await container_service.perform_action(container_id, req.action)
     if success:
         return success_response(data={"container_id": container_id, "action": req.action})
@@ -39,11 +58,90 @@ async def container_action(container_id: str, req: ActionRequest):
     raise ContainerActionError(container_id=container_id, action=req.action)
 
 
+@router.post("/bulk-action")
+async def bulk_container_action(req: BulkActionRequest, background: bool = False):
+    """여러 컨테이너 일괄 제어 API (ids / label / project 중 하나로 대상 지정)
+
+    컨테이너별 결과를 모아 반환하며, 일부 실패해도 나머지는 계속 수행된다.
+    background=true이면 Job으로 시작하고 즉시 202 + job id 반환.
+    """
+    valid_actions = ["start", "stop", "restart"]
+    if req.action not in valid_actions:
+        raise InvalidActionError(action=req.action, valid_actions=valid_actions)
+
+    targets = await container_service.resolve_targets(ids=req.ids, label=req.label, project=req.project)
+    if background:
+        job = container_service.start_bulk_action(targets, req.action, req.parallelism, req.timeout)
+        return JSONResponse(status_code=202, content=success_response(data=job.snapshot()))
+
+    result = await container_service.bulk_action(targets, req.action, req.parallelism, req.timeout)
+    return success_response(data=result)
+
+
 @router.get("/{container_id}/logs")
-async def get_container_logs(container_id: str, tail: int = 100):
-    """컨테이너 로그 조회 API"""
-    logs = await container_service.get_logs(container_id, tail=tail)
-    return success_response(data={"container_id": container_id, "logs": logs})
+async def get_container_logs(
+    container_id: str,
+    tail: str = "100",
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+):
+    """컨테이너 로그 조회 API
+
+    since/until은 epoch 초 또는 RFC3339 타임스탬프. 응답의 cursor를 다음 요청의
+    since로 넘기면 마지막으로 읽은 이후의 줄을 오래된 순으로 tail줄까지 받는다.
+    truncated가 true이면 남은 줄이 있으므로 새 cursor로 바로 다시 요청한다.
+    """
+    tail_value = int(tail) if tail.isdigit() else "all"
+    result = await log_service.read_logs(container_id, tail=tail_value, since=since, until=until)
+    return success_response(data={
+        "container_id": container_id,
+        "logs": "\n".join(r["line"] for r in result["lines"]),
+        "lines": result["lines"],
+        "cursor": result["cursor"],
+        "truncated": result["truncated"],
+        "source": result["source"],
+    })
+
+
+@router.get("/{container_id}/logs/download")
+async def download_container_logs(
+    container_id: str,
+    format: Literal["text", "ndjson"] = "text",
+    gzip: bool = False,
+    tail: str = "all",
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    timestamps: bool = True,
+    stdout: bool = True,
+    stderr: bool = True,
+):
+    """컨테이너 로그 다운로드 API (스트리밍)
+
+    데몬에서 받은 로그를 메모리에 모으지 않고 그대로 흘려보낸다.
+    format=ndjson이면 줄마다 {"ts", "stream", "line"}, gzip=true이면 .gz 파일로 압축 전송.
+    """
+    tail_value = int(tail) if tail.isdigit() else "all"
+    body = await log_service.open_download(
+        container_id,
+        tail=tail_value,
+        since=since,
+        until=until,
+        stdout=stdout,
+        stderr=stderr,
+        fmt=format,
+        timestamps=timestamps,
+        compress=gzip,
+    )
+    filename = f"{container_id[:12]}.{'ndjson' if format == 'ndjson' else 'log'}"
+    media_type = "application/x-ndjson" if format == "ndjson" else "text/plain; charset=utf-8"
+    if gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.post("/{container_id}/resources")
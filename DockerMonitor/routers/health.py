@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from core.readiness import readiness
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/healthz")
+async def healthz():
+    """Liveness - HTTP 서버가 응답하면 항상 200 (Docker 연결과 무관)"""
+    return {"status": "ok"}
+
+
+@router.get("/readyz")
+async def readyz():
+    """Readiness - 시작 작업 완료 + Docker 연결 시 200, 아니면 503 (상세 상태 포함)"""
+    state = readiness.snapshot()
+    return JSONResponse(status_code=200 if state["ready"] else 503, content=state)
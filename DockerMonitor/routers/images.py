@@ -1,4 +1,5 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
 from services import image_service
@@ -19,14 +20,23 @@ class PullImageRequest(BaseModel):
     image: str  # e.g. "nginx:latest" or "python:3.12-slim"
 
 
+def _split_image(image: str) -> tuple[str, str]:
+    """"repo[:tag]" → (repo, tag) - 레지스트리 포트(host:5000/repo)는 태그로 보지 않음"""
+    repository, sep, tag = image.rpartition(":")
+    if not sep or "/" in tag:
+        return image, "latest"
+    return repository, tag
+
+
 @router.post("/pull")
 async def pull_image(req: PullImageRequest):
-    """Docker 이미지 Pull API"""
-    parts = req.image.split(":", 1)
-    repository = parts[0]
-    tag = parts[1] if len(parts) > 1 else "latest"
-    result = await image_service.pull_image(repository, tag)
-    return success_response(data=result)
+    """Docker 이미지 Pull API - Job으로 시작하고 즉시 202 반환
+
+    진행 상황은 /ws/jobs/{job_id} WebSocket으로 구독.
+    """
+    repository, tag = _split_image(req.image)
+    job = image_service.start_pull(repository, tag)
+    return JSONResponse(status_code=202, content=success_response(data=job.snapshot()))
 
 
 @router.delete("/{image_id}")
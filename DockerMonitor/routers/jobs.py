@@ -0,0 +1,85 @@
+from typing import Optional
+import asyncio
+
+from fastapi import APIRouter, WebSocket
+import logging
+
+from core.jobs import job_manager
+from core.schemas import success_response
+from core.exceptions import JobNotFoundError
+
+router = APIRouter(tags=["jobs"])
+logger = logging.getLogger(__name__)
+
+
+@router.get("/api/jobs")
+async def list_jobs(kind: Optional[str] = None):
+    """진행 중/최근 Job 목록 API"""
+    return success_response(data=job_manager.list(kind=kind))
+
+
+@router.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Job 상세 (최근 로그 포함) API"""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise JobNotFoundError(job_id)
+    return success_response(data=job.snapshot(include_logs=True))
+
+
+@router.post("/api/jobs/{job_id}/cancel")
+async def cancel_job(job_id: str):
+    """Job 취소 API"""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise JobNotFoundError(job_id)
+    cancelled = job_manager.cancel(job_id)
+    return success_response(data={"job_id": job_id, "cancelled": cancelled, "status": job.status})
+
+
+@router.websocket("/ws/jobs/{job_id}")
+async def job_websocket(websocket: WebSocket, job_id: str):
+    """Job 진행 상황 스트리밍 WebSocket
+
+    접속 시 현재 상태(최근 로그 포함)를 먼저 보내고, 이후 progress/log 이벤트를 전달한다.
+    Job이 끝나면 job_done 이벤트 전송 후 연결을 닫는다.
+    이벤트가 드문 긴 Job도 클라이언트가 끊기면 바로 구독을 해제한다.
+    """
+    await websocket.accept()
+    job = job_manager.get(job_id)
+    if job is None:
+        await websocket.send_json({"type": "job_error", "job_id": job_id, "error": "Job not found"})
+        await websocket.close()
+        return
+
+    queue = job.subscribe()
+
+    async def forward_events():
+        await websocket.send_json({"type": "job_state", **job.snapshot(include_logs=True)})
+        while not job.done or not queue.empty():
+            message = await queue.get()
+            await websocket.send_json(message)
+            if message["type"] == "job_done":
+                return
+
+    async def watch_client():
+        # 클라이언트 종료 감지 (수신 메시지는 무시)
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+
+    tasks = [asyncio.create_task(forward_events()), asyncio.create_task(watch_client())]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    except Exception as e:
+        logger.error(f"Job WebSocket error: {e}")
+    finally:
+        job.unsubscribe(queue)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            await websocket.close()
+        except Exception:
+            pass
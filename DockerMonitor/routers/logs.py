@@ -0,0 +1,239 @@
+from typing import Optional
+import asyncio
+import logging
+
+from fastapi import APIRouter, Query, WebSocket
+from fastapi.responses import FileResponse
+
+from services import container_service, log_service, log_search_service, log_archive_service
+from services.log_service import parse_since
+from core.exceptions import DockerMonitorException
+from core.schemas import success_response
+
+router = APIRouter(tags=["logs"])
+logger = logging.getLogger(__name__)
+
+# WebSocket 메시지 하나에 묶어 보낼 최대 줄 수
+_MAX_LINES_PER_MESSAGE = 1000
+
+
+@router.get("/api/logs/search")
+async def search_logs(
+    q: str,
+    containers: Optional[str] = None,
+    from_: Optional[str] = Query(None, alias="from"),
+    to: Optional[str] = None,
+    regex: bool = False,
+    limit: int = Query(200, ge=1, le=5000),
+):
+    """수집된 컨테이너 로그 전체 검색 API
+
+    containers: 이름/ID 콤마 구분, from/to: epoch 초 또는 RFC3339
+    regex=true이면 토큰 검색 대신 정규식 스캔 (프로세스 풀)
+    """
+    names = [c.strip() for c in containers.split(",") if c.strip()] if containers else None
+    data = await log_search_service.search(
+        q, containers=names, start=parse_since(from_), end=parse_since(to), regex=regex, limit=limit
+    )
+    return success_response(data=data)
+
+
+@router.get("/api/logs/index")
+async def get_log_index_status():
+    """로그 검색 색인 수집 상태 API"""
+    return success_response(data=log_search_service.status())
+
+
+@router.post("/api/logs/index/{selector}")
+async def add_log_index_target(selector: str):
+    """로그 수집 대상 추가 API (컨테이너 이름/ID, "*"는 실행 중인 전체)"""
+    log_search_service.add_selector(selector)
+    return success_response(data=log_search_service.status())
+
+
+@router.delete("/api/logs/index/{selector}")
+async def remove_log_index_target(selector: str):
+    """로그 수집 대상 제거 API (이미 수집된 줄은 보존 한도까지 유지)"""
+    removed = log_search_service.remove_selector(selector)
+    return success_response(data={"selector": selector, "removed": removed})
+
+
+@router.get("/api/logs/archive")
+async def get_log_archive_status():
+    """로그 아카이브 상태 API (수집 대상, 보관 중인 컨테이너)"""
+    return success_response(data={
+        "enabled": log_archive_service.enabled,
+        "selectors": log_archive_service.selectors,
+        "ingesting": log_archive_service.ingesting(),
+        "containers": await log_archive_service.list_containers() if log_archive_service.enabled else [],
+    })
+
+
+@router.post("/api/logs/archive/targets/{selector}")
+async def add_log_archive_target(selector: str):
+    """로그 아카이브 대상 추가 API (컨테이너 이름/ID, "*"는 실행 중인 전체)"""
+    log_archive_service.add_selector(selector)
+    return success_response(data={"selector": selector, "selectors": log_archive_service.selectors})
+
+
+@router.delete("/api/logs/archive/targets/{selector}")
+async def remove_log_archive_target(selector: str):
+    """로그 아카이브 대상 제거 API (이미 기록된 세그먼트는 보존 기간까지 유지)"""
+    removed = log_archive_service.remove_selector(selector)
+    return success_response(data={"selector": selector, "removed": removed})
+
+
+@router.get("/api/logs/archive/{container}")
+async def list_log_archive_segments(container: str):
+    """컨테이너의 아카이브 세그먼트 목록 API (시간 범위, 줄 수, 크기)"""
+    return success_response(data=await log_archive_service.list_segments(container))
+
+
+@router.get("/api/logs/archive/{container}/range")
+async def read_log_archive_range(
+    container: str,
+    from_: Optional[str] = Query(None, alias="from"),
+    to: Optional[str] = None,
+    limit: int = Query(5000, ge=1, le=100000),
+):
+    """아카이브 시간 범위 조회 API (범위에 걸친 블록만 압축 해제)"""
+    data = await log_archive_service.read_range(container, parse_since(from_), parse_since(to), limit)
+    return success_response(data=data)
+
+
+@router.get("/api/logs/archive/{container}/{segment}/download")
+async def download_log_archive_segment(container: str, segment: str):
+    """아카이브 세그먼트 다운로드 API (압축된 파일을 그대로 전송)"""
+    path = log_archive_service.segment_path(container, segment)
+    return FileResponse(path, media_type="application/gzip", filename=f"{container}-{segment}.jsonl.gz")
+
+
+@router.websocket("/ws/logs/merged")
+async def merged_logs_websocket(
+    websocket: WebSocket,
+    containers: Optional[str] = None,
+    project: Optional[str] = None,
+    label: Optional[str] = None,
+    tail: str = "100",
+    since: Optional[str] = None,
+):
+    """여러 컨테이너 로그를 시각 순으로 합친 실시간 스트림 (docker compose logs -f 대체)
+
+    대상: containers(이름/ID 콤마 구분) 또는 project(Compose 프로젝트) 또는 label
+    메시지: {"type": "logs", "lines": [{"ts", "stream", "line", "container"}]} / {"type": "end"} / {"type": "error"}
+    """
+    await websocket.accept()
+    tail_value = int(tail) if tail.isdigit() else "all"
+    ids = [c.strip() for c in containers.split(",") if c.strip()] if containers else None
+
+    try:
+        targets = await container_service.resolve_targets(ids=ids, label=label, project=project)
+        if not targets:
+            raise DockerMonitorException("대상 컨테이너가 없습니다", code="NO_TARGETS")
+        merger = await log_service.follow_many(targets, tail=tail_value, since=parse_since(since))
+    except DockerMonitorException as e:
+        await websocket.send_json({"type": "error", "code": e.code, "message": e.message})
+        await websocket.close()
+        return
+    except Exception as e:
+        logger.error(f"Failed to follow merged logs: {e}")
+        await websocket.send_json({"type": "error", "message": str(e)})
+        await websocket.close()
+        return
+
+    async def forward_logs():
+        # send가 느리면 병합기가 대기하고, 밀린 소스의 읽기만 멈춤 (소스별 backpressure)
+        async for batch in merger.batches():
+            for i in range(0, len(batch), _MAX_LINES_PER_MESSAGE):
+                await websocket.send_json({"type": "logs", "lines": batch[i:i + _MAX_LINES_PER_MESSAGE]})
+        await websocket.send_json({"type": "end"})
+
+    async def watch_client():
+        while True:
+            await websocket.receive_text()
+
+    tasks = [asyncio.create_task(forward_logs()), asyncio.create_task(watch_client())]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    except Exception as e:
+        logger.error(f"Merged log stream session error: {e}")
+    finally:
+        merger.close()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+
+
+@router.websocket("/ws/logs/{container_id}")
+async def logs_websocket(
+    websocket: WebSocket,
+    container_id: str,
+    tail: str = "100",
+    since: Optional[str] = None,
+    timestamps: bool = True,
+    stdout: bool = True,
+    stderr: bool = True,
+):
+    """실시간 로그 스트리밍 WebSocket
+
+    초기 tail(또는 since 이후) 로그를 보낸 뒤 새로 생긴 줄만 전달한다.
+    메시지: {"type": "logs", "lines": [{"ts", "stream", "line"}]} / {"type": "end"} / {"type": "error"}
+    재접속 시 마지막 ts를 since로 넘기면 이어서 받을 수 있다.
+    """
+    await websocket.accept()
+    tail_value = int(tail) if tail.isdigit() else "all"
+
+    try:
+        follower = await log_service.follow(
+            container_id, tail=tail_value, since=parse_since(since), stdout=stdout, stderr=stderr
+        )
+    except DockerMonitorException as e:
+        await websocket.send_json({"type": "error", "message": e.message})
+        await websocket.close()
+        return
+    except Exception as e:
+        logger.error(f"Failed to follow logs for {container_id}: {e}")
+        await websocket.send_json({"type": "error", "message": str(e)})
+        await websocket.close()
+        return
+
+    async def forward_logs():
+        while True:
+            records = await follower.queue.get()
+            if records is None:
+                await websocket.send_json({"type": "end"})
+                return
+            # 이미 도착한 청크는 한 메시지로 묶어 전송
+            while len(records) < _MAX_LINES_PER_MESSAGE and not follower.queue.empty():
+                more = follower.queue.get_nowait()
+                if more is None:
+                    follower.queue.put_nowait(None)
+                    break
+                records.extend(more)
+            if not timestamps:
+                records = [{"stream": r["stream"], "line": r["line"]} for r in records]
+            await websocket.send_json({"type": "logs", "lines": records})
+
+    async def watch_client():
+        # 클라이언트 종료 감지 (수신 메시지는 무시)
+        while True:
+            await websocket.receive_text()
+
+    tasks = [asyncio.create_task(forward_logs()), asyncio.create_task(watch_client())]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    except Exception as e:
+        logger.error(f"Log stream session error: {e}")
+    finally:
+        follower.close()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            await websocket.close()
+        except Exception:
+            pass
@@ -1,40 +1,102 @@
 """
 페이지 라우터 - Jinja2 템플릿 페이지 라우트를 동적으로 등록
+
+첫 응답에 페이지가 처음 그릴 데이터(initial_state)를 함께 넣어, 브라우저가 API 호출이나
+WebSocket 연결을 기다리지 않고 한 번의 왕복으로 화면을 그리게 한다.
+- 대시보드: 모니터가 마지막으로 브로드캐스트한 스냅샷 (Docker 호출 없음)
+- 리소스 페이지: 목록 조회 (PAGE_STATE_TIMEOUT 안에 끝나지 않으면 생략 → 브라우저가 기존처럼 API 조회)
 """
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict
+
 from fastapi import APIRouter, Request
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse
 
+from core.config import settings
+from core.monitor import monitor
+from core.static_assets import static_files
+from services import (
+    compose_service, container_service, image_service, network_service, system_service, volume_service,
+)
+
 router = APIRouter(tags=["pages"])
+logger = logging.getLogger(__name__)
 templates = Jinja2Templates(directory="templates")
+templates.env.auto_reload = settings.template_auto_reload
+# 템플릿에서 {{ static_url('app.js') }}로 핑거프린트 URL 참조
+templates.env.globals["static_url"] = static_files.url
+
+Loader = Callable[[], Awaitable[Any]]
+StateLoader = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+def _snapshot() -> Dict[str, Any]:
+    """모니터 스냅샷 (모니터 주기의 3배보다 오래되었으면 비움)"""
+    return monitor.snapshot(max_age=settings.monitor_interval * 3) or {}
+
+
+async def _load(key: str, loader: Loader) -> Dict[str, Any]:
+    """리소스 목록 조회 - Docker 미연결 / 시간 초과 / 오류 시 비움"""
+    if not container_service.is_connected:
+        return {}
+    try:
+        return {key: await asyncio.wait_for(loader(), timeout=settings.page_state_timeout)}
+    except asyncio.TimeoutError:
+        logger.info(f"Initial state '{key}' not ready in {settings.page_state_timeout}s, page will fetch it")
+    except Exception as e:
+        logger.warning(f"Initial state '{key}' failed: {e}")
+    return {}
 
-# 정적 페이지 라우트: (path, template_file)
+
+async def _dashboard_state() -> Dict[str, Any]:
+    """스냅샷이 없으면(WebSocket 클라이언트가 없어 모니터가 쉬는 중) 컨테이너 목록만 조회"""
+    return _snapshot() or await _load("containers", container_service.list_containers)
+
+
+async def _containers_state() -> Dict[str, Any]:
+    snapshot = _snapshot()
+    if snapshot:
+        return {"containers": snapshot["containers"]}
+    return await _load("containers", container_service.list_containers)
+
+
+# 정적 페이지 라우트: (path, template_file, initial_state)
 _PAGE_ROUTES = [
-    ("/", "index.html"),
-    ("/networks", "networks.html"),
-    ("/images", "images.html"),
-    ("/volumes", "volumes.html"),
-    ("/logs", "logs.html"),
-    ("/compose", "compose.html"),
-    ("/system", "system.html"),
+    ("/", "index.html", _dashboard_state),
+    ("/networks", "networks.html", lambda: _load("networks", network_service.list_networks)),
+    ("/images", "images.html", lambda: _load("images", image_service.list_images)),
+    ("/volumes", "volumes.html", lambda: _load("volumes", volume_service.list_volumes)),
+    ("/logs", "logs.html", _containers_state),
+    ("/compose", "compose.html", lambda: _load("compose", compose_service.list_projects)),
+    ("/system", "system.html", lambda: _load("system", system_service.get_system_info)),
 ]
 
 
-def _make_page_handler(template_name: str):
+def warm_templates():
+    """모든 템플릿을 미리 컴파일해 환경 캐시에 올림 (첫 요청의 컴파일 지연 제거)"""
+    names = templates.env.list_templates(filter_func=lambda name: name.endswith(".html"))
+    for name in names:
+        templates.env.get_template(name)
+    logger.info(f"Templates compiled: {len(names)}")
+
+
+def _make_page_handler(template_name: str, state: StateLoader):
     """템플릿 이름으로 페이지 핸들러를 생성하는 팩토리"""
     async def handler(request: Request):
-        return templates.TemplateResponse(template_name, {"request": request})
+        return templates.TemplateResponse(request, template_name, {"initial_state": await state()})
     handler.__name__ = f"page_{template_name.replace('.html', '')}"
     return handler
 
 
 # 정적 페이지 라우트 등록
-for path, template in _PAGE_ROUTES:
-    router.add_api_route(path, _make_page_handler(template), methods=["GET"], response_class=HTMLResponse)
+for path, template, state in _PAGE_ROUTES:
+    router.add_api_route(path, _make_page_handler(template, state), methods=["GET"], response_class=HTMLResponse)
 
 
 # Inspect 페이지는 path parameter가 있어 별도 등록
 @router.get("/inspect/{container_id}", response_class=HTMLResponse)
 async def get_inspect_page(request: Request, container_id: str):
     """컨테이너 상세 Inspect 페이지"""
-    return templates.TemplateResponse("inspect.html", {"request": request, "container_id": container_id})
+    return templates.TemplateResponse(request, "inspect.html", {"container_id": container_id, "initial_state": {}})
@@ -1,6 +1,9 @@
-from fastapi import APIRouter
+from typing import Optional
 
-from services import system_service
+from fastapi import APIRouter, Query
+
+from services import system_service, log_metrics_service
+from core import executors
 from core.schemas import success_response
 
 router = APIRouter(prefix="/api/system", tags=["system"])
@@ -11,3 +14,20 @@ async def get_system_info():
     """Docker 시스템 정보 API (디스크 사용량, 호스트 정보)"""
     data = await system_service.get_system_info()
     return success_response(data=data)
+
+
+@router.get("/executors")
+async def get_executor_metrics():
+    """lane별 Executor 풀 메트릭 API (대기열 깊이, 처리량, 대기 시간)"""
+    return success_response(data=executors.get_metrics())
+
+
+@router.get("/log-metrics")
+async def get_log_metrics(
+    minutes: int = Query(60, ge=1),
+    container: Optional[str] = None,
+):
+    """로그 패턴 카운터 API (컨테이너별/라벨별 분 단위 매칭 수)"""
+    data = log_metrics_service.history(minutes=minutes, container=container)
+    data["enabled"] = log_metrics_service.enabled
+    return success_response(data=data)
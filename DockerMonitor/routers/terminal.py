@@ -1,168 +1,212 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
 import asyncio
+import json
 import logging
-from services import exec_service
+from typing import AsyncIterator, List, Optional, Tuple, Union
+from services import container_service, exec_service, terminal_service
+from core.schemas import success_response
+from core.exceptions import TerminalSessionLimitError
 
 router = APIRouter(tags=["terminal"])
 logger = logging.getLogger(__name__)
 
 
-def extract_raw_socket(socket_response):
-    """
-    Docker socket 응답에서 실제 쓰기 가능한 소켓 객체를 추출합니다.
-    Windows와 Linux 환경 모두 지원합니다.
-    """
-    sock = socket_response
+class BatchExecRequest(BaseModel):
+    cmd: Union[str, List[str]] = Field(min_length=1)  # 문자열은 /bin/sh -c로 실행
+    ids: Optional[List[str]] = None
+    label: Optional[str] = None  # e.g. "tier=web" 또는 "tier"
+    project: Optional[str] = None  # Compose 프로젝트 이름
+    parallelism: Optional[int] = Field(default=None, ge=1, le=32)
+    timeout: Optional[float] = Field(default=None, gt=0)  # 컨테이너별 타임아웃 (초)
 
-    # 1차: SocketIO의 _sock 접근 시도
-    if hasattr(sock, '_sock'):
-        inner_sock = sock._sock
-        if hasattr(inner_sock, 'sendall'):
-            return inner_sock
-        if hasattr(inner_sock, '_sock'):
-            return inner_sock._sock
 
-    # 2차: 원본 소켓 그대로 사용 (이미 raw socket인 경우)
-    if hasattr(sock, 'sendall'):
-        return sock
+def parse_resize(text: str) -> Optional[Tuple[int, int]]:
+    """텍스트 프레임이 resize 제어 메시지이면 (rows, cols), 아니면 None
 
-    # 3차: _response 경로 시도 (일부 docker-py 버전)
-    if hasattr(sock, '_response'):
-        resp = sock._response
-        if hasattr(resp, '_fp') and hasattr(resp._fp, 'fp'):
-            fp = resp._fp.fp
-            if hasattr(fp, 'raw') and hasattr(fp.raw, '_sock'):
-                return fp.raw._sock
+    형식: {"type": "resize", "cols": 80, "rows": 24}
+    """
+    if not text.startswith("{"):
+        return None
+    try:
+        message = json.loads(text)
+        if message.get("type") != "resize":
+            return None
+        rows, cols = int(message["rows"]), int(message["cols"])
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+    if rows <= 0 or cols <= 0:
+        return None
+    return rows, cols
+
+
+def parse_control(text: str) -> Optional[dict]:
+    """텍스트 프레임이 제어 메시지(JSON 객체, type 포함)이면 dict, 아니면 None"""
+    if not text.startswith("{"):
+        return None
+    try:
+        message = json.loads(text)
+    except ValueError:
+        return None
+    return message if isinstance(message, dict) and "type" in message else None
 
-    logger.warning(f"Could not extract raw socket from {type(sock)}, using original")
-    return sock
 
+@router.get("/api/terminal/sessions")
+async def list_terminal_sessions():
+    """서버에서 유지 중인 터미널 세션 목록 API"""
+    return success_response(data=terminal_service.list())
 
-@router.websocket("/ws/exec/{container_id}")
-async def terminal_websocket(websocket: WebSocket, container_id: str):
-    await websocket.accept()
 
-    # Exec 인스턴스 생성
-    exec_id = await exec_service.create_exec_instance(container_id)
-    if not exec_id:
-        await websocket.send_text("\r\n[ERROR] Failed to create exec instance\r\n")
-        await websocket.close(code=1000, reason="Failed to create exec instance")
-        return
+@router.delete("/api/terminal/sessions/{session_id}")
+async def terminate_terminal_session(session_id: str):
+    """터미널 세션 종료 API"""
+    terminal_service.terminate(session_id)
+    return success_response(data={"session_id": session_id, "terminated": True})
 
-    # Docker socket 가져오기
-    socket_response = await exec_service.get_exec_socket(exec_id)
 
-    if not socket_response:
-        await websocket.send_text("\r\n[ERROR] Failed to get exec socket\r\n")
-        await websocket.close(code=1000, reason="Failed to get exec socket")
-        return
+async def _batch_events(req: BatchExecRequest) -> AsyncIterator[dict]:
+    targets = await container_service.resolve_targets(ids=req.ids, label=req.label, project=req.project)
+    async for event in exec_service.run_batch(targets, req.cmd, req.parallelism, req.timeout):
+        yield event
 
-    # Raw 소켓 추출
-    raw_sock = extract_raw_socket(socket_response)
-    logger.info(f"Socket type: {type(socket_response)}, Raw socket type: {type(raw_sock)}")
 
-    # 소켓을 논블로킹 모드로 설정 시도
-    try:
-        raw_sock.setblocking(False)
-    except Exception as e:
-        logger.warning(f"Could not set socket to non-blocking: {e}")
+@router.post("/api/exec/batch")
+async def batch_exec(req: BatchExecRequest):
+    """여러 컨테이너에서 같은 명령 실행 API (ids / label / project 중 하나로 대상 지정)
 
-    loop = asyncio.get_running_loop()
-    running = True
+    NDJSON으로 이벤트를 실행 중에 스트리밍한다 (start / output / exit / done).
+    """
+    async def body():
+        async for event in _batch_events(req):
+            yield json.dumps(event, ensure_ascii=False) + "\n"
 
-    async def forward_output():
-        """Docker 소켓에서 WebSocket으로 출력 전달"""
-        nonlocal running
-        try:
-            while running:
-                try:
-                    data = await loop.run_in_executor(None, lambda: raw_sock.recv(4096))
-                    if not data:
-                        logger.info("Docker socket closed (empty read)")
-                        break
-                    await websocket.send_bytes(data)
-                except BlockingIOError:
-                    await asyncio.sleep(0.01)
-                except ConnectionResetError:
-                    logger.info("Docker connection reset")
-                    break
-                except Exception as e:
-                    if running:
-                        logger.error(f"Output forwarding error: {e}")
-                    break
-        except Exception as e:
-            logger.error(f"Output task error: {e}")
-        finally:
-            running = False
+    return StreamingResponse(body(), media_type="application/x-ndjson")
 
-    async def forward_input():
-        """WebSocket에서 Docker 소켓으로 입력 전달"""
-        nonlocal running
-        try:
-            while running:
-                try:
-                    data = await websocket.receive_text()
-                    payload = data.encode('utf-8')
-                    await loop.run_in_executor(None, lambda: raw_sock.sendall(payload))
-                except WebSocketDisconnect:
-                    logger.info("WebSocket disconnected by client")
-                    break
-                except BrokenPipeError:
-                    logger.info("Docker socket pipe broken")
-                    break
-                except OSError as e:
-                    if e.errno == 10038:  # WSAENOTSOCK
-                        logger.info("Socket is no longer valid")
-                        break
-                    logger.error(f"OS error during input: {e}")
-                    break
-                except Exception as e:
-                    if running:
-                        logger.error(f"Input forwarding error: {e}")
-                    break
-        except Exception as e:
-            logger.error(f"Input task error: {e}")
-        finally:
-            running = False
 
-    try:
-        task_output = asyncio.create_task(forward_output())
-        task_input = asyncio.create_task(forward_input())
+@router.websocket("/ws/exec/batch")
+async def batch_exec_websocket(websocket: WebSocket):
+    """일괄 exec WebSocket - 첫 메시지로 요청(JSON)을 받고 이벤트를 전송한 뒤 닫음
 
-        logger.info(f"Terminal session started for container={container_id}, exec_id={exec_id}")
+    /ws/exec/{container_id}보다 먼저 선언해야 "batch"가 컨테이너 ID로 매칭되지 않는다.
+    """
+    await websocket.accept()
+    try:
+        req = BatchExecRequest.model_validate_json(await websocket.receive_text())
+    except (ValidationError, ValueError) as e:
+        await websocket.send_json({"type": "error", "error": str(e)})
+        await websocket.close()
+        return
+    except WebSocketDisconnect:
+        return
 
-        done, pending = await asyncio.wait(
-            [task_output, task_input],
-            return_when=asyncio.FIRST_COMPLETED,
-        )
+    try:
+        async for event in _batch_events(req):
+            await websocket.send_json(event)
+    except WebSocketDisconnect:
+        logger.info("Batch exec WebSocket disconnected, cancelling remaining runs")
+        return
+    except Exception as e:
+        logger.error(f"Batch exec error: {e}")
+    try:
+        await websocket.close()
+    except Exception:
+        pass
 
-        running = False
-        for task in pending:
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
 
-    except Exception as e:
-        logger.error(f"Terminal session error: {e}")
-    finally:
-        running = False
+@router.websocket("/ws/exec/{container_id}")
+async def terminal_websocket(
+    websocket: WebSocket,
+    container_id: str,
+    session: Optional[str] = None,
+    offset: Optional[int] = None,
+):
+    """컨테이너 터미널
+
+    - 서버 → 클라이언트: TTY 출력 (바이너리 프레임), 세션 이벤트 (텍스트 JSON)
+      {"type": "session", "id", "offset", "resumed"} / {"type": "exit"} / {"type": "displaced"}
+    - 클라이언트 → 서버: 키 입력 (바이너리 프레임), 제어 메시지 (텍스트 JSON)
+      {"type": "resize", "cols", "rows"} / {"type": "close"}
+      텍스트 프레임 중 제어 메시지가 아닌 것은 입력으로 처리한다 (이전 클라이언트 호환)
+
+    session/offset을 주면 기존 세션에 다시 붙어 offset(받은 바이트 수) 이후 출력만 받는다.
+    연결이 끊겨도 세션은 TERMINAL_IDLE_TIMEOUT 동안 유지되고, close 메시지를 받으면 종료된다.
+    """
+    await websocket.accept()
 
+    term = terminal_service.get(session, container_id) if session else None
+    resumed = term is not None
+    if term is None:
         try:
-            raw_sock.close()
-        except Exception:
-            pass
+            term = await terminal_service.open(container_id)
+        except TerminalSessionLimitError as e:
+            await websocket.send_text(f"\r\n[ERROR] {e.message}\r\n")
+            await websocket.close(code=1013, reason="Too many terminal sessions")
+            return
+        if term is None:
+            await websocket.send_text("\r\n[ERROR] Failed to start exec session\r\n")
+            await websocket.close(code=1000, reason="Failed to start exec session")
+            return
+
+    async def announce(start: int):
+        await websocket.send_text(json.dumps({"type": "session", "id": term.id, "offset": start, "resumed": resumed}))
 
-        if socket_response is not raw_sock:
-            try:
-                socket_response.close()
-            except Exception:
-                pass
+    try:
+        displaced = await term.attach(websocket.send_bytes, announce, offset if resumed else None)
+    except Exception as e:
+        logger.info(f"Terminal attach failed ({term.id}): {e}")
+        return
+    logger.info(
+        f"Terminal {'re' if resumed else ''}attached: container={container_id}, session={term.id}, "
+        f"event_loop_reader={term.exec.uses_event_loop}"
+    )
 
+    async def forward_input():
+        """WebSocket에서 Docker 소켓으로 입력/제어 전달"""
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            data = message.get("bytes")
+            if data is None:
+                text = message.get("text") or ""
+                control = parse_control(text)
+                if control and control["type"] == "close":
+                    term.close()
+                    return
+                size = parse_resize(text) if control else None
+                if size:
+                    await exec_service.resize(term.exec.exec_id, *size)
+                    continue
+                if control:
+                    continue
+                data = text.encode("utf-8")
+            if data:
+                await term.write(data)
+
+    input_task = asyncio.create_task(forward_input())
+    ended_task = asyncio.create_task(term.ended.wait())
+    displaced_task = asyncio.create_task(displaced.wait())
+    tasks = [input_task, ended_task, displaced_task]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        if input_task.done() and input_task.exception():
+            error = input_task.exception()
+            if not isinstance(error, (WebSocketDisconnect, ConnectionError)):
+                logger.error(f"Terminal session error: {error}")
+        if ended_task.done():
+            await websocket.send_text(json.dumps({"type": "exit"}))
+        elif displaced_task.done():
+            await websocket.send_text(json.dumps({"type": "displaced"}))
+    except Exception:
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        term.detach(displaced)
         try:
             await websocket.close()
         except Exception:
             pass
-
-        logger.info(f"Terminal session ended for container={container_id}")
+        logger.info(f"Terminal detached: container={container_id}, session={term.id}")
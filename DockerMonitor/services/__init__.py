@@ -5,6 +5,11 @@ from .volume_service import VolumeService
 from .exec_service import ExecService
 from .compose_service import ComposeService
 from .system_service import SystemService
+from .log_service import LogService
+from .log_search_service import LogSearchService
+from .log_archive_service import LogArchiveService
+from .log_metrics_service import LogMetricsService
+from .terminal_service import TerminalService
 
 # 서비스 인스턴스 (싱글톤)
 container_service = ContainerService()
@@ -12,19 +17,31 @@ image_service = ImageService()
 network_service = NetworkService()
 volume_service = VolumeService()
 exec_service = ExecService()
-compose_service = ComposeService()
+compose_service = ComposeService(container_service)
 system_service = SystemService()
+log_service = LogService()
+log_search_service = LogSearchService(log_service)
+log_archive_service = LogArchiveService(log_service)
+log_metrics_service = LogMetricsService(log_service)
+terminal_service = TerminalService(exec_service)
 
-_all_services = [container_service, image_service, network_service, volume_service, exec_service, system_service]
-# Note: compose_service는 CLI 기반이라 BaseService를 상속하지 않으므로 _all_services에 포함하지 않음
+_all_services = [container_service, image_service, network_service, volume_service, exec_service, system_service, log_service, log_search_service, log_archive_service, log_metrics_service]
+# Note: terminal_service는 exec_service를 통해 Docker에 접근하므로 _all_services에 포함하지 않음
+# Note: compose_service는 조회를 container_service에 위임하고 변경은 CLI로 수행하므로 _all_services에 포함하지 않음
 
 
 def init_services(client):
     """모든 서비스에 공유 Docker 클라이언트 주입"""
     from core.connection import get_executor
-    executor = get_executor()
+    from core import executors
     for svc in _all_services:
-        svc.set_client(client, executor)
+        svc.set_client(
+            client,
+            get_executor(executors.READ),
+            mutation_executor=get_executor(executors.MUTATION),
+            long_executor=get_executor(executors.LONG),
+            stream_executor=get_executor(executors.STREAM),
+        )
 
 
 __all__ = [
@@ -35,5 +52,10 @@ __all__ = [
     'exec_service',
     'compose_service',
     'system_service',
+    'log_service',
+    'log_search_service',
+    'log_archive_service',
+    'log_metrics_service',
+    'terminal_service',
     'init_services',
 ]
@@ -1,8 +1,13 @@
 import asyncio
 import logging
 from concurrent.futures import ThreadPoolExecutor
-from typing import Optional
-import docker
+from functools import partial
+from typing import TYPE_CHECKING, Optional, Dict, Any
+
+from core.exceptions import ExecutorSaturatedError
+
+if TYPE_CHECKING:  # docker-py는 연결 시점에 core.connection에서 로드
+    import docker
 
 logger = logging.getLogger(__name__)
 
@@ -11,16 +16,34 @@ class BaseService:
     """모든 서비스의 기본 클래스 - 외부에서 클라이언트를 주입받음"""
 
     def __init__(self):
-        self._client: Optional[docker.DockerClient] = None
+        self._client: Optional["docker.DockerClient"] = None
         self._executor: Optional[ThreadPoolExecutor] = None
+        self._mutation_executor: Optional[ThreadPoolExecutor] = None
+        self._long_executor: Optional[ThreadPoolExecutor] = None
+        self._stream_executor: Optional[ThreadPoolExecutor] = None
+        # single-flight: (함수명, 인자) → 진행 중인 Future
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+    def set_client(
+        self,
+        client: "docker.DockerClient",
+        executor: ThreadPoolExecutor,
+        mutation_executor: Optional[ThreadPoolExecutor] = None,
+        long_executor: Optional[ThreadPoolExecutor] = None,
+        stream_executor: Optional[ThreadPoolExecutor] = None,
+    ):
+        """Docker 클라이언트와 executor를 외부에서 주입
 
-    def set_client(self, client: docker.DockerClient, executor: ThreadPoolExecutor):
-        """Docker 클라이언트와 executor를 외부에서 주입"""
+        mutation/long/stream executor를 생략하면 읽기용 executor를 함께 사용한다.
+        """
         self._client = client
         self._executor = executor
+        self._mutation_executor = mutation_executor or executor
+        self._long_executor = long_executor or executor
+        self._stream_executor = stream_executor or executor
 
     @property
-    def client(self) -> docker.DockerClient:
+    def client(self) -> "docker.DockerClient":
         if not self._client:
             raise RuntimeError("Docker client not injected. Call set_client() first.")
         return self._client
@@ -31,23 +54,84 @@ class BaseService:
             raise RuntimeError("Executor not injected. Call set_client() first.")
         return self._executor
 
+    @property
+    def stream_executor(self) -> ThreadPoolExecutor:
+        """연결 수명 동안 블로킹되는 스트림(로그 follow 등) 전용 executor"""
+        if not self._stream_executor:
+            raise RuntimeError("Executor not injected. Call set_client() first.")
+        return self._stream_executor
+
     @property
     def is_connected(self) -> bool:
         return self._client is not None
 
     async def ensure_connected(self) -> bool:
-        """연결 확인 (재연결은 connection 모듈에서 처리)"""
+        """연결 확인 (재연결은 connection 모듈에서 처리)
+
+        read lane 포화는 연결 끊김이 아니므로 ExecutorSaturatedError를 그대로 전달한다 (503).
+        """
         if not self._client:
             return False
         try:
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(self.executor, self._client.ping)
+            await self.run_shared(self._client.ping)
             return True
+        except ExecutorSaturatedError:
+            raise
         except Exception:
             return False
 
     async def run_sync(self, func, *args, **kwargs):
-        """동기 함수를 비동기로 실행"""
+        """동기 함수를 비동기로 실행 (읽기 lane)"""
+        return await self._run_in(self.executor, func, *args, **kwargs)
+
+    async def run_mutation(self, func, *args, **kwargs):
+        """상태를 변경하는 동기 함수 실행 (start/stop, 삭제 등 - 변경 lane)"""
+        if not self._mutation_executor:
+            raise RuntimeError("Executor not injected. Call set_client() first.")
+        return await self._run_in(self._mutation_executor, func, *args, **kwargs)
+
+    async def run_long(self, func, *args, **kwargs):
+        """수 분까지 걸릴 수 있는 동기 함수 실행 (이미지 Pull 등 - 장기 lane)"""
+        if not self._long_executor:
+            raise RuntimeError("Executor not injected. Call set_client() first.")
+        return await self._run_in(self._long_executor, func, *args, **kwargs)
+
+    async def run_shared_or(self, default: Any, error: str, func, *args) -> Any:
+        """run_shared - 실패하면 오류를 기록하고 default 반환
+
+        read lane 포화(ExecutorSaturatedError)는 빈 결과로 숨기지 않고 그대로 전달한다 (503).
+        """
+        try:
+            return await self.run_shared(func, *args)
+        except ExecutorSaturatedError:
+            raise
+        except Exception as e:
+            logger.error(f"{error}: {e}")
+            return default
+
+    async def _run_in(self, executor: ThreadPoolExecutor, func, *args, **kwargs):
         loop = asyncio.get_running_loop()
-        from functools import partial
-        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+        return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+
+    async def run_shared(self, func, *args, **kwargs) -> Any:
+        """읽기 전용 동기 함수를 single-flight로 실행
+
+        동일한 (함수, 인자) 조합의 호출이 진행 중이면 새 호출을 만들지 않고
+        진행 중인 Future의 결과를 공유한다. 결과 객체도 공유되므로 호출자는 수정하지 말 것.
+        """
+        key = (getattr(func, "__qualname__", repr(func)), args, tuple(sorted(kwargs.items())))
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self.run_sync(func, *args, **kwargs))
+            self._inflight[key] = future
+            future.add_done_callback(lambda f: self._release_inflight(key, f))
+        # 한 호출자가 취소되어도 공유 Future는 계속 진행
+        return await asyncio.shield(future)
+
+    def _release_inflight(self, key: tuple, future: asyncio.Future):
+        """완료된 Future를 in-flight 테이블에서 제거"""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # 모든 대기자가 취소된 경우 'exception was never retrieved' 경고 방지
+        if not future.cancelled():
+            future.exception()
@@ -0,0 +1,205 @@
+"""
+Compose 파일 파싱 캐시 + 서비스 의존성 그래프
+
+Compose YAML을 경로와 mtime 기준으로 한 번만 파싱해 보관하고, inotify로 파일 변경을 감지하면
+캐시를 무효화한다 (inotify를 쓸 수 없으면 조회할 때마다 mtime만 확인).
+depends_on / networks / volumes로 서비스 그래프를 만들고, 의존성 순서에 따른 시작 단계(layer)를 계산한다.
+
+변수 치환(${VAR}), extends, include, profiles는 해석하지 않는다 - 그래프에 필요한 키만 읽는다.
+"""
+import asyncio
+import logging
+import os
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+import yaml
+
+from .log_file_backend import Inotify
+from core.config import settings
+from core.exceptions import ComposeFileError
+
+logger = logging.getLogger(__name__)
+
+
+def _names(value: Any) -> List[str]:
+    """list 또는 dict(이름 → 설정) 형식의 항목 이름 목록"""
+    if isinstance(value, dict):
+        return list(value)
+    if isinstance(value, list):
+        return [str(v) for v in value]
+    return []
+
+
+def _named_volumes(value: Any, declared: Dict[str, Any]) -> List[str]:
+    """서비스 volumes 중 이름 있는 볼륨 (바인드 마운트 제외)"""
+    names = []
+    for entry in value or []:
+        if isinstance(entry, dict):
+            source = entry.get("source") if entry.get("type", "volume") == "volume" else None
+        else:
+            parts = str(entry).split(":")
+            source = parts[0] if len(parts) > 1 else None
+        if source and (source in declared or not source.startswith((".", "/", "~", "$"))):
+            names.append(source)
+    return names
+
+
+def parse_compose(documents: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Compose 문서(여러 파일이면 순서대로 덮어씀) → 서비스 그래프 모델"""
+    raw_services: Dict[str, Dict[str, Any]] = {}
+    networks: Dict[str, Any] = {}
+    volumes: Dict[str, Any] = {}
+    for doc in documents:
+        if not isinstance(doc, dict):
+            raise ComposeFileError("Compose 파일 최상위는 매핑이어야 합니다")
+        networks.update(doc.get("networks") or {})
+        volumes.update(doc.get("volumes") or {})
+        for name, svc in (doc.get("services") or {}).items():
+            merged = raw_services.setdefault(name, {})
+            merged.update(svc or {})
+
+    services = {}
+    for name, svc in raw_services.items():
+        depends_on = svc.get("depends_on") or []
+        conditions = (
+            {dep: (cfg or {}).get("condition", "service_started") for dep, cfg in depends_on.items()}
+            if isinstance(depends_on, dict)
+            else {dep: "service_started" for dep in depends_on}
+        )
+        unknown = [dep for dep in conditions if dep not in raw_services]
+        if unknown:
+            raise ComposeFileError(f"서비스 '{name}'의 depends_on에 정의되지 않은 서비스가 있습니다: {', '.join(unknown)}")
+        services[name] = {
+            "image": svc.get("image"),
+            "build": svc.get("build") is not None,
+            "depends_on": conditions,
+            "networks": _names(svc.get("networks")) or (["default"] if svc.get("network_mode") is None else []),
+            "volumes": _named_volumes(svc.get("volumes"), volumes),
+            "healthcheck": bool(svc.get("healthcheck")) and not (svc.get("healthcheck") or {}).get("disable", False),
+        }
+    return {
+        "services": services,
+        "networks": list(networks),
+        "volumes": list(volumes),
+        "layers": dependency_layers({n: list(s["depends_on"]) for n, s in services.items()}),
+    }
+
+
+def dependency_layers(graph: Dict[str, List[str]]) -> List[List[str]]:
+    """의존성 순서 단계 - 각 단계의 서비스는 이전 단계에만 의존하므로 단계 안에서는 병렬 시작 가능"""
+    remaining = {name: set(deps) for name, deps in graph.items()}
+    layers = []
+    while remaining:
+        ready = sorted(name for name, deps in remaining.items() if not deps)
+        if not ready:
+            raise ComposeFileError(f"depends_on에 순환 의존성이 있습니다: {', '.join(sorted(remaining))}")
+        layers.append(ready)
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return layers
+
+
+def _load_sync(paths: Tuple[str, ...]) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """(스레드) 파일 읽기 + 파싱 - (모델, 경로별 mtime)"""
+    documents, mtimes = [], {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(path).st_mtime
+            with open(path, "r", encoding="utf-8") as f:
+                documents.append(yaml.safe_load(f) or {})
+        except FileNotFoundError:
+            raise ComposeFileError(f"Compose 파일을 찾을 수 없습니다: {path} (호스트 경로라면 같은 경로로 마운트해야 합니다)")
+        except yaml.YAMLError as e:
+            raise ComposeFileError(f"Compose 파일을 파싱할 수 없습니다: {path} - {e}")
+    return parse_compose(documents), mtimes
+
+
+class _Entry:
+    def __init__(self, model: Dict[str, Any], mtimes: Dict[str, float]):
+        self.model = model
+        self.mtimes = mtimes
+        self.watches: List[Inotify] = []
+
+
+class ComposeFileCache:
+    """설정 파일 경로(콤마 구분 여러 파일 가능) → 파싱된 그래프 모델 캐시
+
+    경로는 요청마다 달라질 수 있으므로 COMPOSE_FILE_CACHE_SIZE개까지만 보관하고(LRU),
+    밀려난 항목의 inotify 감시는 닫는다.
+    """
+
+    def __init__(self):
+        # 경로 튜플 → 항목 (LRU 순서)
+        self._entries: "OrderedDict[Tuple[str, ...], _Entry]" = OrderedDict()
+        self.parse_count = 0
+
+    @staticmethod
+    def _key(config_files: str) -> Tuple[str, ...]:
+        paths = tuple(p.strip() for p in config_files.split(",") if p.strip())
+        if not paths:
+            raise ComposeFileError("Compose 파일 경로가 필요합니다")
+        return paths
+
+    def _is_fresh(self, entry: _Entry) -> bool:
+        if entry.watches:
+            return True  # 변경되면 inotify 콜백이 항목을 제거함
+        return self._mtimes_match(entry.mtimes)
+
+    @staticmethod
+    def _mtimes_match(mtimes: Dict[str, float]) -> bool:
+        try:
+            return all(os.stat(p).st_mtime == m for p, m in mtimes.items())
+        except FileNotFoundError:
+            return False
+
+    async def get(self, config_files: str) -> Dict[str, Any]:
+        key = self._key(config_files)
+        entry = self._entries.get(key)
+        if entry and self._is_fresh(entry):
+            self._entries.move_to_end(key)
+            return entry.model
+        self.invalidate(key)
+        model, mtimes = await asyncio.to_thread(_load_sync, key)
+        self.parse_count += 1
+        # 파싱하는 동안 같은 경로로 들어온 다른 요청이 먼저 등록했을 수 있음
+        self.invalidate(key)
+        entry = self._entries[key] = _Entry(model, mtimes)
+        self._watch(key, entry)
+        while len(self._entries) > max(settings.compose_file_cache_size, 1):
+            self.invalidate(next(iter(self._entries)))
+        if entry.watches and not self._mtimes_match(mtimes):
+            # 파싱과 감시 등록 사이에 바뀐 경우 - 이번 결과는 반환하되 캐시에 남기지 않음
+            self.invalidate(key)
+        return model
+
+    def _watch(self, key: Tuple[str, ...], entry: _Entry):
+        loop = asyncio.get_running_loop()
+        for path in key:
+            try:
+                watch = Inotify(path)
+            except (OSError, AttributeError) as e:
+                logger.debug(f"inotify unavailable for {path}, using mtime checks: {e}")
+                self._unwatch(entry)
+                return
+            loop.add_reader(watch.fd, self.invalidate, key)
+            entry.watches.append(watch)
+
+    @staticmethod
+    def _unwatch(entry: _Entry):
+        loop = asyncio.get_running_loop()
+        for watch in entry.watches:
+            loop.remove_reader(watch.fd)
+            watch.close()
+        entry.watches = []
+
+    def invalidate(self, key: Tuple[str, ...]):
+        entry = self._entries.pop(key, None)
+        if entry:
+            self._unwatch(entry)
+
+    def clear(self):
+        for key in list(self._entries):
+            self.invalidate(key)
@@ -1,129 +1,401 @@
 """
-Docker Compose 관리 서비스 - docker compose CLI 래핑
+Docker Compose 관리 서비스
+
+프로젝트/서비스 조회는 compose가 컨테이너에 붙이는 com.docker.compose.* 라벨에서
+컨테이너 목록 조회 한 번으로 구성하고, docker compose CLI는 변경 액션(up, down 등)에만 사용한다.
+서비스 의존성 그래프는 Compose 파일을 직접 파싱해 캐시한다 (compose_file.ComposeFileCache).
 """
 import asyncio
-import json
 import logging
-from typing import List, Dict, Any, Optional
+import os
+import re
+import signal
+import time
+from collections import deque
+from typing import Callable, List, Dict, Any, Optional
+
+from core.config import settings
+from core.exceptions import ComposeFileError
+from core.jobs import Job, job_manager
+from .compose_file import ComposeFileCache
 
 logger = logging.getLogger(__name__)
 
+LABEL_PROJECT = "com.docker.compose.project"
+LABEL_SERVICE = "com.docker.compose.service"
+LABEL_CONFIG_FILES = "com.docker.compose.project.config_files"
+LABEL_ONEOFF = "com.docker.compose.oneoff"
+
+_ACTION_ARGS = {
+    "up": ["up", "-d"],
+    "down": ["down"],
+    "restart": ["restart"],
+    "pull": ["pull"],
+    "stop": ["stop"],
+    "start": ["start"],
+}
+_LINE_SPLIT_RE = re.compile(rb"\r\n|\r|\n")
+# 결과에 포함하는 마지막 출력 줄 수 (전체 출력은 Job 로그로 스트리밍)
+_OUTPUT_TAIL_LINES = 200
+# 종료 요청(SIGTERM) 후 강제 종료까지 대기 (초)
+_KILL_GRACE_SECONDS = 10
+# 롤링 재시작 중 컨테이너 상태 확인 간격 (초)
+_READY_POLL_SECONDS = 0.5
+
 
 class ComposeService:
-    """Docker Compose CLI를 통한 프로젝트 관리"""
+    """Docker Compose 프로젝트 관리 (조회: 컨테이너 라벨, 변경: CLI)"""
+
+    VALID_ACTIONS = list(_ACTION_ARGS)
+    COMMAND = ["docker", "compose"]
+
+    def __init__(self, container_service):
+        self.container_service = container_service
+        # 설정 파일 → 락 (같은 프로젝트에 대한 up/down 등이 겹치지 않도록)
+        self._project_locks: Dict[str, asyncio.Lock] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # 설정 파일 → 파싱된 서비스 그래프 (mtime/inotify로 무효화)
+        self.files = ComposeFileCache()
 
-    async def _run_command(self, *args: str, cwd: str = None) -> tuple[int, str, str]:
-        """docker compose 명령 실행"""
-        cmd = ["docker", "compose", *args]
+    def _project_lock(self, config_file: str) -> asyncio.Lock:
+        lock = self._project_locks.get(config_file)
+        if lock is None:
+            lock = self._project_locks[config_file] = asyncio.Lock()
+        return lock
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(settings.compose_max_concurrent)
+        return self._semaphore
+
+    @staticmethod
+    async def _pipe_lines(stream: asyncio.StreamReader, on_line: Callable[[str], None]):
+        """출력을 줄 단위로 전달 - 진행률 표시에 쓰이는 \r도 줄 구분으로 처리"""
+        buffer = b""
+        while True:
+            chunk = await stream.read(65536)
+            if not chunk:
+                break
+            *lines, buffer = _LINE_SPLIT_RE.split(buffer + chunk)
+            for line in lines:
+                if line:
+                    on_line(line.decode("utf-8", errors="replace"))
+        if buffer:
+            on_line(buffer.decode("utf-8", errors="replace"))
+
+    @staticmethod
+    async def _kill(proc: asyncio.subprocess.Process):
+        """자식 프로세스 그룹 종료 (SIGTERM → 유예 후 SIGKILL)"""
+        if proc.returncode is not None:
+            return
         try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=cwd,
-            )
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=120)
-            return proc.returncode, stdout.decode("utf-8", errors="replace"), stderr.decode("utf-8", errors="replace")
+            if os.name == "nt":
+                proc.terminate()
+            else:
+                os.killpg(proc.pid, signal.SIGTERM)
+            await asyncio.wait_for(proc.wait(), timeout=_KILL_GRACE_SECONDS)
+        except ProcessLookupError:
+            return
         except asyncio.TimeoutError:
-            logger.error(f"Command timed out: {' '.join(cmd)}")
-            return -1, "", "Command timed out"
-        except FileNotFoundError:
-            logger.error("docker compose CLI not found")
-            return -1, "", "docker compose CLI not found"
-        except Exception as e:
-            logger.error(f"Error running command: {e}")
-            return -1, "", str(e)
+            try:
+                if os.name == "nt":
+                    proc.kill()
+                else:
+                    os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                return
+            await proc.wait()
 
-    async def list_projects(self) -> List[Dict[str, Any]]:
-        """Compose 프로젝트 목록 반환"""
-        code, stdout, stderr = await self._run_command("ls", "--format", "json")
-        if code != 0:
-            logger.error(f"Failed to list compose projects: {stderr}")
-            return []
+    async def _stream_command(
+        self, *args: str, on_line: Callable[[str], None], cwd: str = None, timeout: float = None
+    ) -> int:
+        """docker compose 명령 실행 - stdout/stderr를 합쳐 줄마다 on_line 호출, 종료 코드 반환
 
-        try:
-            # docker compose ls --format json은 JSON 배열을 반환
-            projects = json.loads(stdout) if stdout.strip() else []
-            result = []
-            for proj in projects:
-                result.append({
-                    "name": proj.get("Name", ""),
-                    "status": proj.get("Status", ""),
-                    "config_files": proj.get("ConfigFiles", ""),
-                })
-            return result
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse compose ls output: {e}")
-            return []
-
-    async def get_project_services(self, config_file: str) -> List[Dict[str, Any]]:
-        """특정 프로젝트의 서비스 목록 반환"""
-        code, stdout, stderr = await self._run_command(
-            "-f", config_file, "ps", "--format", "json", "-a"
+        새 세션(프로세스 그룹)으로 실행해 타임아웃/취소 시 compose가 띄운 하위 프로세스까지 종료한다.
+        """
+        cmd = [*self.COMMAND, *args]
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=cwd,
+            start_new_session=os.name != "nt",
         )
-        if code != 0:
-            logger.error(f"Failed to get services: {stderr}")
-            return []
-
         try:
-            services = []
-            # docker compose ps --format json은 줄별 JSON 또는 배열을 반환
-            for line in stdout.strip().split("\n"):
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    svc = json.loads(line)
-                    # 단일 오브젝트 또는 배열
-                    if isinstance(svc, list):
-                        services.extend(svc)
-                    else:
-                        services.append(svc)
-                except json.JSONDecodeError:
-                    continue
+            await asyncio.wait_for(self._pipe_lines(proc.stdout, on_line), timeout=timeout)
+            return await proc.wait()
+        except BaseException:
+            # 타임아웃, 취소(CancelledError) 모두 프로세스 그룹을 정리한 뒤 전파
+            await asyncio.shield(self._kill(proc))
+            raise
+
+    async def _project_containers(self) -> List[Dict[str, Any]]:
+        """서비스 컨테이너 목록 (`docker compose run`으로 만든 일회성 컨테이너 제외)"""
+        return [
+            c for c in await self.container_service.list_compose_containers()
+            if (c.get("Labels") or {}).get(LABEL_ONEOFF) != "True"
+        ]
+
+    async def list_projects(self) -> List[Dict[str, Any]]:
+        """Compose 프로젝트 목록 반환 (컨테이너 라벨 기준, `docker compose ls`와 같은 형식)"""
+        projects: Dict[str, Dict[str, Any]] = {}
+        for c in await self._project_containers():
+            labels = c.get("Labels") or {}
+            proj = projects.setdefault(labels[LABEL_PROJECT], {"states": {}, "config_files": []})
+            state = c.get("State", "unknown")
+            proj["states"][state] = proj["states"].get(state, 0) + 1
+            for f in labels.get(LABEL_CONFIG_FILES, "").split(","):
+                if f and f not in proj["config_files"]:
+                    proj["config_files"].append(f)
+
+        return [
+            {
+                "name": name,
+                "status": ", ".join(f"{state}({count})" for state, count in sorted(proj["states"].items())),
+                "config_files": ",".join(proj["config_files"]),
+            }
+            for name, proj in sorted(projects.items())
+        ]
+
+    async def get_project_services(
+        self, config_file: Optional[str] = None, project: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """특정 프로젝트의 서비스(컨테이너) 목록 반환 - 프로젝트 이름 또는 설정 파일 경로로 지정"""
+        result = []
+        for c in await self._project_containers():
+            labels = c.get("Labels") or {}
+            if project and labels[LABEL_PROJECT] != project:
+                continue
+            if config_file and config_file not in labels.get(LABEL_CONFIG_FILES, "").split(","):
+                continue
+            names = c.get("Names") or []
+            result.append({
+                "name": names[0].lstrip("/") if names else labels.get(LABEL_SERVICE, ""),
+                "service": labels.get(LABEL_SERVICE, ""),
+                "state": c.get("State", ""),
+                "status": c.get("Status", ""),
+                "ports": [
+                    {
+                        "URL": p.get("IP", ""),
+                        "TargetPort": p.get("PrivatePort"),
+                        "PublishedPort": p.get("PublicPort", 0),
+                        "Protocol": p.get("Type", "tcp"),
+                    }
+                    for p in c.get("Ports") or []
+                ],
+                "image": c.get("Image", ""),
+            })
+        return sorted(result, key=lambda svc: (svc["service"], svc["name"]))
+
+    async def _resolve_config_files(self, project: str) -> str:
+        """프로젝트 이름 → 컨테이너 라벨에 기록된 설정 파일 경로 (콤마 구분)"""
+        for proj in await self.list_projects():
+            if proj["name"] == project and proj["config_files"]:
+                return proj["config_files"]
+        raise ComposeFileError(f"프로젝트의 Compose 파일 경로를 찾을 수 없습니다: {project}")
+
+    async def get_graph(self, config_file: Optional[str] = None, project: Optional[str] = None) -> Dict[str, Any]:
+        """서비스 의존성 그래프 - 노드(서비스 + 현재 컨테이너 상태), 간선(depends_on), 시작 단계
 
-            result = []
-            for svc in services:
-                result.append({
-                    "name": svc.get("Name", svc.get("Service", "")),
-                    "service": svc.get("Service", ""),
-                    "state": svc.get("State", svc.get("Status", "")),
-                    "status": svc.get("Status", ""),
-                    "ports": svc.get("Publishers") or svc.get("Ports", ""),
-                    "image": svc.get("Image", ""),
-                })
-            return result
-        except Exception as e:
-            logger.error(f"Failed to parse compose ps output: {e}")
-            return []
-
-    async def project_action(self, config_file: str, action: str) -> Dict[str, Any]:
-        """Compose 프로젝트에 액션 수행 (up, down, restart, pull)"""
-        valid_actions = ["up", "down", "restart", "pull", "stop", "start"]
-        if action not in valid_actions:
+        layers의 각 단계는 이전 단계에만 의존하므로 단계 안의 서비스는 병렬로 시작할 수 있다.
+        """
+        if not config_file:
+            if not project:
+                raise ComposeFileError("config_file 또는 project가 필요합니다")
+            config_file = await self._resolve_config_files(project)
+        model = await self.files.get(config_file)
+        containers = await self.get_project_services(config_file=config_file.split(",")[0].strip())
+
+        nodes = []
+        for name, svc in model["services"].items():
+            nodes.append({
+                "name": name,
+                "image": svc["image"],
+                "healthcheck": svc["healthcheck"],
+                "networks": svc["networks"],
+                "volumes": svc["volumes"],
+                "containers": [
+                    {"name": c["name"], "state": c["state"], "status": c["status"]}
+                    for c in containers if c["service"] == name
+                ],
+            })
+        return {
+            "config_file": config_file,
+            "services": nodes,
+            "edges": [
+                {"from": name, "to": dep, "condition": condition}
+                for name, svc in model["services"].items()
+                for dep, condition in svc["depends_on"].items()
+            ],
+            "layers": model["layers"],
+            "networks": model["networks"],
+            "volumes": model["volumes"],
+        }
+
+    async def project_action(
+        self, config_file: str, action: str, on_line: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """Compose 프로젝트에 액션 수행 (up, down, restart, pull, stop, start)
+
+        같은 프로젝트의 액션은 순서대로 실행되고(프로젝트 락), 전체 동시 실행 수는
+        COMPOSE_MAX_CONCURRENT로 제한된다. 출력은 실행 중에 줄 단위로 on_line에 전달된다.
+        """
+        if action not in self.VALID_ACTIONS:
             return {"success": False, "error": f"Invalid action: {action}"}
 
-        args = ["-f", config_file]
-        if action == "up":
-            args.extend(["up", "-d"])
-        elif action == "down":
-            args.append("down")
-        elif action == "restart":
-            args.append("restart")
-        elif action == "pull":
-            args.append("pull")
-        elif action == "stop":
-            args.append("stop")
-        elif action == "start":
-            args.append("start")
-
-        code, stdout, stderr = await self._run_command(*args)
+        args = ["-f", config_file, *_ACTION_ARGS[action]]
+        output: deque = deque(maxlen=_OUTPUT_TAIL_LINES)
+
+        def _line(line: str):
+            output.append(line)
+            if on_line:
+                on_line(line)
+
+        try:
+            async with self._project_lock(config_file), self._get_semaphore():
+                code = await self._stream_command(*args, on_line=_line, timeout=settings.compose_action_timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Compose {action} timed out: {config_file}")
+            return {"success": False, "error": "Command timed out", "output": "\n".join(output)}
+        except FileNotFoundError:
+            logger.error("docker compose CLI not found")
+            return {"success": False, "error": "docker compose CLI not found", "output": ""}
 
         if code == 0:
-            return {"success": True, "message": f"Action '{action}' completed", "output": stdout}
-        else:
-            return {"success": False, "error": stderr or "Action failed", "output": stdout}
+            return {"success": True, "message": f"Action '{action}' completed", "output": "\n".join(output)}
+        return {"success": False, "error": (output[-1] if output else "") or "Action failed", "output": "\n".join(output)}
+
+    async def _wait_ready(self, container: str, timeout: float) -> Dict[str, Any]:
+        """재시작한 컨테이너가 준비될 때까지 대기
+
+        healthcheck가 있으면 healthy, 없으면 running이 준비 상태다.
+        종료(exited/dead)되거나 unhealthy가 되면 바로 실패로 반환한다.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            state = await self.container_service.get_state(container)
+            if state["status"] in ("exited", "dead"):
+                return {"ready": False, **state, "error": f"container {state['status']} (exit code {state['exit_code']})"}
+            if state["status"] == "running":
+                if state["health"] in (None, "healthy"):
+                    return {"ready": True, **state, "error": None}
+                if state["health"] == "unhealthy":
+                    return {"ready": False, **state, "error": "healthcheck reported unhealthy"}
+            if time.monotonic() >= deadline:
+                return {"ready": False, **state, "error": f"not ready after {timeout}s"}
+            await asyncio.sleep(_READY_POLL_SECONDS)
+
+    async def _restart_service(
+        self, name: str, containers: List[str], ready_timeout: float, log: Callable[[str], None]
+    ) -> Dict[str, Any]:
+        """서비스 컨테이너를 하나씩 재시작 - 레플리카가 여럿이면 나머지는 계속 서비스 중"""
+        result = {"service": name, "status": "restarted", "downtime_ms": 0, "containers": []}
+        for container in containers:
+            started = time.monotonic()
+            log(f"[{name}] restarting {container}")
+            try:
+                if not await self.container_service.perform_action(container, "restart"):
+                    raise RuntimeError("Docker daemon is not available")
+                ready = await self._wait_ready(container, ready_timeout)
+            except Exception as e:
+                ready = {"ready": False, "status": None, "health": None, "error": getattr(e, "message", None) or str(e)}
+            downtime_ms = round((time.monotonic() - started) * 1000, 1)
+            result["containers"].append({
+                "name": container,
+                "ready": ready["ready"],
+                "health": ready["health"],
+                "downtime_ms": downtime_ms,
+                "error": ready["error"],
+            })
+            result["downtime_ms"] = max(result["downtime_ms"], downtime_ms)
+            if not ready["ready"]:
+                log(f"[{name}] {container} failed: {ready['error']}")
+                result["status"] = "failed"
+                break
+            log(f"[{name}] {container} ready ({ready['health'] or 'running'}) after {downtime_ms / 1000:.1f}s")
+        return result
 
+    async def rolling_restart(
+        self,
+        config_file: str,
+        parallelism: Optional[int] = None,
+        ready_timeout: Optional[float] = None,
+        job: Optional[Job] = None,
+    ) -> Dict[str, Any]:
+        """의존성 순서를 따르는 롤링 재시작
 
-# 싱글톤 인스턴스
-compose_service = ComposeService()
+        의존성 단계(layer)마다 서비스를 최대 parallelism개씩 병렬로 재시작하고, 각 컨테이너가
+        준비(healthy 또는 running)될 때까지 기다린 뒤 다음 단계로 넘어간다.
+        실패한 서비스가 있으면 그 단계까지만 진행하고 이후 단계는 건너뛴다 (skipped).
+        결과에는 서비스/컨테이너별 중단 시간(재시작 요청 → 준비 완료)이 담긴다.
+        """
+        parallelism = max(1, parallelism or settings.compose_rolling_parallelism)
+        ready_timeout = ready_timeout or settings.compose_rolling_ready_timeout
+        log = job.log if job else (lambda line: None)
+        started = time.monotonic()
+
+        async with self._project_lock(config_file):
+            graph = await self.get_graph(config_file=config_file)
+            containers = {node["name"]: [c["name"] for c in node["containers"]] for node in graph["services"]}
+            total = sum(len(layer) for layer in graph["layers"])
+            semaphore = asyncio.Semaphore(parallelism)
+            results: List[Dict[str, Any]] = []
+            failed = False
+
+            async def _one(name: str) -> Dict[str, Any]:
+                if not containers[name]:
+                    log(f"[{name}] no containers, skipped")
+                    return {"service": name, "status": "skipped", "downtime_ms": 0, "containers": []}
+                async with semaphore:
+                    return await self._restart_service(name, containers[name], ready_timeout, log)
+
+            for index, layer in enumerate(graph["layers"], 1):
+                if failed:
+                    results.extend({"service": name, "status": "skipped", "downtime_ms": 0, "containers": []} for name in layer)
+                    continue
+                log(f"stage {index}/{len(graph['layers'])}: {', '.join(layer)}")
+                layer_results = await asyncio.gather(*(_one(name) for name in layer))
+                results.extend(layer_results)
+                failed = any(r["status"] == "failed" for r in layer_results)
+                if job:
+                    job.set_progress(round(len(results) / total * 100, 1), message=f"stage {index} done")
+            if failed:
+                log("stopped: a service did not become ready, later stages were skipped")
+
+        counts = {status: sum(1 for r in results if r["status"] == status) for status in ("restarted", "failed", "skipped")}
+        return {
+            "config_file": config_file,
+            "layers": graph["layers"],
+            "services": results,
+            **counts,
+            "duration_ms": round((time.monotonic() - started) * 1000, 1),
+        }
+
+    def start_rolling_restart(
+        self, config_file: str, parallelism: Optional[int] = None, ready_timeout: Optional[float] = None
+    ) -> Job:
+        """롤링 재시작을 백그라운드 Job으로 시작 - 진행 상황은 Job 로그, 결과는 중단 시간 리포트"""
+        return job_manager.submit(
+            "compose_rolling_restart", config_file,
+            lambda job: self.rolling_restart(config_file, parallelism, ready_timeout, job=job),
+            key=f"compose:rolling_restart:{config_file}",
+        )
+
+    def start_action(self, config_file: str, action: str) -> Job:
+        """Compose 액션을 백그라운드 Job으로 시작 - 같은 프로젝트/액션이 진행 중이면 기존 Job 반환
+
+        출력은 Job 로그로 실행 중에 스트리밍되고, Job 취소 시 compose 프로세스 그룹이 종료된다.
+        """
+        async def _run(job: Job) -> Dict[str, Any]:
+            if self._project_lock(config_file).locked():
+                job.set_progress(message="waiting for another compose action on this project")
+            job.set_progress(message=f"docker compose {action}")
+            result = await self.project_action(config_file, action, on_line=job.log)
+            if not result["success"]:
+                raise RuntimeError(result.get("error", "Action failed"))
+            return {"message": result["message"]}
+
+        return job_manager.submit(
+            "compose_action", f"{action} {config_file}", _run,
+            key=f"compose:{action}:{config_file}",
+        )
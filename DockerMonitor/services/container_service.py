@@ -1,7 +1,11 @@
+import asyncio
+import time
 from typing import List, Dict, Any, Optional
 from .base_service import BaseService
 import logging
+from core.config import settings
 from core.exceptions import ContainerNotFoundError, InvalidActionError
+from core.jobs import Job, job_manager
 
 logger = logging.getLogger(__name__)
 
@@ -37,11 +41,17 @@ class ContainerService(BaseService):
         if not await self.ensure_connected():
             return []
         
-        try:
-            return await self.run_sync(self._list_containers_sync)
-        except Exception as e:
-            logger.error(f"Error listing containers: {e}")
+        return await self.run_shared_or([], "Error listing containers", self._list_containers_sync)
+
+    def _list_compose_containers_sync(self) -> List[Dict[str, Any]]:
+        """Compose 라벨이 있는 컨테이너 (low-level API 목록 - 컨테이너별 inspect 없음)"""
+        return self.client.api.containers(all=True, filters={"label": "com.docker.compose.project"})
+
+    async def list_compose_containers(self) -> List[Dict[str, Any]]:
+        """Compose 프로젝트 컨테이너 원본 목록 (Labels, State, Status, Ports, Image, Names)"""
+        if not await self.ensure_connected():
             return []
+        return await self.run_shared_or([], "Error listing compose containers", self._list_compose_containers_sync)
 
     def _get_container_action_sync(self, container_id: str, action: str) -> bool:
         try:
@@ -64,7 +74,147 @@ class ContainerService(BaseService):
         if not await self.ensure_connected():
             return False
             
-        return await self.run_sync(self._get_container_action_sync, container_id, action)
+        return await self.run_mutation(self._get_container_action_sync, container_id, action)
+
+    def _get_state_sync(self, container_id: str) -> Dict[str, Any]:
+        try:
+            state = self.client.api.inspect_container(container_id).get("State") or {}
+        except Exception as e:
+            if "No such container" in str(e) or "404" in str(e):
+                raise ContainerNotFoundError(container_id)
+            raise e
+        return {
+            "status": state.get("Status", ""),
+            "health": (state.get("Health") or {}).get("Status"),
+            "exit_code": state.get("ExitCode"),
+        }
+
+    async def get_state(self, container_id: str) -> Dict[str, Any]:
+        """컨테이너 실행 상태 - status(running 등), health(healthcheck 없으면 None), exit_code"""
+        return await self.run_shared(self._get_state_sync, container_id)
+
+    def start_action(self, container_id: str, action: str) -> Job:
+        """컨테이너 액션을 백그라운드 Job으로 시작"""
+        async def _run(job: Job) -> Dict[str, Any]:
+            job.set_progress(message=f"{action} {container_id}")
+            if not await self.perform_action(container_id, action):
+                raise RuntimeError("Docker daemon is not available")
+            return {"container_id": container_id, "action": action}
+
+        return job_manager.submit(
+            "container_action", f"{action} {container_id}", _run,
+            key=f"container:{action}:{container_id}",
+        )
+
+    def _resolve_targets_sync(self, label: Optional[str], project: Optional[str]) -> List[Dict[str, str]]:
+        """라벨 셀렉터 / Compose 프로젝트로 대상 컨테이너 조회"""
+        labels = []
+        if label:
+            labels.append(label)
+        if project:
+            labels.append(f"com.docker.compose.project={project}")
+        containers = self.client.containers.list(all=True, filters={"label": labels})
+        return [{"id": c.short_id, "name": c.name} for c in containers]
+
+    async def resolve_targets(
+        self,
+        ids: Optional[List[str]] = None,
+        label: Optional[str] = None,
+        project: Optional[str] = None,
+    ) -> List[Dict[str, str]]:
+        """id 목록, 라벨 셀렉터("key" 또는 "key=value"), Compose 프로젝트 중 하나로 대상 결정"""
+        if ids:
+            return [{"id": cid, "name": cid} for cid in dict.fromkeys(ids)]
+        if not label and not project:
+            return []
+        if not await self.ensure_connected():
+            return []
+        return await self.run_shared(self._resolve_targets_sync, label, project)
+
+    async def bulk_action(
+        self,
+        targets: List[Dict[str, str]],
+        action: str,
+        parallelism: Optional[int] = None,
+        timeout: Optional[float] = None,
+        job: Optional[Job] = None,
+    ) -> Dict[str, Any]:
+        """여러 컨테이너에 같은 액션을 제한된 병렬도로 수행
+
+        컨테이너별 실패/타임아웃은 해당 항목에만 기록되고 나머지 작업은 계속 진행된다.
+        타임아웃은 결과 대기만 멈출 뿐 액션을 취소하지 않는다 - Docker 호출은 변경 lane에서
+        계속 실행되어 나중에 적용될 수 있으므로 해당 항목은 timed_out(실행 중)으로 표시한다.
+        """
+        parallelism = max(1, parallelism or settings.bulk_action_parallelism)
+        timeout = timeout or settings.bulk_action_timeout
+        semaphore = asyncio.Semaphore(parallelism)
+        finished = 0
+
+        async def _one(target: Dict[str, str]) -> Dict[str, Any]:
+            nonlocal finished
+            async with semaphore:
+                started = time.monotonic()
+                result = {
+                    "id": target["id"], "name": target["name"], "success": False, "timed_out": False, "error": None,
+                }
+                task = asyncio.ensure_future(self.perform_action(target["id"], action))
+                try:
+                    # shield: 대기만 끝내고 액션은 계속 실행 (스레드의 Docker 호출은 취소할 수 없음)
+                    ok = await asyncio.wait_for(asyncio.shield(task), timeout=timeout)
+                    result["success"] = bool(ok)
+                    if not ok:
+                        result["error"] = "Docker daemon is not available"
+                except asyncio.TimeoutError:
+                    result["timed_out"] = True
+                    result["error"] = f"Timed out after {timeout}s, still running (not cancelled)"
+                    task.add_done_callback(lambda t, name=target["name"]: self._log_late_action(name, action, t))
+                except Exception as e:
+                    result["error"] = getattr(e, "message", None) or str(e)
+                result["duration_ms"] = round((time.monotonic() - started) * 1000, 1)
+
+            finished += 1
+            if job:
+                job.set_progress(
+                    round(finished / len(targets) * 100, 1),
+                    message=f"{action} {target['name']}: {'ok' if result['success'] else result['error']}",
+                )
+            return result
+
+        results = await asyncio.gather(*(_one(t) for t in targets))
+        succeeded = sum(1 for r in results if r["success"])
+        timed_out = sum(1 for r in results if r["timed_out"])
+        return {
+            "action": action,
+            "total": len(results),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded - timed_out,
+            "timed_out": timed_out,
+            "results": results,
+        }
+
+    @staticmethod
+    def _log_late_action(name: str, action: str, task: asyncio.Future):
+        """타임아웃으로 결과 대기를 멈춘 액션이 나중에 끝났을 때 결과 기록"""
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error:
+            logger.warning(f"Bulk {action} on {name} failed after timeout: {error}")
+        else:
+            logger.info(f"Bulk {action} on {name} finished after timeout (success={bool(task.result())})")
+
+    def start_bulk_action(
+        self,
+        targets: List[Dict[str, str]],
+        action: str,
+        parallelism: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Job:
+        """일괄 액션을 백그라운드 Job으로 시작"""
+        return job_manager.submit(
+            "container_bulk_action", f"{action} {len(targets)} containers",
+            lambda job: self.bulk_action(targets, action, parallelism, timeout, job=job),
+        )
 
     def _update_container_resources_sync(self, container_id: str, cpu_quota: int, memory_limit: str) -> bool:
         try:
@@ -90,22 +240,7 @@ class ContainerService(BaseService):
         if not await self.ensure_connected():
             return False
             
-        return await self.run_sync(self._update_container_resources_sync, container_id, cpu_quota, memory_limit)
-
-    def _get_logs_sync(self, container_id: str, tail: int) -> str:
-        try:
-            container = self.client.containers.get(container_id)
-            return container.logs(tail=tail).decode('utf-8')
-        except Exception as e:
-            if "No such container" in str(e):
-                raise ContainerNotFoundError(container_id)
-            raise e
-
-    async def get_logs(self, container_id: str, tail: int = 100) -> str:
-        if not await self.ensure_connected():
-            return ""
-        
-        return await self.run_sync(self._get_logs_sync, container_id, tail)
+        return await self.run_mutation(self._update_container_resources_sync, container_id, cpu_quota, memory_limit)
 
     def _get_single_container_stats_sync(self, container_id: str) -> Dict[str, Any]:
         """단일 컨테이너 통계 수집"""
@@ -160,21 +295,15 @@ class ContainerService(BaseService):
         if not await self.ensure_connected():
             return []
         
-        try:
-            return await self.run_sync(self._get_stats_sync)
-        except Exception as e:
-            logger.error(f"Error getting stats: {e}")
-            return []
+        return await self.run_shared_or([], "Error getting stats", self._get_stats_sync)
 
     async def get_container_stats(self, container_id: str) -> Dict[str, Any]:
         if not await self.ensure_connected():
             return {}
             
-        try:
-            return await self.run_sync(self._get_single_container_stats_sync, container_id)
-        except Exception as e:
-            logger.error(f"Error getting stats for {container_id}: {e}")
-            return {}
+        return await self.run_shared_or(
+            {}, f"Error getting stats for {container_id}", self._get_single_container_stats_sync, container_id
+        )
 
     def _inspect_container_sync(self, container_id: str) -> Dict[str, Any]:
         """컨테이너 상세 정보 조회"""
@@ -254,4 +383,4 @@ class ContainerService(BaseService):
         """컨테이너 상세 Inspect"""
         if not await self.ensure_connected():
             return {}
-        return await self.run_sync(self._inspect_container_sync, container_id)
+        return await self.run_shared(self._inspect_container_sync, container_id)
@@ -1,17 +1,249 @@
-from typing import Optional, Any
+from typing import Optional, Any, AsyncIterator, Dict, List, Union
 from .base_service import BaseService
+import asyncio
+import codecs
+import concurrent.futures
 import logging
+import socket
+import ssl
+import threading
+import time
+from core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# 한 번의 recv로 읽는 최대 바이트
+_RECV_SIZE = 65536
+# 일괄 exec 이벤트 대기열 크기 - 소비자가 느리면 출력 읽기 스레드가 대기
+_BATCH_QUEUE_SIZE = 256
+_STREAM_NAMES = {1: "stdout", 2: "stderr"}
+
+
+def extract_raw_socket(socket_response):
+    """
+    Docker socket 응답에서 실제 쓰기 가능한 소켓 객체를 추출합니다.
+    Windows와 Linux 환경 모두 지원합니다.
+    """
+    sock = socket_response
+
+    # 1차: SocketIO의 _sock 접근 시도
+    if hasattr(sock, '_sock'):
+        inner_sock = sock._sock
+        if hasattr(inner_sock, 'sendall'):
+            return inner_sock
+        if hasattr(inner_sock, '_sock'):
+            return inner_sock._sock
+
+    # 2차: 원본 소켓 그대로 사용 (이미 raw socket인 경우)
+    if hasattr(sock, 'sendall'):
+        return sock
+
+    # 3차: _response 경로 시도 (일부 docker-py 버전)
+    if hasattr(sock, '_response'):
+        resp = sock._response
+        if hasattr(resp, '_fp') and hasattr(resp._fp, 'fp'):
+            fp = resp._fp.fp
+            if hasattr(fp, 'raw') and hasattr(fp.raw, '_sock'):
+                return fp.raw._sock
+
+    logger.warning(f"Could not extract raw socket from {type(sock)}, using original")
+    return sock
+
+
+class ExecSession:
+    """exec TTY 소켓의 비동기 읽기/쓰기 래퍼
+
+    소켓 fd를 이벤트 루프에 등록(add_reader)해 읽을 데이터가 있을 때만 recv하므로
+    유휴 터미널은 스레드도 CPU도 쓰지 않는다.
+    fd를 등록할 수 없는 소켓(Windows named pipe, TLS 소켓 등)은 블로킹 recv를
+    stream executor 스레드 하나에서 수행한다 (폴링 없음).
+
+    출력은 버퍼에 모아 flush 창(TERMINAL_FLUSH_MS) 또는 TERMINAL_FLUSH_BYTES 단위로 내보내
+    잘게 쪼개진 recv가 각각 WebSocket 프레임이 되지 않게 한다.
+    소비자(브라우저)가 느려 버퍼가 TERMINAL_MAX_BUFFER_BYTES를 넘으면 소켓 읽기를 멈추고,
+    절반 아래로 비워지면 다시 읽는다 - 그 사이 컨테이너 프로세스는 TTY 쓰기에서 대기한다.
+    """
+
+    def __init__(self, exec_id: str, socket_response: Any, executor=None):
+        self.exec_id = exec_id
+        self.socket_response = socket_response
+        self.sock = extract_raw_socket(socket_response)
+        self._executor = executor
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._buffer = bytearray()
+        self._data_ready = asyncio.Event()
+        self._eof = False
+        self._paused = False
+        self._reader_registered = False
+        self._reader_task: Optional[asyncio.Future] = None
+        # 스레드 읽기 모드의 읽기 재개 신호
+        self._thread_resume = threading.Event()
+        self._thread_resume.set()
+        self._closed = False
+
+    @property
+    def uses_event_loop(self) -> bool:
+        return self._loop is not None and self._reader_task is None
+
+    @property
+    def paused(self) -> bool:
+        return self._paused
+
+    def start(self):
+        self._loop = asyncio.get_running_loop()
+        if isinstance(self.sock, socket.socket) and not isinstance(self.sock, ssl.SSLSocket):
+            try:
+                self.sock.setblocking(False)
+                self._add_reader()
+                return
+            except (NotImplementedError, OSError, ValueError) as e:
+                logger.info(f"Event loop reader unavailable for exec socket, using thread: {e}")
+        try:
+            self.sock.setblocking(True)
+        except Exception:
+            pass
+        self._reader_task = self._loop.run_in_executor(self._executor, self._read_blocking)
+
+    # ---- 읽기 ----
+
+    def _add_reader(self):
+        self._loop.add_reader(self.sock.fileno(), self._on_readable)
+        self._reader_registered = True
+
+    def _on_readable(self):
+        """(이벤트 루프) 읽을 수 있는 만큼 읽어 버퍼에 넣음"""
+        while not self._paused:
+            try:
+                data = self.sock.recv(_RECV_SIZE)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                if not self._closed:
+                    logger.info(f"Exec socket read error: {e}")
+                data = b""
+            self._feed(data)
+            if not data:
+                return
+
+    def _read_blocking(self):
+        """(스레드) 블로킹 recv 루프 - fd 등록이 불가능한 소켓용"""
+        while not self._closed:
+            self._thread_resume.wait()
+            if self._closed:
+                return
+            try:
+                data = self.sock.recv(_RECV_SIZE)
+            except OSError:
+                data = b""
+            try:
+                self._loop.call_soon_threadsafe(self._feed, data)
+            except RuntimeError:
+                return  # 이벤트 루프 종료
+            if not data:
+                return
+
+    def _feed(self, data: bytes):
+        """(이벤트 루프) 읽은 데이터 적재 - 빈 값은 EOF"""
+        if not data:
+            self._eof = True
+            self._remove_reader()
+        else:
+            self._buffer += data
+            if len(self._buffer) >= settings.terminal_max_buffer_bytes:
+                self._pause()
+        self._data_ready.set()
+
+    def _pause(self):
+        if self._paused:
+            return
+        self._paused = True
+        if self._reader_task is None:
+            self._remove_reader()
+        else:
+            self._thread_resume.clear()
+
+    def _resume(self):
+        if not self._paused or self._eof or self._closed:
+            return
+        self._paused = False
+        if self._reader_task is None:
+            self._add_reader()
+        else:
+            self._thread_resume.set()
+
+    async def read(self) -> Optional[bytes]:
+        """다음 출력 묶음 - 소켓이 닫히고 버퍼가 비면 None
+
+        첫 데이터가 도착한 뒤 flush 창 동안(또는 TERMINAL_FLUSH_BYTES가 찰 때까지) 더 모아서 반환한다.
+        """
+        while not self._buffer:
+            if self._eof:
+                return None
+            self._data_ready.clear()
+            await self._data_ready.wait()
+
+        limit = settings.terminal_flush_bytes
+        window = settings.terminal_flush_ms / 1000
+        if window > 0 and len(self._buffer) < limit and not self._eof:
+            deadline = self._loop.time() + window
+            while len(self._buffer) < limit and not self._eof and not self._paused:
+                remaining = deadline - self._loop.time()
+                if remaining <= 0:
+                    break
+                self._data_ready.clear()
+                try:
+                    await asyncio.wait_for(self._data_ready.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+
+        chunk = bytes(self._buffer[:limit])
+        del self._buffer[:limit]
+        if self._paused and len(self._buffer) <= settings.terminal_max_buffer_bytes // 2:
+            self._resume()
+        return chunk
+
+    # ---- 쓰기 ----
+
+    async def write(self, data: bytes):
+        if self._reader_task is None:
+            await self._loop.sock_sendall(self.sock, data)
+        else:
+            await self._loop.run_in_executor(self._executor, self.sock.sendall, data)
+
+    # ---- 종료 ----
+
+    def _remove_reader(self):
+        if self._reader_registered:
+            self._reader_registered = False
+            try:
+                self._loop.remove_reader(self.sock.fileno())
+            except Exception:
+                pass
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._eof = True
+        self._buffer.clear()
+        self._remove_reader()
+        self._thread_resume.set()
+        self._data_ready.set()
+        for sock in (self.sock, self.socket_response):
+            try:
+                sock.close()
+            except Exception:
+                pass
+
+
 class ExecService(BaseService):
     def _create_exec_instance_sync(self, container_id: str) -> Optional[str]:
         try:
             container = self.client.containers.get(container_id)
             exec_instance = container.client.api.exec_create(
-                container.id, 
+                container.id,
                 cmd="/bin/sh",  # 기본 쉘
-                stdin=True, 
+                stdin=True,
                 tty=True
             )
             return exec_instance['Id']
@@ -22,9 +254,9 @@ class ExecService(BaseService):
     async def create_exec_instance(self, container_id: str) -> Optional[str]:
         if not await self.ensure_connected():
             return None
-            
+
         try:
-            return await self.run_sync(self._create_exec_instance_sync, container_id)
+            return await self.run_mutation(self._create_exec_instance_sync, container_id)
         except Exception:
             return None
 
@@ -40,8 +272,160 @@ class ExecService(BaseService):
     async def get_exec_socket(self, exec_id: str) -> Any:
         if not await self.ensure_connected():
             return None
-            
+
         try:
-            return await self.run_sync(self._get_exec_socket_sync, exec_id)
+            return await self.run_mutation(self._get_exec_socket_sync, exec_id)
         except Exception:
             return None
+
+    async def open_session(self, container_id: str) -> Optional[ExecSession]:
+        """exec 생성 + 시작 후 비동기 세션 반환 - 실패 시 None"""
+        exec_id = await self.create_exec_instance(container_id)
+        if not exec_id:
+            return None
+        socket_response = await self.get_exec_socket(exec_id)
+        if not socket_response:
+            return None
+        session = ExecSession(exec_id, socket_response, executor=self.stream_executor)
+        session.start()
+        return session
+
+    def _resize_sync(self, exec_id: str, rows: int, cols: int):
+        self.client.api.exec_resize(exec_id, height=rows, width=cols)
+
+    async def resize(self, exec_id: str, rows: int, cols: int) -> bool:
+        """exec TTY 크기 변경"""
+        try:
+            await self.run_mutation(self._resize_sync, exec_id, rows, cols)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to resize exec {exec_id}: {e}")
+            return False
+
+    # ---- 일괄 exec (비대화형) ----
+
+    def _create_batch_exec_sync(self, container_id: str, cmd: List[str]) -> str:
+        return self.client.api.exec_create(container_id, cmd=cmd, stdout=True, stderr=True, tty=False)["Id"]
+
+    def _exec_exit_code_sync(self, exec_id: str) -> Optional[int]:
+        return self.client.api.exec_inspect(exec_id).get("ExitCode")
+
+    def _pump_batch_exec_sync(self, sock: Any, emit, stop: threading.Event):
+        """(stream 스레드) 다중화된 exec 출력 프레임을 읽어 emit(stream, bytes) 호출"""
+        from docker.utils.socket import frames_iter
+
+        try:
+            for stream_id, data in frames_iter(sock, tty=False):
+                if stop.is_set():
+                    return
+                emit(_STREAM_NAMES.get(stream_id, "stdout"), data)
+        except (OSError, ValueError):
+            if not stop.is_set():
+                raise
+
+    async def _run_batch_one(self, target: Dict[str, str], cmd: List[str], queue: asyncio.Queue) -> Optional[int]:
+        """컨테이너 하나에서 명령 실행 - 출력은 output 이벤트로 queue에 넣고 종료 코드 반환"""
+        loop = asyncio.get_running_loop()
+        exec_id = await self.run_mutation(self._create_batch_exec_sync, target["id"], cmd)
+        sock = await self.run_mutation(self.client.api.exec_start, exec_id, socket=True)
+        raw_sock = extract_raw_socket(sock)
+        stop = threading.Event()
+        decoders = {}
+        sent = 0
+        limit = settings.batch_exec_max_output_bytes
+
+        def _put(event: Dict[str, Any]):
+            future = asyncio.run_coroutine_threadsafe(queue.put(event), loop)
+            while True:
+                try:
+                    future.result(timeout=1)
+                    return
+                except concurrent.futures.TimeoutError:
+                    if stop.is_set():
+                        future.cancel()
+                        raise OSError("batch exec cancelled")
+
+        def emit(stream: str, data: bytes):
+            nonlocal sent
+            if sent >= limit:
+                return  # 한도 이후 출력은 버리되 프로세스가 끝날 때까지 계속 읽음
+            data = data[:limit - sent]
+            sent += len(data)
+            decoder = decoders.get(stream)
+            if decoder is None:
+                decoder = decoders[stream] = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            text = decoder.decode(data)
+            if text:
+                _put({"type": "output", "id": target["id"], "name": target["name"], "stream": stream, "data": text})
+            if sent >= limit:
+                _put({"type": "output", "id": target["id"], "name": target["name"], "stream": "stderr",
+                      "data": f"\n[output truncated at {limit} bytes]\n"})
+
+        try:
+            await loop.run_in_executor(self.stream_executor, self._pump_batch_exec_sync, raw_sock, emit, stop)
+        finally:
+            stop.set()
+            for s in (raw_sock, sock):
+                try:
+                    s.close()
+                except Exception:
+                    pass
+        for stream, decoder in decoders.items():
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                await queue.put({"type": "output", "id": target["id"], "name": target["name"], "stream": stream, "data": tail})
+        return await self.run_sync(self._exec_exit_code_sync, exec_id)
+
+    async def run_batch(
+        self,
+        targets: List[Dict[str, str]],
+        cmd: Union[str, List[str]],
+        parallelism: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """여러 컨테이너에서 같은 명령을 제한된 병렬도로 실행하며 이벤트를 순서대로 내보냄
+
+        이벤트: start / output(stream, data) / exit(exit_code, error, duration_ms) / done(요약)
+        문자열 명령은 /bin/sh -c로 실행한다. 타임아웃이 지나면 출력 읽기를 중단하고 실패로 기록하며
+        (Docker API로는 exec 프로세스를 종료할 수 없어 컨테이너 안의 프로세스는 계속 실행될 수 있음),
+        소비자가 중간에 끊으면 남은 실행을 취소한다.
+        """
+        command = ["/bin/sh", "-c", cmd] if isinstance(cmd, str) else list(cmd)
+        parallelism = max(1, parallelism or settings.batch_exec_parallelism)
+        timeout = timeout or settings.batch_exec_timeout
+        semaphore = asyncio.Semaphore(parallelism)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_BATCH_QUEUE_SIZE)
+
+        async def _one(target: Dict[str, str]) -> bool:
+            async with semaphore:
+                await queue.put({"type": "start", "id": target["id"], "name": target["name"]})
+                started = time.monotonic()
+                event = {"type": "exit", "id": target["id"], "name": target["name"], "exit_code": None, "error": None}
+                try:
+                    if not await self.ensure_connected():
+                        raise RuntimeError("Docker daemon is not available")
+                    event["exit_code"] = await asyncio.wait_for(self._run_batch_one(target, command, queue), timeout)
+                except asyncio.TimeoutError:
+                    event["error"] = f"Timed out after {timeout}s"
+                except Exception as e:
+                    event["error"] = getattr(e, "explanation", None) or getattr(e, "message", None) or str(e)
+                event["duration_ms"] = round((time.monotonic() - started) * 1000, 1)
+                await queue.put(event)
+                return event["error"] is None and event["exit_code"] == 0
+
+        async def _all():
+            results = await asyncio.gather(*(_one(t) for t in targets))
+            succeeded = sum(results)
+            await queue.put({"type": "done", "total": len(results), "succeeded": succeeded, "failed": len(results) - succeeded})
+            await queue.put(None)
+
+        runner = asyncio.create_task(_all())
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    break
+                yield event
+        finally:
+            runner.cancel()
+            await asyncio.gather(runner, return_exceptions=True)
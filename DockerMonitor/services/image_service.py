@@ -1,11 +1,18 @@
-from typing import List, Dict, Any
+import asyncio
+from typing import List, Dict, Any, Optional
 from .base_service import BaseService
 import logging
+from core.config import settings
 from core.exceptions import ImageNotFoundError
+from core.jobs import Job, job_manager
 
 logger = logging.getLogger(__name__)
 
 class ImageService(BaseService):
+    def __init__(self):
+        super().__init__()
+        self._pull_semaphore: Optional[asyncio.Semaphore] = None
+
     def _list_images_sync(self) -> List[Dict[str, Any]]:
         """동기 이미지 목록 조회"""
         images = []
@@ -37,11 +44,7 @@ class ImageService(BaseService):
         if not await self.ensure_connected():
             return []
         
-        try:
-            return await self.run_sync(self._list_images_sync)
-        except Exception as e:
-            logger.error(f"Error listing images: {e}")
-            return []
+        return await self.run_shared_or([], "Error listing images", self._list_images_sync)
 
     def _remove_image_sync(self, image_id: str, force: bool) -> bool:
         try:
@@ -57,18 +60,23 @@ class ImageService(BaseService):
             return False
         
         try:
-            return await self.run_sync(self._remove_image_sync, image_id, force)
+            return await self.run_mutation(self._remove_image_sync, image_id, force)
         except ImageNotFoundError:
             raise
         except Exception as e:
             logger.error(f"Error removing image {image_id}: {e}")
             raise e
 
-    def _pull_image_sync(self, repository: str, tag: str) -> Dict[str, Any]:
-        """이미지 Pull"""
+    def _pull_image_sync(self, repository: str, tag: str, on_event=None) -> Dict[str, Any]:
+        """이미지 Pull - 레이어 진행 이벤트를 on_event 콜백으로 스트리밍"""
         try:
             logger.info(f"Pulling image {repository}:{tag}...")
-            image = self.client.images.pull(repository, tag=tag)
+            for event in self.client.api.pull(repository, tag=tag, stream=True, decode=True):
+                if "error" in event:
+                    raise RuntimeError(event["error"])
+                if on_event:
+                    on_event(event)
+            image = self.client.images.get(f"{repository}:{tag}")
             return {
                 "id": image.short_id,
                 "tags": image.tags,
@@ -78,8 +86,62 @@ class ImageService(BaseService):
             logger.error(f"Error pulling image {repository}:{tag}: {e}")
             raise e
 
+    def _get_pull_semaphore(self) -> asyncio.Semaphore:
+        if self._pull_semaphore is None:
+            self._pull_semaphore = asyncio.Semaphore(settings.max_concurrent_pulls)
+        return self._pull_semaphore
+
+    @staticmethod
+    def _apply_pull_event(job: Job, event: Dict[str, Any]):
+        """docker pull 스트림 이벤트를 레이어 상태에 반영하고 구독자에게 전달"""
+        layers = job.detail.setdefault("layers", {})
+        layer_id = event.get("id")
+        detail = event.get("progressDetail") or {}
+        if layer_id and "status" in event:
+            layer = layers.setdefault(layer_id, {"status": "", "current": 0, "total": 0})
+            layer["status"] = event["status"]
+            if detail.get("total"):
+                layer["current"] = detail.get("current", 0)
+                layer["total"] = detail["total"]
+            elif event["status"] in ("Download complete", "Pull complete", "Already exists"):
+                layer["current"] = layer["total"]
+
+        total = sum(l["total"] for l in layers.values())
+        current = sum(min(l["current"], l["total"]) for l in layers.values())
+        job.set_progress(
+            round(current / total * 100, 1) if total else 0.0,
+            message=event.get("status", ""),
+            layer=layer_id,
+            current=detail.get("current"),
+            total=detail.get("total"),
+        )
+
+    async def _run_pull(self, job: Job, repository: str, tag: str) -> Dict[str, Any]:
+        """Pull Job 본문 - 동시 Pull 수는 세마포어로 제한"""
+        loop = asyncio.get_running_loop()
+
+        def on_event(event: Dict[str, Any]):
+            # executor 스레드 → 이벤트 루프로 전달
+            loop.call_soon_threadsafe(self._apply_pull_event, job, event)
+
+        async with self._get_pull_semaphore():
+            return await self.run_long(self._pull_image_sync, repository, tag, on_event)
+
+    def start_pull(self, repository: str, tag: str = "latest") -> Job:
+        """백그라운드 Pull Job 시작 - 같은 repo:tag가 진행 중이면 기존 Job에 합류"""
+        image = f"{repository}:{tag}"
+        return job_manager.submit(
+            "image_pull", image,
+            lambda job: self._run_pull(job, repository, tag),
+            key=f"image_pull:{image}",
+        )
+
     async def pull_image(self, repository: str, tag: str = "latest") -> Dict[str, Any]:
-        """이미지 Pull (비동기)"""
+        """이미지 Pull (완료까지 대기) - 진행 중인 동일 Pull이 있으면 결과 공유"""
         if not await self.ensure_connected():
             return {}
-        return await self.run_sync(self._pull_image_sync, repository, tag)
+        job = self.start_pull(repository, tag)
+        await asyncio.shield(job.task)
+        if job.error:
+            raise RuntimeError(job.error)
+        return job.result
@@ -0,0 +1,303 @@
+"""
+로그 아카이브 서비스 - 선택한 컨테이너 로그를 압축된 시간 파티션 세그먼트 파일로 보관
+
+Docker json-file 드라이버가 로테이션으로 지우는 로그를 디스크에 남긴다.
+
+    {LOG_ARCHIVE_DIR}/{컨테이너 이름}/{YYYYMMDDHH}.jsonl.gz   (UTC 1시간 단위 세그먼트)
+    {LOG_ARCHIVE_DIR}/{컨테이너 이름}/{YYYYMMDDHH}.idx        (블록 인덱스)
+
+세그먼트는 블록(여러 줄의 JSON Lines)마다 독립된 gzip 멤버로 이어 붙이므로 파일 전체가 그대로
+유효한 gzip이고(zcat 가능), 인덱스의 "첫 시각 마지막 시각 오프셋 길이 줄수"로
+시간 범위에 걸친 블록만 골라 압축을 푼다.
+"""
+import asyncio
+import datetime
+import gzip
+import json
+import logging
+import os
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .log_service import LogCollector, LogService, LogRecord, record_epoch
+from core.config import settings
+from core.exceptions import ArchiveSegmentNotFoundError, LogArchiveError
+
+logger = logging.getLogger(__name__)
+
+# 블록 하나에 모으는 최대 줄 수 (넘으면 즉시 기록)
+_BLOCK_LINES = 2000
+_SEGMENT_RE = re.compile(r"^\d{10}$")
+_SEGMENT_SUFFIX = ".jsonl.gz"
+_INDEX_SUFFIX = ".idx"
+
+# (첫 시각, 마지막 시각, 오프셋, 길이, 줄 수)
+IndexEntry = Tuple[float, float, int, int, int]
+
+
+def segment_key(epoch: float) -> str:
+    """epoch 초 → 세그먼트 이름 (UTC 시 단위)"""
+    return datetime.datetime.fromtimestamp(epoch, datetime.timezone.utc).strftime("%Y%m%d%H")
+
+
+def segment_start(key: str) -> float:
+    return datetime.datetime.strptime(key, "%Y%m%d%H").replace(tzinfo=datetime.timezone.utc).timestamp()
+
+
+def _safe_name(name: str) -> str:
+    """컨테이너 이름 → 디렉터리 이름 ("."/".."처럼 점으로만 된 이름은 거부)"""
+    safe = re.sub(r"[^0-9A-Za-z_.-]", "_", name.lstrip("/")) or "_"
+    if not safe.strip("."):
+        raise LogArchiveError(f"잘못된 컨테이너 이름입니다: {name}")
+    return safe
+
+
+def _read_index(path: str) -> List[IndexEntry]:
+    entries = []
+    try:
+        with open(path, "r") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 5:
+                    entries.append((float(parts[0]), float(parts[1]), int(parts[2]), int(parts[3]), int(parts[4])))
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def _segment_keys(directory: str) -> List[str]:
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+    return sorted(n[:-len(_SEGMENT_SUFFIX)] for n in names if n.endswith(_SEGMENT_SUFFIX))
+
+
+def _write_blocks(directory: str, batch: List[Tuple[float, LogRecord]]):
+    """(스레드) 줄 묶음을 세그먼트별 블록으로 압축해 추가하고 인덱스 기록"""
+    os.makedirs(directory, exist_ok=True)
+    groups: Dict[str, List[Tuple[float, LogRecord]]] = {}
+    for epoch, record in batch:
+        groups.setdefault(segment_key(epoch), []).append((epoch, record))
+
+    for key, items in groups.items():
+        payload = "".join(json.dumps(r, ensure_ascii=False) + "\n" for _, r in items).encode("utf-8")
+        block = gzip.compress(payload, compresslevel=6)
+        base = os.path.join(directory, key)
+        with open(base + _SEGMENT_SUFFIX, "ab") as f:
+            offset = f.tell()
+            f.write(block)
+        epochs = [e for e, _ in items]
+        with open(base + _INDEX_SUFFIX, "a") as f:
+            f.write(f"{min(epochs):.6f} {max(epochs):.6f} {offset} {len(block)} {len(items)}\n")
+
+
+def _last_epoch_sync(directory: str) -> Optional[float]:
+    """가장 최근 세그먼트 인덱스의 마지막 시각"""
+    for key in reversed(_segment_keys(directory)):
+        entries = _read_index(os.path.join(directory, key + _INDEX_SUFFIX))
+        if entries:
+            return max(e[1] for e in entries)
+    return None
+
+
+def _read_range_sync(
+    directory: str, start: Optional[float], end: Optional[float], limit: int
+) -> Tuple[List[LogRecord], bool]:
+    """(스레드) 시간 범위의 줄 (오래된 순) - 범위에 걸친 블록만 압축 해제"""
+    results: List[LogRecord] = []
+    for key in _segment_keys(directory):
+        seg_start = segment_start(key)
+        if (end is not None and seg_start > end) or (start is not None and seg_start + 3600 <= start):
+            continue
+        base = os.path.join(directory, key)
+        blocks = [
+            b for b in _read_index(base + _INDEX_SUFFIX)
+            if (start is None or b[1] >= start) and (end is None or b[0] <= end)
+        ]
+        if not blocks:
+            continue
+        with open(base + _SEGMENT_SUFFIX, "rb") as f:
+            for _, _, offset, length, _ in blocks:
+                f.seek(offset)
+                for raw in gzip.decompress(f.read(length)).splitlines():
+                    record = json.loads(raw)
+                    epoch = record_epoch(record)
+                    if (start is not None and epoch < start) or (end is not None and epoch > end):
+                        continue
+                    if len(results) == limit:
+                        return results, True
+                    results.append(record)
+    return results, False
+
+
+def _list_segments_sync(directory: str) -> List[Dict[str, Any]]:
+    segments = []
+    for key in _segment_keys(directory):
+        base = os.path.join(directory, key)
+        entries = _read_index(base + _INDEX_SUFFIX)
+        segments.append({
+            "segment": key,
+            "start": min((e[0] for e in entries), default=None),
+            "end": max((e[1] for e in entries), default=None),
+            "lines": sum(e[4] for e in entries),
+            "blocks": len(entries),
+            "size": os.path.getsize(base + _SEGMENT_SUFFIX),
+        })
+    return segments
+
+
+def _prune_sync(root: str, retention_days: int) -> int:
+    """보존 기간이 지난 세그먼트 삭제 - 삭제한 세그먼트 수"""
+    if retention_days <= 0 or not os.path.isdir(root):
+        return 0
+    cutoff = time.time() - retention_days * 86400
+    removed = 0
+    for container in os.listdir(root):
+        directory = os.path.join(root, container)
+        for key in _segment_keys(directory):
+            if segment_start(key) + 3600 < cutoff:
+                for suffix in (_SEGMENT_SUFFIX, _INDEX_SUFFIX):
+                    try:
+                        os.remove(os.path.join(directory, key + suffix))
+                    except FileNotFoundError:
+                        pass
+                removed += 1
+    return removed
+
+
+class _ArchiveWriter:
+    """컨테이너 하나의 대기 중인 줄 - 블록 크기나 flush 주기에 맞춰 기록"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.pending: List[Tuple[float, LogRecord]] = []
+        self.lock = asyncio.Lock()
+
+    async def flush(self):
+        async with self.lock:
+            if not self.pending:
+                return
+            batch, self.pending = self.pending, []
+            await asyncio.to_thread(_write_blocks, self.directory, batch)
+
+
+class LogArchiveService(LogCollector):
+    """선택한 컨테이너 로그 디스크 아카이브 서비스
+
+    LOG_ARCHIVE_DIR이 설정된 경우에만 동작한다. 수집 대상은 LOG_ARCHIVE_CONTAINERS와
+    API로 추가한 항목이며, 처음 수집하는 컨테이너는 데몬에 남아 있는 로그 전체부터 보관한다.
+    파일 I/O는 Docker lane을 차지하지 않도록 기본 스레드 풀에서 실행한다.
+    """
+
+    def __init__(self, log_service: LogService):
+        super().__init__(log_service, selectors=settings.log_archive_containers, backfill_lines="all")
+        # 디렉터리 이름(컨테이너 이름) → writer - 같은 이름으로 재생성된 컨테이너는 이어서 기록
+        self._writers: Dict[str, _ArchiveWriter] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(settings.log_archive_dir)
+
+    @property
+    def root(self) -> str:
+        if not self.enabled:
+            raise LogArchiveError("로그 아카이브가 비활성화되어 있습니다 (LOG_ARCHIVE_DIR 미설정)")
+        return settings.log_archive_dir
+
+    def _contained(self, path: str) -> bool:
+        """경로가 아카이브 루트 안에 있는지 (심볼릭 링크 해석 후)"""
+        return os.path.realpath(path).startswith(os.path.realpath(self.root) + os.sep)
+
+    def _directory(self, name: str) -> str:
+        path = os.path.join(self.root, _safe_name(name))
+        if not self._contained(path):
+            raise LogArchiveError(f"잘못된 컨테이너 이름입니다: {name}")
+        return path
+
+    async def start(self):
+        await super().start()
+        if self.enabled and self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        await super().stop()
+        if self._flush_task:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        # 남은 줄 기록
+        await asyncio.gather(*(w.flush() for w in self._writers.values()), return_exceptions=True)
+
+    def add_selector(self, selector: str):
+        if not self.enabled:
+            raise LogArchiveError("로그 아카이브가 비활성화되어 있습니다 (LOG_ARCHIVE_DIR 미설정)")
+        super().add_selector(selector)
+
+    async def _flush_loop(self):
+        last_prune = 0.0
+        while True:
+            await asyncio.sleep(settings.log_archive_flush_seconds)
+            for writer in list(self._writers.values()):
+                try:
+                    await writer.flush()
+                except Exception as e:
+                    logger.warning(f"Log archive flush failed ({writer.directory}): {e}")
+            if time.monotonic() - last_prune > 3600:
+                last_prune = time.monotonic()
+                removed = await asyncio.to_thread(_prune_sync, self.root, settings.log_archive_retention_days)
+                if removed:
+                    logger.info(f"Pruned {removed} log archive segments")
+
+    def _writer(self, name: str) -> _ArchiveWriter:
+        key = _safe_name(name)
+        writer = self._writers.get(key)
+        if writer is None:
+            writer = self._writers[key] = _ArchiveWriter(self._directory(name))
+        return writer
+
+    async def _resume_epoch(self, container_id: str, name: str) -> Optional[float]:
+        writer = self._writers.get(_safe_name(name))
+        if writer and writer.pending:
+            return writer.pending[-1][0]
+        return await asyncio.to_thread(_last_epoch_sync, self._directory(name))
+
+    async def _collect(self, container_id: str, name: str, records: List[LogRecord]):
+        writer = self._writer(name)
+        now = time.time()
+        writer.pending.extend((record_epoch(r) or now, r) for r in records)
+        if len(writer.pending) >= _BLOCK_LINES:
+            await writer.flush()
+
+    # ---- 조회 ----
+
+    async def list_containers(self) -> List[str]:
+        root = self.root
+        return sorted(await asyncio.to_thread(
+            lambda: [d for d in os.listdir(root) if os.path.isdir(os.path.join(root, d))]
+            if os.path.isdir(root) else []
+        ))
+
+    async def list_segments(self, name: str) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(_list_segments_sync, self._directory(name))
+
+    async def read_range(
+        self, name: str, start: Optional[float] = None, end: Optional[float] = None, limit: int = 5000
+    ) -> Dict[str, Any]:
+        """아카이브에서 시간 범위의 로그 조회 (대기 중인 최근 줄은 flush 후 반영)"""
+        writer = self._writers.get(_safe_name(name))
+        if writer:
+            await writer.flush()
+        lines, truncated = await asyncio.to_thread(_read_range_sync, self._directory(name), start, end, limit)
+        return {"container": name, "lines": lines, "truncated": truncated}
+
+    def segment_path(self, name: str, segment: str) -> str:
+        """다운로드할 세그먼트 파일 경로 (이름 검증으로 경로 탈출 방지)"""
+        if not _SEGMENT_RE.match(segment):
+            raise ArchiveSegmentNotFoundError(name, segment)
+        path = os.path.join(self._directory(name), segment + _SEGMENT_SUFFIX)
+        if not self._contained(path) or not os.path.isfile(path):
+            raise ArchiveSegmentNotFoundError(name, segment)
+        return path
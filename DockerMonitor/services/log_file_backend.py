@@ -0,0 +1,345 @@
+"""
+json-file 로그 직접 읽기 백엔드 - Docker 호스트에서 실행될 때 데몬 logs API 대신 로그 파일을 읽음
+
+/var/lib/docker/containers를 읽기 전용으로 마운트하고 DOCKER_CONTAINERS_DIR을 지정하면
+<id>/<id>-json.log를 mmap으로 읽고, 희소 시각→오프셋 인덱스로 since/until 위치를 찾는다.
+follow는 inotify(사용 불가 시 폴링)로 파일 변경을 감지한다.
+파일에 접근할 수 없으면 None을 반환해 호출자가 API로 대체한다.
+
+현재 파일(<id>-json.log)만 읽으며 로테이션된 이전 파일(.1, .2 ...)은 포함하지 않는다.
+"""
+import asyncio
+import bisect
+import ctypes
+import ctypes.util
+import json
+import logging
+import mmap
+import os
+import threading
+from typing import List, Optional, Tuple, Union
+
+from .log_service import LogRecord, parse_docker_timestamp
+
+logger = logging.getLogger(__name__)
+
+# 인덱스 간격 (바이트) - 이 간격마다 줄 시작 오프셋과 시각을 기록
+INDEX_STRIDE = 256 * 1024
+# inotify가 없을 때 / 이벤트 누락 대비 파일 확인 주기 (초)
+_POLL_INTERVAL = 1.0
+_FOLLOW_QUEUE_SIZE = 64
+
+_IN_MODIFY = 0x00000002
+_IN_MOVE_SELF = 0x00000800
+_IN_DELETE_SELF = 0x00000400
+_TIME_KEY = b'"time":'
+
+
+def line_epoch(line: bytes) -> Optional[float]:
+    """json-file 한 줄에서 time 필드만 잘라 epoch 초로 (전체 JSON 파싱 없이)"""
+    i = line.rfind(_TIME_KEY)
+    if i < 0:
+        return None
+    start = line.find(b'"', i + len(_TIME_KEY)) + 1
+    end = line.find(b'"', start)
+    return parse_docker_timestamp(line[start:end].decode("ascii", errors="replace")) if end > 0 else None
+
+
+class JsonLogFile:
+    """컨테이너 하나의 <id>-json.log 리더
+
+    파일은 추가만 되므로 인덱스는 새로 늘어난 부분만 이어서 만든다.
+    파일이 교체(로테이션)되거나 줄어들면 인덱스를 처음부터 다시 만든다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._inode: Optional[int] = None
+        # (epoch, 줄 시작 오프셋) - 오프셋 오름차순
+        self._index: List[Tuple[float, int]] = []
+        self._indexed_to = 0
+
+    def _open(self) -> Tuple[Optional[mmap.mmap], int, int]:
+        """(mmap, 크기, inode) - 빈 파일이면 mmap은 None"""
+        with open(self.path, "rb") as f:
+            st = os.fstat(f.fileno())
+            if st.st_size == 0:
+                return None, 0, st.st_ino
+            return mmap.mmap(f.fileno(), st.st_size, access=mmap.ACCESS_READ), st.st_size, st.st_ino
+
+    def _update_index(self, mm: mmap.mmap, size: int, inode: int):
+        if inode != self._inode or size < self._indexed_to:
+            self._inode = inode
+            self._index = []
+            self._indexed_to = 0
+        pos = self._indexed_to
+        while pos < size:
+            mark = self._index[-1][1] + INDEX_STRIDE if self._index else 0
+            if pos < mark:
+                # 다음 인덱스 지점까지 건너뛰고 그 다음 줄 시작에서 재개
+                nl = mm.find(b"\n", mark - 1, size)
+                if nl < 0:
+                    break
+                pos = nl + 1
+                continue
+            end = mm.find(b"\n", pos, size)
+            if end < 0:
+                break
+            epoch = line_epoch(mm[pos:end])
+            if epoch is not None:
+                self._index.append((epoch, pos))
+            pos = end + 1
+        self._indexed_to = pos
+
+    def _seek_time(self, mm: mmap.mmap, size: int, epoch: float) -> int:
+        """epoch 이상인 첫 줄의 오프셋 (인덱스로 근처까지 이동한 뒤 줄 단위로 확인)"""
+        i = bisect.bisect_left(self._index, (epoch, -1)) - 1
+        pos = self._index[i][1] if i >= 0 else 0
+        while pos < size:
+            end = mm.find(b"\n", pos, size)
+            if end < 0:
+                return size
+            line_time = line_epoch(mm[pos:end])
+            if line_time is not None and line_time >= epoch:
+                return pos
+            pos = end + 1
+        return size
+
+    @staticmethod
+    def _ends_line(raw: bytes) -> bool:
+        """json-file 항목이 줄의 끝인지 (16KB로 나뉜 긴 로그의 앞부분이면 False)"""
+        try:
+            return json.loads(raw).get("log", "").endswith("\n")
+        except ValueError:
+            return True
+
+    @classmethod
+    def _line_start(cls, mm: mmap.mmap, pos: int) -> int:
+        """pos가 partial 묶음 중간이면 묶음 첫 항목의 오프셋"""
+        while pos > 0:
+            prev = mm.rfind(b"\n", 0, pos - 1) + 1
+            if cls._ends_line(mm[prev:pos - 1]):
+                break
+            pos = prev
+        return pos
+
+    @classmethod
+    def _tail_offset(cls, mm: mmap.mmap, start: int, end: int, lines: int) -> int:
+        """end 이전 마지막 lines줄의 시작 오프셋 - partial로 나뉜 줄은 첫 항목부터 포함"""
+        pos = end  # 항목 경계
+        count = 0
+        while pos > start:
+            prev = max(mm.rfind(b"\n", start, pos - 1) + 1, start)
+            if cls._ends_line(mm[prev:pos - 1]):
+                if count == lines:
+                    return pos
+                count += 1
+            pos = prev
+        return start
+
+    @staticmethod
+    def _parse(mm: mmap.mmap, start: int, end: int) -> Tuple[List[Tuple[float, LogRecord]], int]:
+        """start~end 구간의 레코드와 다음에 읽을 오프셋
+
+        16KB 단위로 나뉜 긴 로그(partial)는 한 줄로 합친다. 구간이 partial 묶음 중간에서 끝나면
+        다음 오프셋은 그 묶음의 첫 항목이므로, 다음 읽기에서 묶음 전체를 다시 합친다.
+        """
+        records = []
+        partial = ""
+        partial_start: Optional[int] = None
+        pos = start
+        while pos < end:
+            nl = mm.find(b"\n", pos, end)
+            if nl < 0:
+                break  # 아직 쓰는 중인 줄
+            line_start, pos = pos, nl + 1
+            try:
+                entry = json.loads(mm[line_start:nl])
+            except ValueError:
+                continue
+            text = partial + entry.get("log", "")
+            if not text.endswith("\n"):
+                if partial_start is None:
+                    partial_start = line_start
+                partial = text
+                continue
+            partial, partial_start = "", None
+            ts = entry.get("time")
+            records.append(((parse_docker_timestamp(ts) or 0.0), {
+                "ts": ts,
+                "stream": entry.get("stream", "stdout"),
+                "line": text[:-1].rstrip("\r"),
+            }))
+        return records, pos if partial_start is None else partial_start
+
+    def read(
+        self,
+        tail: Union[int, str] = "all",
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> Tuple[List[LogRecord], int]:
+        """tail/since/until 조건의 레코드와 읽은 끝 오프셋 (follow 시작 위치)"""
+        with self._lock:
+            mm, size, inode = self._open()
+            if mm is None:
+                self._inode = inode
+                return [], 0
+            try:
+                self._update_index(mm, size, inode)
+                end = mm.rfind(b"\n", 0, size) + 1
+                if until is not None:
+                    end = min(end, self._seek_time(mm, end, until + 1e-6))
+                start = self._line_start(mm, self._seek_time(mm, end, since)) if since is not None else 0
+                if tail != "all":
+                    if not tail:
+                        return [], self._tail_offset(mm, start, end, 0)
+                    start = max(start, self._tail_offset(mm, start, end, tail))
+                parsed, resume = self._parse(mm, start, end)
+                records = [
+                    r for epoch, r in parsed
+                    if (since is None or epoch >= since) and (until is None or epoch <= until)
+                ]
+                # until로 잘린 경우가 아니면 끝나지 않은 partial 묶음부터 follow
+                return records, resume if until is None else end
+            finally:
+                mm.close()
+
+    def read_from(self, offset: int) -> Tuple[List[LogRecord], int, bool]:
+        """offset 이후 새로 추가된 완성 줄 - (레코드, 새 오프셋, 파일 교체 여부)"""
+        with self._lock:
+            mm, size, inode = self._open()
+            if self._inode is None:
+                self._inode = inode
+            rotated = inode != self._inode
+            if rotated or size < offset:
+                self._inode = inode
+                self._index = []
+                self._indexed_to = 0
+                offset = 0
+                rotated = True
+            if mm is None:
+                return [], offset, rotated
+            try:
+                end = mm.rfind(b"\n", offset, size) + 1
+                if end <= offset:
+                    return [], offset, rotated
+                parsed, resume = self._parse(mm, offset, end)
+                return [r for _, r in parsed], resume, rotated
+            finally:
+                mm.close()
+
+
+class Inotify:
+    """파일 하나의 inotify 감시 (libc 직접 호출) - 사용할 수 없으면 생성 시 OSError"""
+
+    _libc = None
+
+    def __init__(self, path: str):
+        if Inotify._libc is None:
+            Inotify._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc = Inotify._libc
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = _IN_MODIFY | _IN_MOVE_SELF | _IN_DELETE_SELF
+        if libc.inotify_add_watch(self.fd, path.encode(), mask) < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+
+    def drain(self):
+        try:
+            while os.read(self.fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self):
+        os.close(self.fd)
+
+
+class FileLogFollower:
+    """json-file 로그 follow - LogFollower와 같은 인터페이스 (queue / start / close)
+
+    초기 tail(또는 since 이후) 줄을 보낸 뒤 파일이 늘어날 때마다 새 줄만 queue에 넣는다.
+    inotify fd를 이벤트 루프에 등록하므로 감시 중에는 스레드를 점유하지 않는다.
+    컨테이너가 삭제되어 파일이 사라지면 None을 넣는다.
+    """
+
+    def __init__(
+        self,
+        log_file: JsonLogFile,
+        tail: Union[int, str] = 100,
+        since: Optional[float] = None,
+        streams: tuple = ("stdout", "stderr"),
+    ):
+        self.log_file = log_file
+        self.tail = tail
+        self.since = since
+        self.streams = streams
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=_FOLLOW_QUEUE_SIZE)
+        self._offset = 0
+        self._task: Optional[asyncio.Task] = None
+        self._inotify: Optional[Inotify] = None
+        self._wakeup = asyncio.Event()
+        self._closed = False
+
+    async def start(self):
+        records, self._offset = await asyncio.to_thread(self.log_file.read, self.tail, self.since, None)
+        self._watch()
+        self._task = asyncio.create_task(self._run(records))
+
+    def _watch(self):
+        self._unwatch()
+        try:
+            self._inotify = Inotify(self.log_file.path)
+        except (OSError, AttributeError) as e:
+            logger.debug(f"inotify unavailable, polling {self.log_file.path}: {e}")
+            return
+        asyncio.get_running_loop().add_reader(self._inotify.fd, self._wakeup.set)
+
+    def _unwatch(self):
+        if self._inotify:
+            asyncio.get_running_loop().remove_reader(self._inotify.fd)
+            self._inotify.close()
+            self._inotify = None
+
+    async def _emit(self, records: List[LogRecord]):
+        records = [r for r in records if r["stream"] in self.streams]
+        if records:
+            await self.queue.put(records)
+
+    async def _run(self, initial: List[LogRecord]):
+        try:
+            await self._emit(initial)
+            while not self._closed:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=_POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                if self._inotify:
+                    self._inotify.drain()
+                try:
+                    records, self._offset, rotated = await asyncio.to_thread(self.log_file.read_from, self._offset)
+                except FileNotFoundError:
+                    break
+                if rotated:
+                    # 로테이션으로 새 파일이 생김 - 새 파일을 다시 감시
+                    self._watch()
+                await self._emit(records)
+        except Exception as e:
+            logger.warning(f"File log follow error ({self.log_file.path}): {e}")
+        finally:
+            self._unwatch()
+            if not self._closed:
+                await self.queue.put(None)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._task:
+            self._task.cancel()
+        while not self.queue.empty():
+            self.queue.get_nowait()
@@ -0,0 +1,142 @@
+"""
+로그 패턴 카운터 서비스 - follow 중인 로그에서 패턴("ERROR", "Traceback", 정규식) 매칭 수를
+컨테이너별/분 단위로 집계 (별도 로그 스택 없이 에러 급증 확인)
+
+패턴은 LOG_PATTERNS에 {"라벨": "정규식"} JSON으로 정의한다.
+모든 패턴을 이름 있는 그룹의 alternation 하나로 합쳐 줄마다 한 번만 검사한다.
+합칠 수 없는 패턴(번호 역참조, 패턴 간 그룹 이름 중복)은 따로 검사한다.
+"""
+import logging
+import re
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional
+
+from .log_service import LogCollector, LogService, LogRecord, record_epoch
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 번호 역참조(\1)나 이름 역참조((?P=name))는 감싸는 그룹이 추가되면 의미가 바뀌므로 합치지 않음
+_BACKREF_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+class PatternMatcher:
+    """여러 패턴을 하나의 정규식으로 합친 매처
+
+    줄 하나에 대해 매칭된 라벨 집합을 반환한다 (라벨당 줄마다 최대 1회).
+    alternation 특성상 같은 위치에서 겹치는 매치는 앞쪽 패턴만 잡힌다.
+    합친 정규식을 컴파일할 수 없으면 경고 후 모든 패턴을 하나씩 search한다.
+    """
+
+    def __init__(self, patterns: Dict[str, str]):
+        self.labels = list(patterns)
+        combined = [label for label in self.labels if not _BACKREF_RE.search(patterns[label])]
+        self._groups = {f"p{i}": label for i, label in enumerate(combined)}
+        self._regex = None
+        if combined:
+            try:
+                self._regex = re.compile("|".join(f"(?P<{g}>{patterns[label]})" for g, label in self._groups.items()))
+            except re.error as e:
+                logger.warning(f"Log patterns cannot be combined ({e}), matching them one by one")
+                combined, self._groups = [], {}
+        self._separate = [(label, re.compile(patterns[label])) for label in self.labels if label not in combined]
+
+    def match(self, line: str) -> set:
+        labels = set()
+        if self._regex is not None and self._regex.search(line):
+            labels = {self._groups[m.lastgroup] for m in self._regex.finditer(line)}
+        for label, regex in self._separate:
+            if regex.search(line):
+                labels.add(label)
+        return labels
+
+
+class LogMetricsService(LogCollector):
+    """로그 패턴 카운터 수집 서비스
+
+    LOG_PATTERNS가 정의된 경우에만 동작하며, 수집 대상은 LOG_PATTERN_CONTAINERS(기본 없음)이다.
+    카운트는 줄의 타임스탬프 기준 분 단위 버킷에 쌓이고 LOG_METRICS_HISTORY_MINUTES만큼 보관된다.
+    """
+
+    def __init__(self, log_service: LogService):
+        super().__init__(log_service, selectors=settings.log_pattern_containers, backfill_lines=0)
+        self.matcher = self._build_matcher(settings.log_patterns)
+        # 컨테이너 이름 → {분(epoch) → Counter(라벨 → 수)}
+        self._counts: Dict[str, "OrderedDict[int, Counter]"] = {}
+        self._last_epoch: Dict[str, float] = {}
+
+    @staticmethod
+    def _build_matcher(patterns: Dict[str, str]) -> PatternMatcher:
+        valid = {}
+        for label, pattern in patterns.items():
+            try:
+                re.compile(pattern)
+                valid[label] = pattern
+            except re.error as e:
+                logger.error(f"Invalid log pattern '{label}': {e}")
+        return PatternMatcher(valid)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.matcher.labels)
+
+    async def _resume_epoch(self, container_id: str, name: str) -> Optional[float]:
+        return self._last_epoch.get(container_id)
+
+    async def _collect(self, container_id: str, name: str, records: List[LogRecord]):
+        buckets = self._counts.setdefault(name, OrderedDict())
+        now = time.time()
+        for record in records:
+            labels = self.matcher.match(record["line"])
+            epoch = record_epoch(record) or now
+            if epoch > self._last_epoch.get(container_id, 0):
+                self._last_epoch[container_id] = epoch
+            if not labels:
+                continue
+            minute = int(epoch // 60 * 60)
+            bucket = buckets.get(minute)
+            if bucket is None:
+                bucket = buckets[minute] = Counter()
+            bucket.update(labels)
+        self._prune(now)
+
+    def _prune(self, now: float):
+        """보관 기간이 지난 버킷 삭제 - 버킷이 남지 않은 컨테이너(삭제/이름 변경 포함)는 항목째 제거"""
+        cutoff = now - settings.log_metrics_history_minutes * 60
+        for name in list(self._counts):
+            buckets = self._counts[name]
+            for minute in [m for m in buckets if m < cutoff]:
+                del buckets[minute]
+            if not buckets:
+                del self._counts[name]
+        # 수집 중이 아니고 남은 카운트도 없는 컨테이너는 재개 시각도 필요 없음
+        active = {cid for cid, task in self._ingesters.items() if not task.done()}
+        for cid in [c for c in self._last_epoch if c not in active and self._names.get(c) not in self._counts]:
+            del self._last_epoch[cid]
+            self._names.pop(cid, None)
+
+    def history(self, minutes: Optional[int] = None, container: Optional[str] = None) -> Dict[str, Any]:
+        """분 단위 카운트 이력 - 최근 minutes분 (0 채움)
+
+        반환: {"labels", "minutes": [epoch...], "containers": {이름: {라벨: [count...]}}, "totals": {라벨: [count...]}}
+        """
+        minutes = min(minutes or settings.log_metrics_history_minutes, settings.log_metrics_history_minutes)
+        now = time.time()
+        # 더 이상 수집되지 않는 컨테이너는 _collect가 호출되지 않으므로 조회 시에도 정리
+        self._prune(now)
+        current = int(now // 60 * 60)
+        axis = [current - 60 * i for i in range(minutes - 1, -1, -1)]
+        labels = self.matcher.labels
+        series: Dict[str, Dict[str, List[int]]] = {}
+        totals = {label: [0] * len(axis) for label in labels}
+        for name, buckets in self._counts.items():
+            if container and name != container:
+                continue
+            data = {label: [buckets.get(m, {}).get(label, 0) for m in axis] for label in labels}
+            if not any(any(v) for v in data.values()):
+                continue
+            series[name] = data
+            for label in labels:
+                totals[label] = [a + b for a, b in zip(totals[label], data[label])]
+        return {"labels": labels, "minutes": axis, "containers": series, "totals": totals}
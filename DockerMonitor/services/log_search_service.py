@@ -0,0 +1,285 @@
+"""
+로그 검색 서비스 - 선택한 컨테이너의 로그를 메모리 역색인으로 수집해 컨테이너 전체를 검색
+
+토큰 검색은 역색인(토큰 → 줄 번호)으로 응답하고,
+정규식 검색은 보관 중인 줄을 프로세스 풀에서 스캔해 이벤트 루프를 막지 않는다.
+시간 초과된 스캔은 워커 프로세스를 종료해 끊는다 (다음 검색은 새 풀 사용).
+"""
+import asyncio
+import logging
+import multiprocessing
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .log_service import LogCollector, LogService, LogRecord, record_epoch
+from core.config import settings
+from core.exceptions import InvalidSearchQueryError, LogSearchTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# 정규식 스캔 시 프로세스 하나에 보내는 줄 수
+_SCAN_CHUNK_LINES = 20000
+
+_TOKEN_RE = re.compile(r"[0-9A-Za-z_]{2,}")
+
+
+def tokenize(text: str) -> Set[str]:
+    """검색 토큰 추출 - 2자 이상 영숫자/밑줄, 소문자"""
+    return {t.lower() for t in _TOKEN_RE.findall(text)}
+
+
+def _regex_scan(pattern: str, flags: int, lines: List[str]) -> List[int]:
+    """(프로세스 풀) 정규식에 매칭되는 줄의 인덱스 목록"""
+    regex = re.compile(pattern, flags)
+    return [i for i, line in enumerate(lines) if regex.search(line)]
+
+
+class LogIndex:
+    """로그 줄 저장소 + 역색인
+
+    줄마다 증가하는 번호(doc id)를 붙여 저장하고, 토큰별로 doc id 목록(postings)을 유지한다.
+    오래된 줄부터 제거하므로 postings도 항상 앞쪽부터 정리된다.
+    """
+
+    def __init__(self):
+        # (doc_id, container_id, epoch, record) - doc_id 오름차순
+        self._entries: List[Tuple[int, str, float, LogRecord]] = []
+        self._head = 0  # 제거된 앞쪽 항목 수 (주기적으로 압축)
+        self._next_id = 0
+        self._postings: Dict[str, deque] = {}
+        self.names: Dict[str, str] = {}
+        # 컨테이너별 마지막 수집 시각 - 수집 재개 시 since로 사용
+        self.last_epoch: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries) - self._head
+
+    @property
+    def token_count(self) -> int:
+        return len(self._postings)
+
+    def add(self, container_id: str, name: str, records: List[LogRecord]):
+        self.names[container_id] = name
+        for record in records:
+            epoch = record_epoch(record) or time.time()
+            doc_id = self._next_id
+            self._next_id += 1
+            self._entries.append((doc_id, container_id, epoch, record))
+            for token in tokenize(record["line"]):
+                postings = self._postings.get(token)
+                if postings is None:
+                    postings = self._postings[token] = deque()
+                postings.append(doc_id)
+            if epoch > self.last_epoch.get(container_id, 0):
+                self.last_epoch[container_id] = epoch
+        self.evict()
+
+    def evict(self, now: Optional[float] = None):
+        """보존 한도(줄 수, 기간)를 넘는 오래된 줄 제거"""
+        cutoff = (now or time.time()) - settings.log_index_retention_seconds
+        while len(self) > 0:
+            doc_id, _, epoch, record = self._entries[self._head]
+            if len(self) <= settings.log_index_max_lines and epoch >= cutoff:
+                break
+            for token in tokenize(record["line"]):
+                postings = self._postings.get(token)
+                if postings and postings[0] == doc_id:
+                    postings.popleft()
+                    if not postings:
+                        del self._postings[token]
+            self._head += 1
+        if self._head > 1024 and self._head * 2 > len(self._entries):
+            self._entries = self._entries[self._head:]
+            self._head = 0
+
+    def _get(self, doc_id: int) -> Tuple[int, str, float, LogRecord]:
+        base = self._entries[self._head][0]
+        return self._entries[self._head + doc_id - base]
+
+    def search(
+        self,
+        tokens: Set[str],
+        containers: Optional[Set[str]] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        limit: int = 200,
+    ) -> Tuple[List[Tuple[int, str, float, LogRecord]], bool]:
+        """모든 토큰을 포함하는 줄 (최신 순) - (결과, 잘림 여부)
+
+        가장 짧은 postings를 최신부터 훑으며 나머지 토큰은 줄을 다시 토큰화해 확인한다.
+        """
+        postings = [self._postings.get(t) for t in tokens]
+        if not postings or any(p is None for p in postings):
+            return [], False
+        shortest = min(postings, key=len)
+        results = []
+        for doc_id in reversed(shortest):
+            entry = self._get(doc_id)
+            _, container_id, epoch, record = entry
+            if containers is not None and container_id not in containers:
+                continue
+            if (start is not None and epoch < start) or (end is not None and epoch > end):
+                continue
+            if len(tokens) > 1 and not tokens <= tokenize(record["line"]):
+                continue
+            if len(results) == limit:
+                return results, True
+            results.append(entry)
+        return results, False
+
+    def select(
+        self,
+        containers: Optional[Set[str]] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> List[Tuple[int, str, float, LogRecord]]:
+        """필터에 맞는 보관 줄 전체 (오래된 순) - 정규식 스캔 입력"""
+        return [
+            e for e in self._entries[self._head:]
+            if (containers is None or e[1] in containers)
+            and (start is None or e[2] >= start)
+            and (end is None or e[2] <= end)
+        ]
+
+
+class LogSearchService(LogCollector):
+    """선택한 컨테이너 로그 수집 + 전체 검색 서비스
+
+    수집 대상은 LOG_INDEX_CONTAINERS 설정(이름/ID 콤마 구분, "*"는 실행 중인 전체)과
+    API로 추가한 항목이다. 컨테이너가 중지되면 수집이 끝나고, 다시 실행되면 이어서 수집한다.
+    """
+
+    def __init__(self, log_service: LogService):
+        super().__init__(
+            log_service,
+            selectors=settings.log_index_containers,
+            backfill_lines=settings.log_index_backfill_lines,
+        )
+        self.index = LogIndex()
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    async def stop(self):
+        await super().stop()
+        if self._pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def _collect(self, container_id: str, name: str, records: List[LogRecord]):
+        self.index.add(container_id, name, records)
+
+    async def _resume_epoch(self, container_id: str, name: str) -> Optional[float]:
+        return self.index.last_epoch.get(container_id)
+
+    def status(self) -> Dict[str, Any]:
+        """수집 상태 (대상, 수집 중인 컨테이너, 보관 줄/토큰 수)"""
+        return {
+            "selectors": self.selectors,
+            "ingesting": self.ingesting(),
+            "lines": len(self.index),
+            "tokens": self.index.token_count,
+            "max_lines": settings.log_index_max_lines,
+            "retention_seconds": settings.log_index_retention_seconds,
+        }
+
+    # ---- 검색 ----
+
+    def _resolve_containers(self, containers: Optional[List[str]]) -> Optional[Set[str]]:
+        """이름/ID(접두사) 필터를 수집된 컨테이너 ID 집합으로 변환"""
+        if not containers:
+            return None
+        return {
+            cid for cid, name in self.index.names.items()
+            if any(c == name or cid.startswith(c) for c in containers)
+        }
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # fork는 실행 중인 스레드(executor)의 락 상태를 복제하므로 spawn 사용
+            self._pool = ProcessPoolExecutor(
+                max_workers=settings.log_search_processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    def _recycle_pool(self, pool: ProcessPoolExecutor):
+        """워커 프로세스를 종료하고 풀 폐기 - 역행(backtracking) 중인 스캔은 대기 취소만으로 멈추지 않음"""
+        if self._pool is pool:
+            self._pool = None
+        if hasattr(pool, "terminate_workers"):  # Python 3.14+
+            pool.terminate_workers()
+            return
+        for process in list((pool._processes or {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _regex_search(self, pattern: str, entries: List[tuple]) -> List[tuple]:
+        try:
+            re.compile(pattern, re.IGNORECASE)
+        except re.error as e:
+            raise InvalidSearchQueryError(f"정규식 오류: {e}")
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        chunks = [entries[i:i + _SCAN_CHUNK_LINES] for i in range(0, len(entries), _SCAN_CHUNK_LINES)]
+        futures = [
+            loop.run_in_executor(pool, _regex_scan, pattern, re.IGNORECASE, [e[3]["line"] for e in chunk])
+            for chunk in chunks
+        ]
+        try:
+            results = await asyncio.wait_for(asyncio.gather(*futures), timeout=settings.log_search_regex_timeout)
+        except asyncio.TimeoutError:
+            self._recycle_pool(pool)
+            logger.warning(f"Regex search timed out after {settings.log_search_regex_timeout}s, workers recycled: {pattern!r}")
+            raise LogSearchTimeoutError(
+                f"정규식 검색 시간({settings.log_search_regex_timeout}초)이 초과되어 중단했습니다"
+            )
+        except BrokenProcessPool:
+            # 동시에 실행 중이던 다른 검색의 시간 초과로 워커가 종료됨
+            raise LogSearchTimeoutError("다른 정규식 검색이 시간 초과로 중단되어 함께 취소되었습니다. 다시 시도하세요")
+        return [chunk[i] for chunk, hits in zip(chunks, results) for i in hits]
+
+    async def search(
+        self,
+        q: str,
+        containers: Optional[List[str]] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        regex: bool = False,
+        limit: int = 200,
+    ) -> Dict[str, Any]:
+        """수집된 로그 검색 (최신 순)
+
+        기본은 토큰 AND 검색(역색인), regex=True이면 보관 줄 전체를 정규식으로 스캔한다.
+        """
+        started = time.perf_counter()
+        container_ids = self._resolve_containers(containers)
+        if regex:
+            entries = self.index.select(container_ids, start, end)
+            matches = await self._regex_search(q, entries)
+            truncated = len(matches) > limit
+            matches = matches[::-1][:limit]
+        else:
+            tokens = tokenize(q)
+            if not tokens:
+                raise InvalidSearchQueryError("검색어에 2자 이상의 단어가 필요합니다")
+            matches, truncated = self.index.search(tokens, container_ids, start, end, limit)
+
+        return {
+            "query": q,
+            "mode": "regex" if regex else "index",
+            "took_ms": round((time.perf_counter() - started) * 1000, 2),
+            "truncated": truncated,
+            "matches": [
+                {
+                    "container_id": cid[:12],
+                    "container": self.index.names.get(cid),
+                    "ts": record["ts"],
+                    "stream": record["stream"],
+                    "line": record["line"],
+                }
+                for _, cid, _, record in matches
+            ],
+        }
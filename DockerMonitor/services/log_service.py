@@ -0,0 +1,925 @@
+"""
+컨테이너 로그 서비스 - follow 스트림을 줄 단위 레코드로 변환해 비동기로 전달
+"""
+import asyncio
+import datetime
+import heapq
+import json
+import logging
+import os
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Union
+
+from .base_service import BaseService
+from core.config import settings
+from core.executors import LaneExecutor
+from core.exceptions import ContainerNotFoundError, DockerConnectionError, TooManyLogTargetsError
+
+logger = logging.getLogger(__name__)
+
+# follower 큐 크기 (청크 단위) - 가득 차면 Docker 소켓 읽기가 멈춤 (backpressure)
+_FOLLOW_QUEUE_SIZE = 64
+# 로그 다운로드 시 executor 한 번에 읽어 오는 줄 수
+_DOWNLOAD_BATCH_LINES = 2000
+# 데몬 follow 하나가 STREAM lane에서 점유하는 스레드 수 (stdout / stderr 각 1)
+FOLLOW_THREADS = 2
+# 링 버퍼 follower가 쓸 수 있는 STREAM lane 비율 - 나머지는 실시간 follow / 터미널 몫
+_BUFFER_STREAM_SHARE = 0.25
+# 병합 follow / 상시 수집(LogCollector)이 남겨 두는 STREAM lane 비율 - 다른 /ws/logs / 터미널 몫
+_STREAM_RESERVE = 0.25
+
+LogRecord = Dict[str, Any]
+
+
+def parse_since(value: Union[str, float, int, None]) -> Optional[float]:
+    """since/until 파라미터(epoch 초 또는 RFC3339 문자열)를 epoch 초로 변환
+
+    0 이하(1970-01-01 이전 포함)는 Docker가 InvalidArgument로 거부하므로 지정 없음(None)으로 본다.
+    """
+    if value is None or value == "":
+        return None
+    try:
+        epoch = float(value)
+    except ValueError:
+        epoch = parse_docker_timestamp(value)
+    return epoch if epoch is not None and epoch > 0 else None
+
+
+def parse_docker_timestamp(ts: str) -> Optional[float]:
+    """Docker RFC3339Nano 타임스탬프("2024-01-01T00:00:00.123456789Z")를 epoch 초로 변환"""
+    try:
+        ts = ts.strip().replace("Z", "+00:00")
+        # fromisoformat은 마이크로초(6자리)까지만 지원 - 나노초 절삭
+        if "." in ts:
+            head, rest = ts.split(".", 1)
+            digits = len(rest) - len(rest.lstrip("0123456789"))
+            ts = f"{head}.{rest[:min(digits, 6)]}{rest[digits:]}"
+        return datetime.datetime.fromisoformat(ts).timestamp()
+    except (ValueError, AttributeError):
+        return None
+
+
+def split_log_line(raw: bytes, stream: str) -> LogRecord:
+    """timestamps=True로 받은 한 줄을 {ts, stream, line} 레코드로 분리"""
+    text = raw.decode("utf-8", errors="replace").rstrip("\r")
+    ts, sep, line = text.partition(" ")
+    if not sep or not ts[:4].isdigit():
+        return {"ts": None, "stream": stream, "line": text}
+    return {"ts": ts, "stream": stream, "line": line}
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """바이트 청크 스트림을 줄 단위로 분리 (줄바꿈 제외)"""
+    buf = b""
+    for chunk in chunks:
+        buf += chunk
+        *lines, buf = buf.split(b"\n")
+        yield from lines
+    if buf:
+        yield buf
+
+
+def _iter_records(chunks: Iterable[bytes], stream: str) -> Iterator[LogRecord]:
+    for line in iter_lines(chunks):
+        yield split_log_line(line, stream)
+
+
+def _take(iterator: Iterator, n: int) -> list:
+    """(스레드) iterator에서 최대 n개를 꺼냄 - 소켓 읽기가 블로킹되므로 executor에서 호출"""
+    batch = []
+    for item in iterator:
+        batch.append(item)
+        if len(batch) >= n:
+            break
+    return batch
+
+
+class LogFollower:
+    """컨테이너 하나의 로그 follow 스트림
+
+    초기 tail(또는 since 이후) 줄은 비-follow 조회로 한 번에 읽어 시각 순으로 병합/절삭해 보내고,
+    이후 stdout/stderr를 별도 Docker 스트림으로 마지막 줄 시각부터 follow해 새 줄만 queue에 넣는다.
+    queue가 가득 차면 읽기 스레드가 대기하므로 소비자가 느리면 Docker 소켓 읽기도 멈춘다.
+    모든 스트림이 끝나면 queue에 None을 넣는다.
+    """
+
+    def __init__(
+        self,
+        service: "LogService",
+        container_id: str,
+        tail: Union[int, str] = 100,
+        since: Optional[float] = None,
+        streams: tuple = ("stdout", "stderr"),
+    ):
+        self.service = service
+        self.container_id = container_id
+        self.tail = tail
+        self.since = since
+        self.streams = streams
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=_FOLLOW_QUEUE_SIZE)
+        self._docker_streams: List[Any] = []
+        self._pumps: List[asyncio.Future] = []
+        self._closed = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def start(self):
+        """초기 줄을 보내고 Docker 스트림을 열어 읽기 스레드 시작"""
+        self._loop = asyncio.get_running_loop()
+        started_at = time.time()
+        initial = await self._send_initial()
+        # 마지막 줄 시각부터 follow - 같은 시각의 줄은 다시 오므로 이미 보낸 것은 제외
+        follow_since = record_epoch(initial[-1]) if initial else max(self.since or 0, started_at)
+        seen = {(r["ts"], r["stream"], r["line"]) for r in initial if record_epoch(r) >= follow_since}
+        try:
+            for name in self.streams:
+                stream = await self.service.run_sync(
+                    self.service._open_log_stream_sync, self.container_id, name, "all", follow_since
+                )
+                self._docker_streams.append(stream)
+                self._pumps.append(
+                    self._loop.run_in_executor(
+                        self.service.stream_executor, self._pump, stream, name, seen, follow_since
+                    )
+                )
+        except BaseException:
+            self.close()
+            raise
+        asyncio.ensure_future(self._wait_pumps())
+
+    async def _send_initial(self) -> List[LogRecord]:
+        """초기 줄을 시각 순으로 전송 - 마지막으로 보낸 묶음 반환 (follow 시작 시각 / 중복 제거용)
+
+        tail이 있으면 병합 후 tail만큼 절삭한 목록을 한 번에, tail=all이면 메모리에 쌓지 않도록
+        출력별 스트림을 heapq.merge로 병합해 배치 단위로 보낸다.
+        """
+        service = self.service
+        if self.tail != "all":
+            records = await service.run_sync(
+                service._read_logs_sync, self.container_id, self.tail, self.since, None, self.streams
+            )
+            if records:
+                await self._put(records)
+            return records
+
+        records, raw_streams = await service.run_sync(
+            service._open_download_sync, self.container_id, "all", self.since, None, self.streams
+        )
+        last: List[LogRecord] = []
+        try:
+            while not self._closed:
+                batch = await self._loop.run_in_executor(
+                    service.stream_executor, _take, records, _DOWNLOAD_BATCH_LINES
+                )
+                if not batch:
+                    break
+                await self._put(batch)
+                last = batch
+        finally:
+            for stream in raw_streams:
+                try:
+                    stream.close()
+                except Exception:
+                    pass
+        return last
+
+    async def _wait_pumps(self):
+        await asyncio.gather(*self._pumps, return_exceptions=True)
+        await self._put(None)
+
+    def _pump(self, stream, name: str, seen: set, since: float):
+        """(스레드) Docker 스트림을 읽어 완성된 줄 단위로 전달 - since 시각의 이미 보낸 줄은 제외"""
+        buf = b""
+
+        def fresh(records: List[LogRecord]) -> List[LogRecord]:
+            nonlocal seen
+            if not seen:
+                return records
+            kept = [r for r in records if (r["ts"], r["stream"], r["line"]) not in seen]
+            if any(record_epoch(r) > since for r in records):
+                seen = set()
+            return kept
+
+        try:
+            for chunk in stream:
+                if self._closed:
+                    break
+                buf += chunk
+                *lines, buf = buf.split(b"\n")
+                records = fresh([split_log_line(l, name) for l in lines])
+                if records:
+                    self._put_threadsafe(records)
+            records = fresh([split_log_line(buf, name)]) if buf else []
+            if records and not self._closed:
+                self._put_threadsafe(records)
+        except Exception as e:
+            if not self._closed:
+                logger.warning(f"Log stream error ({self.container_id}/{name}): {e}")
+
+    def _put_threadsafe(self, records: List[LogRecord]):
+        try:
+            asyncio.run_coroutine_threadsafe(self._put(records), self._loop).result()
+        except Exception:
+            # 루프 종료 등 - 더 이상 전달할 곳이 없음
+            self._closed = True
+
+    async def _put(self, item):
+        if self._closed and item is not None:
+            return
+        await self.queue.put(item)
+
+    def close(self):
+        """스트림 종료 - 소켓을 닫아 읽기 스레드를 깨움"""
+        if self._closed:
+            return
+        self._closed = True
+        for stream in self._docker_streams:
+            try:
+                stream.close()
+            except Exception:
+                pass
+        # 대기 중인 put을 풀어줌
+        while not self.queue.empty():
+            self.queue.get_nowait()
+
+
+class LogMerger:
+    """여러 컨테이너 follow 스트림을 타임스탬프 순으로 병합 (docker compose logs -f 대체)
+
+    각 소스에서 받은 줄을 힙(k-way merge)에 넣고, 도착 후 reorder window만큼 기다린 줄부터
+    시각 순으로 내보낸다. 컨테이너 간 시계 차이나 전달 지연으로 늦게 도착한 줄도
+    window 안이면 올바른 위치에 끼워진다.
+    소스마다 힙에 머무를 수 있는 줄 수를 제한해, 한 소스가 넘치면 그 소스의 읽기만 멈춘다.
+    """
+
+    def __init__(self, followers: List["LogFollower"], names: List[str], window: float, max_pending: int = 2000):
+        self.followers = followers
+        self.names = names
+        self.window = window
+        self.max_pending = max_pending
+        # (epoch, seq, 도착 시각, 소스 번호, record)
+        self._heap: List[tuple] = []
+        self._seq = 0
+        self._pending = [0] * len(followers)
+        self._space = [asyncio.Event() for _ in followers]
+        self._changed = asyncio.Event()
+        self._active = len(followers)
+        self._readers: List[asyncio.Task] = []
+
+    async def _read(self, index: int):
+        follower = self.followers[index]
+        space = self._space[index]
+        try:
+            while True:
+                while self._pending[index] >= self.max_pending:
+                    space.clear()
+                    await space.wait()
+                records = await follower.queue.get()
+                if records is None:
+                    return
+                now = time.monotonic()
+                for record in records:
+                    record = {**record, "container": self.names[index]}
+                    heapq.heappush(self._heap, (record_epoch(record), self._seq, now, index, record))
+                    self._seq += 1
+                self._pending[index] += len(records)
+                self._changed.set()
+        finally:
+            self._active -= 1
+            self._changed.set()
+
+    def _pop_ready(self, now: float, flush: bool) -> List[LogRecord]:
+        batch = []
+        while self._heap and (flush or now - self._heap[0][2] >= self.window):
+            _, _, _, index, record = heapq.heappop(self._heap)
+            self._pending[index] -= 1
+            if self._pending[index] < self.max_pending:
+                self._space[index].set()
+            batch.append(record)
+        return batch
+
+    async def batches(self) -> AsyncIterator[List[LogRecord]]:
+        """병합된 줄 묶음 - 모든 소스가 끝나면 남은 줄을 내보내고 종료"""
+        self._readers = [asyncio.create_task(self._read(i)) for i in range(len(self.followers))]
+        try:
+            while True:
+                done = self._active == 0
+                batch = self._pop_ready(time.monotonic(), flush=done)
+                if batch:
+                    yield batch
+                if done:
+                    return
+                self._changed.clear()
+                timeout = None
+                if self._heap:
+                    timeout = max(self._heap[0][2] + self.window - time.monotonic(), 0)
+                try:
+                    await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.close()
+
+    def close(self):
+        for task in self._readers:
+            task.cancel()
+        for follower in self.followers:
+            follower.close()
+
+
+def record_epoch(record: LogRecord) -> float:
+    """레코드 타임스탬프를 epoch 초로 (없으면 0)"""
+    if not record.get("ts"):
+        return 0.0
+    return parse_docker_timestamp(record["ts"]) or 0.0
+
+
+class LogBuffer:
+    """최근 로그 줄을 보관하는 컨테이너별 링 버퍼
+
+    시작 시 최근 N줄을 한 번 읽어 채우고, 이후 follow 스트림으로 새 줄만 덧붙인다.
+    일정 시간 조회가 없거나 스트림이 끝나면(컨테이너 중지) 스스로 정리된다.
+    """
+
+    def __init__(self, service: "LogService", container_id: str, size: int):
+        self.service = service
+        self.container_id = container_id
+        self.size = size
+        # (epoch, record) - epoch는 조회 시 매번 파싱하지 않기 위해 함께 보관
+        self.lines: deque = deque(maxlen=size)
+        self.ready = False
+        # 컨테이너의 전체 로그가 버퍼 안에 있는지 (tail=all 응답 가능 여부)
+        self.complete = False
+        self.last_access = time.monotonic()
+        self._closed = False
+        self._follower: Optional[LogFollower] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def touch(self):
+        self.last_access = time.monotonic()
+
+    def _append(self, record: LogRecord):
+        if len(self.lines) == self.size:
+            self.complete = False
+        self.lines.append((record_epoch(record), record))
+
+    async def start(self):
+        started_at = time.time()
+        records = await self.service.run_shared(
+            self.service._read_logs_sync, self.container_id, self.size, None, None
+        )
+        if self._closed:
+            return
+        for record in records:
+            self._append(record)
+        self.complete = len(records) < self.size
+
+        # 스냅샷과 follow 시작 사이에 겹치는 줄 제거용
+        seen = {(r["ts"], r["stream"], r["line"]) for r in records[-100:]}
+        self._follower = await self.service.follow(self.container_id, tail="all", since=started_at)
+        if self._closed:
+            self._follower.close()
+            return
+        self.ready = True
+        self._task = asyncio.create_task(self._consume(seen))
+
+    async def _consume(self, seen: set):
+        idle_limit = settings.log_buffer_idle_seconds
+        try:
+            while True:
+                try:
+                    records = await asyncio.wait_for(self._follower.queue.get(), timeout=min(idle_limit, 30))
+                except asyncio.TimeoutError:
+                    if time.monotonic() - self.last_access > idle_limit:
+                        break
+                    continue
+                if records is None:
+                    break
+                for record in records:
+                    if seen and (record["ts"], record["stream"], record["line"]) in seen:
+                        continue
+                    self._append(record)
+                seen = set()
+                if time.monotonic() - self.last_access > idle_limit:
+                    break
+        finally:
+            self.close()
+
+    def close(self):
+        self._closed = True
+        self.ready = False
+        if self._follower:
+            self._follower.close()
+        self.service._drop_buffer(self)
+
+    def query(
+        self,
+        tail: Union[int, str],
+        since: Optional[float] = None,
+        since_raw: Optional[str] = None,
+        until: Optional[float] = None,
+    ) -> Optional[List[LogRecord]]:
+        """버퍼로 응답 가능하면 레코드 목록, 버퍼 범위를 벗어나면 None (데몬 조회 필요)"""
+        if not self.ready:
+            return None
+        entries = list(self.lines)
+        if since is not None:
+            oldest = entries[0][0] if entries else None
+            if not self.complete and (oldest is None or since < oldest):
+                return None
+            entries = [e for e in entries if e[0] >= since and e[1]["ts"] != since_raw]
+        elif tail == "all" or tail > len(entries):
+            if not self.complete:
+                return None
+        if until is not None:
+            entries = [e for e in entries if e[0] <= until]
+        if tail != "all":
+            entries = entries[-tail:] if tail else []
+        return [e[1] for e in entries]
+
+
+class LogCollector(BaseService, ABC):
+    """선택한 컨테이너의 로그를 계속 수집하는 서비스의 기본 클래스
+
+    수집 대상은 selector(컨테이너 이름, ID 접두사, "*"는 실행 중인 전체)로 지정한다.
+    주기적으로 실행 중인 컨테이너와 비교해 follow를 시작/중지하며,
+    컨테이너가 중지 후 다시 실행되면 _resume_epoch 이후부터 이어서 수집한다.
+    follow마다 STREAM 스레드를 점유하므로 lane 여유가 없으면 새 수집은 다음 확인 때로 미룬다.
+    하위 클래스는 _collect를 구현하고, 필요하면 _resume_epoch를 재정의한다.
+    """
+
+    # 수집 대상 재확인 주기 (초) - 새로 시작/재시작된 컨테이너 반영
+    reconcile_interval = 30
+
+    def __init__(self, log_service: "LogService", selectors: str = "", backfill_lines: Union[int, str] = 1000):
+        super().__init__()
+        self.log_service = log_service
+        self.backfill_lines = backfill_lines
+        self._selectors = {s.strip() for s in selectors.split(",") if s.strip()}
+        self._ingesters: Dict[str, asyncio.Task] = {}
+        self._names: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    # ---- 하위 클래스 구현 ----
+
+    @abstractmethod
+    async def _collect(self, container_id: str, name: str, records: List[LogRecord]):
+        """follow로 받은 줄 묶음 처리"""
+
+    async def _resume_epoch(self, container_id: str, name: str) -> Optional[float]:
+        """이미 수집한 마지막 시각 (없으면 backfill_lines만큼 과거부터 수집)"""
+        return None
+
+    # ---- 수명 주기 ----
+
+    @property
+    def enabled(self) -> bool:
+        return True
+
+    async def start(self):
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._reconcile_loop())
+
+    async def stop(self):
+        tasks = list(self._ingesters.values())
+        if self._task:
+            tasks.append(self._task)
+            self._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._ingesters.clear()
+
+    # ---- 수집 대상 ----
+
+    @property
+    def selectors(self) -> List[str]:
+        return sorted(self._selectors)
+
+    def add_selector(self, selector: str):
+        self._selectors.add(selector)
+        asyncio.ensure_future(self.reconcile())
+
+    def remove_selector(self, selector: str) -> bool:
+        if selector not in self._selectors:
+            return False
+        self._selectors.discard(selector)
+        asyncio.ensure_future(self.reconcile())
+        return True
+
+    def ingesting(self) -> List[Dict[str, str]]:
+        """현재 수집 중인 컨테이너 목록"""
+        return [
+            {"id": cid[:12], "name": self._names.get(cid)}
+            for cid, task in self._ingesters.items() if not task.done()
+        ]
+
+    def _list_running_sync(self) -> List[tuple]:
+        return [(c.id, c.name) for c in self.client.containers.list()]
+
+    def _matches(self, container_id: str, name: str) -> bool:
+        return any(
+            s == "*" or s == name or container_id.startswith(s)
+            for s in self._selectors
+        )
+
+    async def _reconcile_loop(self):
+        while True:
+            try:
+                await self.reconcile()
+            except Exception as e:
+                logger.warning(f"{type(self).__name__} reconcile failed: {e}")
+            await asyncio.sleep(self.reconcile_interval)
+
+    async def reconcile(self):
+        """수집 대상과 실행 중인 컨테이너를 비교해 수집 작업 시작/중지"""
+        if not self._selectors:
+            targets = {}
+        elif not await self.ensure_connected():
+            return
+        else:
+            running = await self.run_shared(self._list_running_sync)
+            targets = {cid: name for cid, name in running if self._matches(cid, name)}
+
+        for cid in list(self._ingesters):
+            if cid not in targets:
+                self._ingesters.pop(cid).cancel()
+        budget = self.log_service.follow_capacity()
+        deferred = 0
+        for cid, name in targets.items():
+            task = self._ingesters.get(cid)
+            if task is None or task.done():
+                if budget <= 0:
+                    deferred += 1
+                    continue
+                budget -= 1
+                self._names[cid] = name
+                self._ingesters[cid] = asyncio.create_task(self._ingest(cid, name))
+        if deferred:
+            logger.warning(f"{type(self).__name__}: stream lane busy, deferred {deferred} containers")
+
+    async def _ingest(self, container_id: str, name: str):
+        last = await self._resume_epoch(container_id, name)
+        if last is None:
+            follower = await self.log_service.follow(container_id, tail=self.backfill_lines)
+        else:
+            follower = await self.log_service.follow(container_id, tail="all", since=last)
+        try:
+            while True:
+                records = await follower.queue.get()
+                if records is None:
+                    return
+                if last is not None:
+                    # since는 초 단위로 겹칠 수 있으므로 이미 수집한 줄 제외
+                    records = [r for r in records if record_epoch(r) > last]
+                if records:
+                    await self._collect(container_id, name, records)
+        finally:
+            follower.close()
+
+
+class LogService(BaseService):
+    """컨테이너 로그 조회/스트리밍 서비스"""
+
+    def __init__(self):
+        super().__init__()
+        # container_id → LogBuffer (LRU 순서)
+        self._buffers: "OrderedDict[str, LogBuffer]" = OrderedDict()
+        # json-file 직접 읽기: 요청 ID/이름 → 전체 ID, 로그 파일 경로 → JsonLogFile (인덱스 재사용)
+        self._file_ids: Dict[str, str] = {}
+        self._log_files: Dict[str, Any] = {}
+
+    def _json_log_file(self, container_id: str):
+        """컨테이너의 json-file 로그 리더 - 직접 읽을 수 없으면 None (데몬 API 사용)
+
+        DOCKER_CONTAINERS_DIR 아래 디렉터리 이름(전체 ID)으로 찾는다. 64자 전체 ID가 아니면
+        (짧은 ID / 이름) 데몬에 전체 ID를 한 번 조회해 캐시한다 - 16진수로만 된 이름이
+        다른 컨테이너 ID의 접두사와 겹칠 수 있어 디렉터리 접두사로 추측하지 않는다.
+        """
+        from .log_file_backend import JsonLogFile
+
+        root = settings.docker_containers_dir
+        if not root:
+            return None
+        full_id = self._file_ids.get(container_id)
+        if full_id is None or not os.path.isdir(os.path.join(root, full_id)):
+            if len(container_id) == 64 and os.path.isdir(os.path.join(root, container_id)):
+                full_id = container_id
+            else:
+                try:
+                    full_id = self.client.containers.get(container_id).id
+                except Exception:
+                    return None
+            self._file_ids[container_id] = full_id
+
+        path = os.path.join(root, full_id, f"{full_id}-json.log")
+        if not os.access(path, os.R_OK):
+            return None
+        log_file = self._log_files.get(path)
+        if log_file is None:
+            log_file = self._log_files[path] = JsonLogFile(path)
+        return log_file
+
+    def _read_logs_sync(
+        self,
+        container_id: str,
+        tail: Union[int, str],
+        since: Optional[float],
+        until: Optional[float],
+        streams: tuple = ("stdout", "stderr"),
+    ) -> List[LogRecord]:
+        """비-follow 로그 조회 - 출력별로 따로 읽어 타임스탬프 순으로 병합한 뒤 tail만큼 절삭
+
+        json-file 로그를 직접 읽을 수 있으면(두 출력 모두 요청 시) 데몬을 거치지 않는다.
+        """
+        log_file = self._json_log_file(container_id) if len(streams) == 2 else None
+        if log_file is not None:
+            try:
+                return log_file.read(tail, since, until)[0]
+            except OSError as e:
+                logger.debug(f"Direct log read failed, falling back to API ({container_id}): {e}")
+        try:
+            container = self.client.containers.get(container_id)
+            records: List[LogRecord] = []
+            for name in streams:
+                raw = container.logs(
+                    stdout=name == "stdout",
+                    stderr=name == "stderr",
+                    timestamps=True,
+                    tail=tail,
+                    since=since,
+                    until=until,
+                )
+                records.extend(split_log_line(line, name) for line in raw.split(b"\n") if line)
+        except Exception as e:
+            if "No such container" in str(e) or "404" in str(e):
+                raise ContainerNotFoundError(container_id)
+            raise e
+        records.sort(key=record_epoch)
+        if tail != "all":
+            records = records[-tail:] if tail else []
+        return records
+
+    @staticmethod
+    def buffer_limit() -> int:
+        """동시에 유지할 링 버퍼 수 - LOG_BUFFER_MAX_CONTAINERS와 STREAM lane 몫 중 작은 값
+
+        버퍼마다 follower가 STREAM 스레드를 계속 점유하므로, 버퍼만으로 lane이 가득 차
+        /ws/logs나 터미널이 거부(503)되지 않도록 lane의 일부만 쓰게 한다.
+        """
+        by_lane = int(settings.stream_pool_workers * _BUFFER_STREAM_SHARE) // FOLLOW_THREADS
+        return max(1, min(settings.log_buffer_max_containers, by_lane))
+
+    def _drop_buffer(self, buffer: LogBuffer):
+        if self._buffers.get(buffer.container_id) is buffer:
+            del self._buffers[buffer.container_id]
+
+    def _activate_buffer(self, container_id: str) -> Optional[LogBuffer]:
+        """조회된 컨테이너의 링 버퍼 반환 - 없으면 백그라운드로 생성 (LRU 상한 유지)"""
+        if settings.log_buffer_lines <= 0:
+            return None
+        buffer = self._buffers.get(container_id)
+        if buffer:
+            self._buffers.move_to_end(container_id)
+            buffer.touch()
+            return buffer
+
+        buffer = LogBuffer(self, container_id, settings.log_buffer_lines)
+        self._buffers[container_id] = buffer
+        while len(self._buffers) > self.buffer_limit():
+            _, oldest = self._buffers.popitem(last=False)
+            oldest.close()
+
+        async def _start():
+            try:
+                await buffer.start()
+            except Exception as e:
+                logger.warning(f"Failed to start log buffer for {container_id}: {e}")
+                buffer.close()
+
+        asyncio.create_task(_start())
+        return buffer
+
+    async def read_logs(
+        self,
+        container_id: str,
+        tail: Union[int, str] = 100,
+        since: Union[str, float, None] = None,
+        until: Union[str, float, None] = None,
+    ) -> Dict[str, Any]:
+        """로그 조회 (증분 조회용 cursor 포함)
+
+        cursor는 마지막 줄의 타임스탬프이며, 다음 요청의 since로 넘기면 그 이후 줄만 받는다.
+        since가 있으면 cursor 이후의 가장 오래된 tail줄을 반환하고, 더 남아 있으면 truncated=True
+        (cursor로 다시 요청해 이어 받음 - 폴링 사이에 tail보다 많은 줄이 생겨도 빠지지 않음).
+        최근 조회된 컨테이너는 링 버퍼에서 응답해 데몬을 거치지 않는다.
+        """
+        since_epoch = parse_since(since)
+        since_raw = since if isinstance(since, str) and since_epoch is not None else None
+        until_epoch = parse_since(until)
+        # since가 있으면 cursor 이후 전체에서 앞쪽 tail줄을 자름
+        fetch_tail = "all" if since_epoch is not None else tail
+
+        buffer = self._activate_buffer(container_id)
+        records = buffer.query(fetch_tail, since_epoch, since_raw, until_epoch) if buffer else None
+        source = "buffer"
+        if records is None:
+            if not await self.ensure_connected():
+                return {"lines": [], "cursor": since_raw, "source": "none", "truncated": False}
+            records = await self.run_shared(
+                self._read_logs_sync, container_id, fetch_tail, since_epoch, until_epoch
+            )
+            # since 경계의 줄(커서 자신)은 이미 받은 줄이므로 제외
+            if since_raw:
+                records = [r for r in records if r["ts"] != since_raw]
+            source = "daemon"
+
+        truncated = False
+        if since_epoch is not None and tail != "all" and len(records) > tail:
+            end = max(tail, 1)
+            # 같은 타임스탬프의 줄은 나누지 않음 (다음 요청에서 cursor와 같은 줄은 제외되므로)
+            while end < len(records) and records[end]["ts"] == records[end - 1]["ts"]:
+                end += 1
+            records, truncated = records[:end], end < len(records)
+
+        cursor = records[-1]["ts"] if records else since_raw
+        return {"lines": records, "cursor": cursor, "source": source, "truncated": truncated}
+
+    def _open_download_sync(
+        self,
+        container_id: str,
+        tail: Union[int, str],
+        since: Optional[float],
+        until: Optional[float],
+        streams: tuple,
+    ) -> tuple:
+        """다운로드용 비-follow 스트림 열기 - (타임스탬프 순 병합 레코드 iterator, 원본 스트림 목록)
+
+        stdout/stderr를 별도 스트림으로 받아 출력 구분을 유지하고, 각 스트림이 시간순이므로
+        heapq.merge로 메모리에 쌓지 않고 병합한다.
+        """
+        try:
+            container = self.client.containers.get(container_id)
+            raw_streams = [
+                container.logs(
+                    stream=True,
+                    follow=False,
+                    stdout=name == "stdout",
+                    stderr=name == "stderr",
+                    timestamps=True,
+                    tail=tail,
+                    since=since,
+                    until=until,
+                )
+                for name in streams
+            ]
+        except Exception as e:
+            if "No such container" in str(e) or "404" in str(e):
+                raise ContainerNotFoundError(container_id)
+            raise e
+        iterators = [_iter_records(raw, name) for name, raw in zip(streams, raw_streams)]
+        return heapq.merge(*iterators, key=record_epoch), raw_streams
+
+    async def open_download(
+        self,
+        container_id: str,
+        tail: Union[int, str] = "all",
+        since: Union[str, float, None] = None,
+        until: Union[str, float, None] = None,
+        stdout: bool = True,
+        stderr: bool = True,
+        fmt: str = "text",
+        timestamps: bool = True,
+        compress: bool = False,
+    ) -> AsyncIterator[bytes]:
+        """로그 다운로드 스트림 열기 - StreamingResponse에 넘길 바이트 async iterator 반환
+
+        로그 크기와 무관하게 배치 단위로 읽고 인코딩/압축해 내보내므로 메모리 사용량이 일정하다.
+        스트림은 응답 시작 전에 열어 컨테이너 없음 등의 오류가 정상 에러 응답으로 전달된다.
+        """
+        if not await self.ensure_connected():
+            raise DockerConnectionError()
+        streams = tuple(name for name, on in (("stdout", stdout), ("stderr", stderr)) if on)
+        records, raw_streams = await self.run_sync(
+            self._open_download_sync, container_id, tail, parse_since(since), parse_since(until), streams
+        )
+        return self._encode_download(records, raw_streams, fmt, timestamps, compress)
+
+    async def _encode_download(
+        self, records: Iterator[LogRecord], raw_streams: list, fmt: str, timestamps: bool, compress: bool
+    ) -> AsyncIterator[bytes]:
+        loop = asyncio.get_running_loop()
+        # wbits=31: gzip 헤더/트레일러 포함
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+        try:
+            while True:
+                batch = await loop.run_in_executor(self.stream_executor, _take, records, _DOWNLOAD_BATCH_LINES)
+                if not batch:
+                    break
+                if fmt == "ndjson":
+                    if not timestamps:
+                        batch = [{"stream": r["stream"], "line": r["line"]} for r in batch]
+                    data = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in batch)
+                elif timestamps:
+                    data = "".join(f"{r['ts']} {r['line']}\n" if r["ts"] else f"{r['line']}\n" for r in batch)
+                else:
+                    data = "".join(f"{r['line']}\n" for r in batch)
+                chunk = data.encode("utf-8")
+                if compressor:
+                    chunk = compressor.compress(chunk)
+                if chunk:
+                    yield chunk
+            if compressor:
+                yield compressor.flush()
+        finally:
+            for stream in raw_streams:
+                try:
+                    stream.close()
+                except Exception:
+                    pass
+
+    def _open_log_stream_sync(self, container_id: str, stream: str, tail, since: Optional[float]):
+        """단일 출력(stdout 또는 stderr) follow 스트림 열기 - 항상 타임스탬프 포함"""
+        try:
+            container = self.client.containers.get(container_id)
+            return container.logs(
+                stream=True,
+                follow=True,
+                stdout=stream == "stdout",
+                stderr=stream == "stderr",
+                timestamps=True,
+                tail=tail,
+                since=since,
+            )
+        except Exception as e:
+            if "No such container" in str(e) or "404" in str(e):
+                raise ContainerNotFoundError(container_id)
+            raise e
+
+    def follow_capacity(self) -> int:
+        """STREAM lane 여유로 더 열 수 있는 데몬 follow 수 (lane의 일부는 항상 남겨 둠)"""
+        executor = self._stream_executor
+        free = executor.available() if isinstance(executor, LaneExecutor) else settings.stream_pool_workers
+        return max(0, (free - int(settings.stream_pool_workers * _STREAM_RESERVE)) // FOLLOW_THREADS)
+
+    def merge_capacity(self) -> int:
+        """지금 병합 follow로 열 수 있는 컨테이너 수 - LOG_MERGE_MAX_CONTAINERS와 STREAM lane 여유 중 작은 값"""
+        return min(settings.log_merge_max_containers, self.follow_capacity())
+
+    async def follow_many(
+        self,
+        targets: List[Dict[str, str]],
+        tail: Union[int, str] = 100,
+        since: Optional[float] = None,
+        window: Optional[float] = None,
+    ) -> LogMerger:
+        """여러 컨테이너 follow를 시각 순으로 병합 - 호출자는 사용 후 반드시 close() 할 것
+
+        targets: [{"id", "name"}] (container_service.resolve_targets 결과)
+        follow마다 STREAM 스레드를 점유하므로, lane 여유를 넘는 요청은 스트림을 열기 전에
+        TooManyLogTargetsError로 거부한다 (중간에 포화되어 다른 스트림까지 거부되지 않도록).
+        """
+        capacity = self.merge_capacity()
+        if len(targets) > capacity:
+            raise TooManyLogTargetsError(len(targets), capacity)
+        followers: List[Any] = []
+        try:
+            for target in targets:
+                followers.append(await self.follow(target["id"], tail=tail, since=since))
+        except BaseException:
+            for follower in followers:
+                follower.close()
+            raise
+        if window is None:
+            window = settings.log_merge_window_ms / 1000
+        return LogMerger(followers, [t["name"] for t in targets], window)
+
+    async def follow(
+        self,
+        container_id: str,
+        tail: Union[int, str] = 100,
+        since: Optional[float] = None,
+        stdout: bool = True,
+        stderr: bool = True,
+    ) -> LogFollower:
+        """로그 follow 시작 - 호출자는 사용 후 반드시 close() 할 것
+
+        json-file 로그를 직접 읽을 수 있으면 파일 follow(inotify)를, 아니면 데몬 스트림을 사용한다.
+        """
+        from .log_file_backend import FileLogFollower
+
+        streams = tuple(name for name, on in (("stdout", stdout), ("stderr", stderr)) if on)
+        log_file = await self.run_sync(self._json_log_file, container_id) if settings.docker_containers_dir else None
+        if log_file is not None:
+            follower = FileLogFollower(log_file, tail=tail, since=since, streams=streams)
+            try:
+                await follower.start()
+                return follower
+            except OSError as e:
+                follower.close()
+                logger.debug(f"Direct log follow failed, falling back to API ({container_id}): {e}")
+        follower = LogFollower(self, container_id, tail=tail, since=since, streams=streams)
+        await follower.start()
+        return follower
@@ -51,8 +51,4 @@ class NetworkService(BaseService):
         if not await self.ensure_connected():
             return []
         
-        try:
-            return await self.run_sync(self._list_networks_sync)
-        except Exception as e:
-            logger.error(f"Error listing networks: {e}")
-            return []
+        return await self.run_shared_or([], "Error listing networks", self._list_networks_sync)
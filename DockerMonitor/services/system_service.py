@@ -114,4 +114,4 @@ class SystemService(BaseService):
         """Docker 시스템 정보 조회"""
         if not await self.ensure_connected():
             return {}
-        return await self.run_sync(self._get_system_df_sync)
+        return await self.run_shared(self._get_system_df_sync)
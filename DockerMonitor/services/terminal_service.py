@@ -0,0 +1,253 @@
+"""
+터미널 세션 관리 - exec 세션을 WebSocket 연결과 분리해 서버에서 유지
+
+WebSocket이 끊겨도 exec은 계속 실행되고 출력은 스크롤백 링 버퍼에 쌓인다.
+클라이언트는 세션 ID와 지금까지 받은 바이트 수(offset)로 다시 붙어 놓친 출력만 받는다.
+클라이언트가 없는 세션은 TERMINAL_IDLE_TIMEOUT이 지나면 종료된다.
+"""
+import asyncio
+import logging
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .exec_service import ExecService, ExecSession
+from core.config import settings
+from core.exceptions import TerminalSessionLimitError, TerminalSessionNotFoundError
+
+logger = logging.getLogger(__name__)
+
+# 출력 전송 / 세션 정보 전송 (재연결 시 재전송 시작 offset)
+Sender = Callable[[bytes], Awaitable[None]]
+Announcer = Callable[[int], Awaitable[None]]
+
+
+class Scrollback:
+    """바이트 링 버퍼 - 세션 시작부터의 누적 바이트 offset으로 조회"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._data = bytearray()
+        self.end = 0  # 지금까지 쌓인 전체 바이트 수
+
+    @property
+    def start(self) -> int:
+        """버퍼에 남아 있는 가장 오래된 바이트의 offset"""
+        return self.end - len(self._data)
+
+    def append(self, data: bytes):
+        self._data += data
+        self.end += len(data)
+        overflow = len(self._data) - self.limit
+        if overflow > 0:
+            del self._data[:overflow]
+
+    def since(self, offset: int) -> bytes:
+        """offset 이후 출력 (버퍼에서 밀려난 부분은 제외)"""
+        offset = max(offset, self.start)
+        if offset >= self.end:
+            return b""
+        return bytes(self._data[offset - self.start:])
+
+
+class TerminalSession:
+    """서버 측 터미널 세션 - exec 출력 펌프 + 스크롤백 + 붙어 있는 클라이언트 (최대 1개)
+
+    새 클라이언트가 붙으면 기존 클라이언트는 밀려난다(displaced 이벤트).
+    클라이언트가 느리면 전송을 기다리는 동안 exec 소켓 읽기가 멈춰 backpressure가 전달되고,
+    클라이언트가 없으면 출력은 스크롤백에만 쌓인다.
+    전송은 lock 밖에서 하므로 멈춘 클라이언트가 새 attach를 막지 않으며, 밀려나면 대기 중인 전송은 버린다.
+    """
+
+    def __init__(
+        self,
+        container_id: str,
+        exec_session: ExecSession,
+        on_idle: Callable[["TerminalSession"], None],
+        on_end: Callable[["TerminalSession"], None],
+    ):
+        self.id = uuid.uuid4().hex
+        self.container_id = container_id
+        self.exec = exec_session
+        self.scrollback = Scrollback(settings.terminal_scrollback_bytes)
+        self.created_at = time.time()
+        self.last_active = self.created_at
+        self.ended = asyncio.Event()
+        self._on_idle = on_idle
+        self._on_end = on_end
+        self._lock = asyncio.Lock()
+        self._client: Optional[Sender] = None
+        self._displaced: Optional[asyncio.Event] = None
+        self._idle_handle: Optional[asyncio.TimerHandle] = None
+        self._pump_task: Optional[asyncio.Task] = None
+
+    @property
+    def attached(self) -> bool:
+        return self._client is not None
+
+    def start(self):
+        self._pump_task = asyncio.create_task(self._pump())
+        self._schedule_idle()
+
+    async def _pump(self):
+        try:
+            while True:
+                data = await self.exec.read()
+                if data is None:
+                    break
+                async with self._lock:
+                    self.scrollback.append(data)
+                    self.last_active = time.time()
+                    client, token = self._client, self._displaced
+                if client:
+                    try:
+                        await self._send(client, token, data)
+                    except Exception as e:
+                        logger.info(f"Terminal client send failed ({self.id}): {e}")
+                        self.detach(token)
+        except Exception as e:
+            logger.warning(f"Terminal session pump error ({self.id}): {e}")
+        finally:
+            self.ended.set()
+            self._cancel_idle()
+            self.exec.close()
+            self._on_end(self)
+
+    @staticmethod
+    async def _send(client: Sender, token: asyncio.Event, data: bytes):
+        """클라이언트로 전송 - 전송 중에 밀려나면(token set) 전송을 취소하고 반환"""
+        send = asyncio.ensure_future(client(data))
+        displaced = asyncio.ensure_future(token.wait())
+        try:
+            done, _ = await asyncio.wait({send, displaced}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            displaced.cancel()
+            if not send.done():
+                send.cancel()
+        if send in done:
+            send.result()
+
+    async def attach(self, send: Sender, announce: Announcer, offset: Optional[int] = None) -> asyncio.Event:
+        """클라이언트 연결 - offset 이후 놓친 출력을 먼저 보내고 이후 출력을 전달
+
+        announce(재전송 시작 offset)는 재전송 전에 호출된다.
+        반환한 이벤트는 다른 클라이언트가 붙거나 전송이 실패해 이 연결이 밀려나면 set된다.
+        """
+        async with self._lock:
+            if self._displaced:
+                self._release(self._displaced)
+            start = max(offset or 0, self.scrollback.start)
+            await announce(min(start, self.scrollback.end))
+            missed = self.scrollback.since(start)
+            if missed:
+                await send(missed)
+            self._cancel_idle()
+            self._client = send
+            self._displaced = asyncio.Event()
+            self.last_active = time.time()
+            return self._displaced
+
+    def detach(self, token: asyncio.Event):
+        """클라이언트 연결 해제 - 이미 다른 클라이언트로 바뀌었으면 무시"""
+        if token is self._displaced:
+            self._release(token)
+
+    def _release(self, token: Optional[asyncio.Event]):
+        if token:
+            token.set()
+        self._client = None
+        self._displaced = None
+        self.last_active = time.time()
+        self._schedule_idle()
+
+    def _schedule_idle(self):
+        self._cancel_idle()
+        if not self.ended.is_set():
+            self._idle_handle = asyncio.get_running_loop().call_later(
+                settings.terminal_idle_timeout, self._on_idle, self
+            )
+
+    def _cancel_idle(self):
+        if self._idle_handle:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+
+    async def write(self, data: bytes):
+        self.last_active = time.time()
+        await self.exec.write(data)
+
+    def close(self):
+        """exec 종료 - 펌프가 끝나면 ended가 set된다"""
+        self._cancel_idle()
+        self.exec.close()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "container_id": self.container_id,
+            "exec_id": self.exec.exec_id,
+            "attached": self.attached,
+            "created_at": self.created_at,
+            "last_active": self.last_active,
+            "output_bytes": self.scrollback.end,
+        }
+
+
+class TerminalService:
+    """터미널 세션 레지스트리 - 동시 세션 수 제한(TERMINAL_MAX_SESSIONS), 유휴 세션 정리"""
+
+    def __init__(self, exec_service: ExecService):
+        self.exec_service = exec_service
+        self._sessions: Dict[str, TerminalSession] = {}
+        self._opening = 0
+
+    def get(self, session_id: str, container_id: Optional[str] = None) -> Optional[TerminalSession]:
+        """세션 조회 - container_id를 주면 같은 컨테이너의 세션만 반환"""
+        session = self._sessions.get(session_id)
+        if session is None or session.ended.is_set():
+            return None
+        if container_id and not (session.container_id == container_id or session.container_id.startswith(container_id)):
+            return None
+        return session
+
+    def list(self) -> List[Dict[str, Any]]:
+        return [s.to_dict() for s in self._sessions.values()]
+
+    async def open(self, container_id: str) -> Optional[TerminalSession]:
+        """새 exec 세션 시작 - exec 생성 실패 시 None"""
+        if len(self._sessions) + self._opening >= settings.terminal_max_sessions:
+            raise TerminalSessionLimitError(settings.terminal_max_sessions)
+        self._opening += 1
+        try:
+            exec_session = await self.exec_service.open_session(container_id)
+        finally:
+            self._opening -= 1
+        if exec_session is None:
+            return None
+        session = TerminalSession(container_id, exec_session, on_idle=self._expire, on_end=self._forget)
+        self._sessions[session.id] = session
+        session.start()
+        logger.info(f"Terminal session {session.id} opened for container={container_id}")
+        return session
+
+    def _forget(self, session: TerminalSession):
+        if self._sessions.get(session.id) is session:
+            del self._sessions[session.id]
+            logger.info(f"Terminal session {session.id} ended")
+
+    def _expire(self, session: TerminalSession):
+        logger.info(f"Terminal session {session.id} idle for {settings.terminal_idle_timeout}s, closing")
+        session.close()
+
+    def terminate(self, session_id: str):
+        session = self._sessions.get(session_id)
+        if session is None:
+            raise TerminalSessionNotFoundError(session_id)
+        session.close()
+
+    async def stop(self):
+        sessions = list(self._sessions.values())
+        for session in sessions:
+            session.close()
+        if sessions:
+            await asyncio.wait([asyncio.create_task(s.ended.wait()) for s in sessions], timeout=5)
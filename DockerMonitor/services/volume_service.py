@@ -25,7 +25,7 @@ class VolumeService(BaseService):
         if not await self.ensure_connected():
             return []
         
-        return await self.run_sync(self._list_volumes_sync)
+        return await self.run_shared(self._list_volumes_sync)
 
     def _create_volume_sync(self, name: str, driver: str) -> Dict[str, Any]:
         vol = self.client.volumes.create(name=name, driver=driver)
@@ -39,7 +39,7 @@ class VolumeService(BaseService):
             return {}
         
         try:
-            return await self.run_sync(self._create_volume_sync, name, driver)
+            return await self.run_mutation(self._create_volume_sync, name, driver)
         except Exception as e:
             logger.error(f"Error creating volume {name}: {e}")
             raise e
@@ -54,7 +54,7 @@ class VolumeService(BaseService):
             return False
         
         try:
-            return await self.run_sync(self._remove_volume_sync, name, force)
+            return await self.run_mutation(self._remove_volume_sync, name, force)
         except Exception as e:
             logger.error(f"Error removing volume {name}: {e}")
             raise e
@@ -68,7 +68,7 @@ class VolumeService(BaseService):
             return {}
         
         try:
-            return await self.run_sync(self._inspect_volume_sync, name)
+            return await self.run_shared(self._inspect_volume_sync, name)
         except Exception as e:
             logger.error(f"Error inspecting volume {name}: {e}")
             return {}
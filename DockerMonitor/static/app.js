@@ -4,6 +4,16 @@ let socket;
 let reconnectAttempts = 0;
 const MAX_RECONNECT_ATTEMPTS = 10;
 
+// 서버가 첫 응답에 넣은 초기 데이터 - 키별로 한 번만 사용 (새로고침 버튼 등은 API 조회)
+const initialState = JSON.parse(document.getElementById('initial-state')?.textContent || '{}');
+
+function takeInitialState(key) {
+    if (!(key in initialState)) return undefined;
+    const value = initialState[key];
+    delete initialState[key];
+    return value;
+}
+
 const containerList = document.getElementById('container-list');
 const template = document.getElementById('container-card-template');
 
@@ -102,20 +112,7 @@ function connectWebSocket() {
             if (data.docker_connected) {
                 setConnectionStatus('connected', 'Connected');
             }
-            updateDashboard(data.containers, data.stats);
-            // Chart.js hook (defined in index.html page script)
-            if (typeof window.updateStatsWithCharts === 'function') {
-                window.updateStatsWithCharts(data.stats, data.containers);
-            }
-            // Browser Notification for status changes
-            if (data.status_events && data.status_events.length > 0) {
-                data.status_events.forEach(ev => {
-                    const icon = ev.to === 'running' ? '🟢' : ev.to === 'exited' ? '🔴' : '🟡';
-                    const msg = `${icon} ${ev.name}: ${ev.from} → ${ev.to}`;
-                    showToast(msg, ev.to === 'running' ? 'success' : 'warning', 5000);
-                    sendBrowserNotification(ev.name, ev.from, ev.to);
-                });
-            }
+            handleStatsUpdate(data);
         }
     };
 
@@ -140,6 +137,37 @@ function connectWebSocket() {
     };
 }
 
+function handleStatsUpdate(data) {
+    updateDashboard(data.containers, data.stats);
+    // Chart.js hook (defined in index.html page script)
+    if (typeof window.updateStatsWithCharts === 'function') {
+        window.updateStatsWithCharts(data.stats, data.containers);
+    }
+    // 로그 패턴 카운터 (LOG_PATTERNS 설정 시에만 포함)
+    if (data.log_metrics && typeof window.updateLogMetricsChart === 'function') {
+        window.updateLogMetricsChart(data.log_metrics);
+    }
+    // Browser Notification for status changes
+    if (data.status_events && data.status_events.length > 0) {
+        data.status_events.forEach(ev => {
+            const icon = ev.to === 'running' ? '🟢' : ev.to === 'exited' ? '🔴' : '🟡';
+            const msg = `${icon} ${ev.name}: ${ev.from} → ${ev.to}`;
+            showToast(msg, ev.to === 'running' ? 'success' : 'warning', 5000);
+            sendBrowserNotification(ev.name, ev.from, ev.to);
+        });
+    }
+}
+
+// 대시보드: 첫 응답의 스냅샷으로 WebSocket 연결 전에 바로 그림
+function applyInitialDashboard() {
+    if (!containerList || !('containers' in initialState)) return;
+    handleStatsUpdate({
+        containers: takeInitialState('containers'),
+        stats: takeInitialState('stats') || [],
+        log_metrics: takeInitialState('log_metrics'),
+    });
+}
+
 function showDockerOfflineState(message) {
     if (containerList) {
         containerList.innerHTML = `
@@ -199,6 +227,12 @@ function updateDashboard(containers, stats) {
 let term = null;
 let termSocket = null;
 let fitAddon = null;
+let termContainerId = null;
+let termSessionId = null;   // server-side session id, used to reattach after a dropped connection
+let termOffset = 0;         // output bytes received so far in this session
+let termRetries = 0;
+let termReconnectTimer = null;
+const TERM_MAX_RETRIES = 5;
 const terminalModal = document.getElementById('terminal-modal');
 
 // Init FitAddon if available
@@ -235,45 +269,88 @@ function openTerminal(containerId) {
     term.open(document.getElementById('terminal-container'));
     if (fitAddon) fitAddon.fit();
 
-    // Connect WebSocket
+    // Connect WebSocket (the server keeps the session; reconnects resume from termOffset)
+    termContainerId = containerId;
+    termSessionId = null;
+    termOffset = 0;
+    termRetries = 0;
+    connectTerminal();
+
+    const encoder = new TextEncoder();
+    term.onData((data) => {
+        if (termSocket && termSocket.readyState === WebSocket.OPEN) {
+            termSocket.send(encoder.encode(data));
+        }
+    });
+    term.onBinary((data) => {
+        if (termSocket && termSocket.readyState === WebSocket.OPEN) {
+            termSocket.send(Uint8Array.from(data, (c) => c.charCodeAt(0)));
+        }
+    });
+    term.onResize(sendTerminalResize);
+
+    window.addEventListener('resize', handleResize);
+}
+
+function connectTerminal() {
     const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-    termSocket = new WebSocket(`${protocol}//${window.location.host}/ws/exec/${containerId}`);
+    const resume = termSessionId ? `?session=${termSessionId}&offset=${termOffset}` : '';
+    const socket = new WebSocket(`${protocol}//${window.location.host}/ws/exec/${termContainerId}${resume}`);
+    let finished = false;  // exit / displaced: do not reconnect
+    termSocket = socket;
+
+    // Output arrives as binary frames; input is sent as binary, control messages as JSON text.
+    socket.binaryType = 'arraybuffer';
 
-    termSocket.onopen = () => {
-        term.write('\x1b[32mConnected to container terminal...\x1b[0m\r\n');
+    socket.onopen = () => {
+        termRetries = 0;
+        sendTerminalResize();
         term.focus();
     };
 
-    // Use arraybuffer for binary data if needed, but we used text frame in backend for input, 
-    // but bytes for output. WebSocket handles blob/arraybuffer vs text.
-    // In backend: `websocket.send_bytes(data)`. Client receives Blob by default for binary frames.
-    termSocket.binaryType = 'arraybuffer';
-
-    termSocket.onmessage = (event) => {
-        // xterm.write accepts string or Uint8Array
+    socket.onmessage = (event) => {
         if (event.data instanceof ArrayBuffer) {
+            termOffset += event.data.byteLength;
             term.write(new Uint8Array(event.data));
-        } else {
+            return;
+        }
+        let message = null;
+        if (event.data.startsWith('{')) {
+            try { message = JSON.parse(event.data); } catch (e) { message = null; }
+        }
+        if (!message) {
             term.write(event.data);
+        } else if (message.type === 'session') {
+            if (!message.resumed) {
+                term.write('\x1b[32mConnected to container terminal...\x1b[0m\r\n');
+            } else if (message.offset > termOffset) {
+                term.write('\r\n\x1b[33m[some output was dropped from the scrollback]\x1b[0m\r\n');
+            }
+            termSessionId = message.id;
+            termOffset = message.offset;
+        } else if (message.type === 'exit' || message.type === 'displaced') {
+            finished = true;
+            term.write(message.type === 'exit'
+                ? '\r\n\x1b[31mSession closed.\x1b[0m'
+                : '\r\n\x1b[33mSession opened in another window.\x1b[0m');
         }
     };
 
-    termSocket.onclose = () => {
-        term.write('\r\n\x1b[31mSession closed.\x1b[0m');
+    socket.onclose = () => {
+        if (termSocket !== socket || !term) return;  // closed by the user
+        termSocket = null;
+        if (!finished && termSessionId && termRetries < TERM_MAX_RETRIES) {
+            termRetries += 1;
+            term.write('\r\n\x1b[33mConnection lost, reconnecting...\x1b[0m\r\n');
+            termReconnectTimer = setTimeout(connectTerminal, 1000 * termRetries);
+        } else if (!finished) {
+            term.write('\r\n\x1b[31mSession closed.\x1b[0m');
+        }
     };
 
-    termSocket.onerror = (e) => {
+    socket.onerror = (e) => {
         console.error(e);
-        term.write('\r\n\x1b[31mConnection error.\x1b[0m');
     };
-
-    term.onData((data) => {
-        if (termSocket && termSocket.readyState === WebSocket.OPEN) {
-            termSocket.send(data);
-        }
-    });
-
-    window.addEventListener('resize', handleResize);
 }
 
 function handleResize() {
@@ -282,11 +359,24 @@ function handleResize() {
     }
 }
 
+function sendTerminalResize() {
+    if (term && termSocket && termSocket.readyState === WebSocket.OPEN) {
+        termSocket.send(JSON.stringify({ type: 'resize', cols: term.cols, rows: term.rows }));
+    }
+}
+
 function closeTerminal() {
+    clearTimeout(termReconnectTimer);
     if (termSocket) {
-        termSocket.close();
+        const socket = termSocket;
         termSocket = null;
+        // Closing the window ends the exec; a dropped connection keeps it for reattach
+        if (socket.readyState === WebSocket.OPEN) {
+            socket.send(JSON.stringify({ type: 'close' }));
+        }
+        socket.close();
     }
+    termSessionId = null;
     if (term) {
         term.dispose();
         term = null;
@@ -447,16 +537,50 @@ function updateStats(stats, containers) {
     });
 }
 
+// 백그라운드 Job 구독 (/ws/jobs/{id}) — handlers: onProgress, onLog, onDone(job)
+function watchJob(jobId, handlers = {}) {
+    const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+    const ws = new WebSocket(`${protocol}//${window.location.host}/ws/jobs/${jobId}`);
+
+    ws.onmessage = (event) => {
+        const msg = JSON.parse(event.data);
+        if (msg.type === 'job_state') {
+            (msg.logs || []).forEach(line => handlers.onLog && handlers.onLog(line));
+            if (handlers.onProgress) handlers.onProgress(msg);
+            if (['succeeded', 'failed', 'cancelled'].includes(msg.status) && handlers.onDone) handlers.onDone(msg);
+        } else if (msg.type === 'job_progress') {
+            if (handlers.onProgress) handlers.onProgress(msg);
+        } else if (msg.type === 'job_log') {
+            if (handlers.onLog) handlers.onLog(msg.line);
+        } else if (msg.type === 'job_done') {
+            if (handlers.onDone) handlers.onDone(msg);
+        } else if (msg.type === 'job_error') {
+            if (handlers.onDone) handlers.onDone({ status: 'failed', error: msg.error });
+        }
+    };
+    ws.onclose = () => handlers.onClose && handlers.onClose();
+    return ws;
+}
+
 async function actionContainer(id, action) {
     try {
-        const res = await fetch(`/api/containers/${id}/action`, {
+        const res = await fetch(`/api/containers/${id}/action?background=true`, {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({ action: action })
         });
         const result = await res.json();
         if (result.success) {
-            showToast(`Container ${action} successful`, 'success', 3000);
+            showToast(`Container ${action} requested`, 'info', 2000);
+            watchJob(result.data.id, {
+                onDone: (job) => {
+                    if (job.status === 'succeeded') {
+                        showToast(`Container ${action} successful`, 'success', 3000);
+                    } else {
+                        showToast(`Action failed: ${job.error}`, 'error');
+                    }
+                }
+            });
         } else {
             console.error(result.message);
             showToast(`Action failed: ${result.message}`, 'error');
@@ -477,5 +601,6 @@ function formatBytes(bytes, decimals = 2) {
 }
 
 // Init
+document.addEventListener('DOMContentLoaded', applyInitialDashboard);
 document.addEventListener('DOMContentLoaded', connectWebSocket);
 
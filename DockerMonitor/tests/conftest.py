@@ -73,7 +73,11 @@ def mock_container_service():
     }
     with patch("services.container_service.list_containers", return_value=mock_containers), \
          patch("services.container_service.perform_action", return_value=True), \
-         patch("services.container_service.get_logs", return_value="test log output"), \
+         patch("services.log_service.read_logs", return_value={
+             "lines": [{"ts": "2026-01-01T00:00:00Z", "stream": "stdout", "line": "test log output"}],
+             "cursor": "2026-01-01T00:00:00Z",
+             "source": "daemon",
+         }), \
          patch("services.container_service.inspect_container", return_value=mock_inspect):
         yield mock_containers
 
@@ -91,13 +95,20 @@ def mock_image_service():
             "created": "2026-01-01",
         },
     ]
+    mock_pull = MagicMock()
+    mock_pull.snapshot.return_value = {
+        "id": "job123",
+        "kind": "image_pull",
+        "target": "nginx:latest",
+        "status": "queued",
+        "progress": None,
+        "detail": {},
+        "result": None,
+        "error": None,
+    }
     with patch("services.image_service.list_images", return_value=mock_images), \
          patch("services.image_service.remove_image", return_value=True), \
-         patch("services.image_service.pull_image", return_value={
-             "id": "sha256:abc123",
-             "tags": ["nginx:latest"],
-             "size": "142.00 MB",
-         }):
+         patch("services.image_service.start_pull", return_value=mock_pull):
         yield mock_images
 
 
@@ -47,6 +47,7 @@ async def test_container_logs(client, mock_container_service):
     data = resp.json()
     assert data["success"] is True
     assert "logs" in data["data"]
+    assert data["data"]["cursor"] == "2026-01-01T00:00:00Z"
 
 
 @pytest.mark.asyncio
@@ -85,15 +86,16 @@ async def test_list_images(client, mock_image_service):
 
 @pytest.mark.asyncio
 async def test_pull_image(client, mock_image_service):
-    """POST /api/images/pull — 이미지 Pull"""
+    """POST /api/images/pull — 이미지 Pull (백그라운드 시작 → 202)"""
     resp = await client.post(
         "/api/images/pull",
         json={"image": "nginx:latest"}
     )
-    assert resp.status_code == 200
+    assert resp.status_code == 202
     data = resp.json()
     assert data["success"] is True
-    assert "tags" in data["data"]
+    assert data["data"]["id"] == "job123"
+    assert data["data"]["target"] == "nginx:latest"
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,142 @@
+"""
+인증 미들웨어 테스트 (순수 ASGI - HTTP / WebSocket / 스트리밍)
+"""
+import asyncio
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route, WebSocketRoute
+
+from core.auth import hash_email
+from core.config import settings
+from middleware.auth_middleware import AuthMiddleware
+
+# 스트리밍 응답의 첫 청크가 끝나기 전에 전달되는지 확인하기 위한 이벤트
+_release = None
+
+
+async def _home(request):
+    return PlainTextResponse("ok")
+
+
+async def _stream(request):
+    async def body():
+        yield b"first\n"
+        await _release.wait()
+        yield b"second\n"
+    return StreamingResponse(body())
+
+
+async def _ws(websocket):
+    await websocket.accept()
+    await websocket.send_text("hello")
+    await websocket.close()
+
+
+@pytest.fixture
+def app():
+    inner = Starlette(routes=[
+        Route("/", _home),
+        Route("/stream", _stream),
+        Route("/static/app.js", _home),
+        WebSocketRoute("/ws/test", _ws),
+    ])
+    return AuthMiddleware(inner)
+
+
+@pytest.fixture
+def emails(monkeypatch):
+    monkeypatch.setattr(settings, "allowed_emails", "a@example.com, b@example.com")
+    return ["a@example.com", "b@example.com"]
+
+
+async def test_http_requires_valid_session(app, emails):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        res = await ac.get("/")
+        assert res.status_code == 302 and res.headers["location"] == "/login"
+
+        ac.cookies.set("docker_auth", "forged")
+        assert (await ac.get("/")).status_code == 302
+
+        ac.cookies.set("docker_auth", hash_email(emails[1]))
+        res = await ac.get("/")
+        assert res.status_code == 200 and res.text == "ok"
+
+        ac.cookies.clear()
+        assert (await ac.get("/static/app.js")).status_code == 200  # 공개 경로
+
+
+async def test_session_set_follows_settings_changes(app, emails, monkeypatch):
+    token = hash_email(emails[0])
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test", cookies={"docker_auth": token}) as ac:
+        assert (await ac.get("/")).status_code == 200
+        monkeypatch.setattr(settings, "allowed_emails", "b@example.com")
+        assert (await ac.get("/")).status_code == 302
+        monkeypatch.setattr(settings, "allowed_emails", "a@example.com")
+        monkeypatch.setattr(settings, "docker_token_secret", "rotated")
+        assert (await ac.get("/")).status_code == 302  # 비밀 키가 바뀌면 기존 토큰 무효
+
+
+async def test_streaming_response_is_not_buffered(app, emails):
+    """첫 청크는 제너레이터가 끝나기 전에 클라이언트로 전달되어야 함"""
+    global _release
+    _release = asyncio.Event()
+    sent = []
+    done = asyncio.Event()
+
+    async def receive():
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message.get("body"):
+            sent.append(message["body"])
+
+    scope = {
+        "type": "http", "method": "GET", "path": "/stream", "raw_path": b"/stream", "query_string": b"",
+        "headers": [(b"cookie", f"docker_auth={hash_email(emails[0])}".encode())],
+        "root_path": "", "scheme": "http", "server": ("test", 80), "http_version": "1.1",
+    }
+    task = asyncio.create_task(app(scope, receive, send))
+    for _ in range(100):
+        if sent:
+            break
+        await asyncio.sleep(0.01)
+    assert sent == [b"first\n"]
+    _release.set()
+    await asyncio.wait_for(task, timeout=2)
+    done.set()
+    assert sent == [b"first\n", b"second\n"]
+
+
+async def _ws_handshake(app, cookie=None):
+    """WebSocket 핸드셰이크 - 서버가 보낸 ASGI 메시지 목록"""
+    sent = []
+    incoming = [{"type": "websocket.connect"}, {"type": "websocket.disconnect", "code": 1000}]
+
+    async def receive():
+        return incoming.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    headers = [(b"cookie", f"docker_auth={cookie}".encode())] if cookie else []
+    scope = {
+        "type": "websocket", "path": "/ws/test", "raw_path": b"/ws/test", "query_string": b"",
+        "headers": headers, "root_path": "", "scheme": "ws", "server": ("test", 80), "subprotocols": [],
+    }
+    await app(scope, receive, send)
+    return sent
+
+
+async def test_websocket_handshake_requires_session(app, emails):
+    sent = await _ws_handshake(app)
+    assert sent == [{"type": "websocket.close", "code": 1008, "reason": ""}]
+
+    sent = await _ws_handshake(app, hash_email(emails[0]))
+    assert [m["type"] for m in sent][:2] == ["websocket.accept", "websocket.send"]
+    assert sent[1]["text"] == "hello"
@@ -0,0 +1,74 @@
+"""
+BaseService single-flight 테스트
+"""
+import asyncio
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from services.base_service import BaseService
+
+
+def _make_service() -> BaseService:
+    svc = BaseService()
+    svc.set_client(MagicMock(), ThreadPoolExecutor(max_workers=4))
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_run_shared_coalesces_concurrent_calls():
+    """동시에 들어온 동일 호출은 한 번만 실행"""
+    svc = _make_service()
+    calls = []
+    lock = threading.Lock()
+
+    def slow_read(container_id):
+        with lock:
+            calls.append(container_id)
+        time.sleep(0.05)
+        return {"id": container_id}
+
+    results = await asyncio.gather(*[svc.run_shared(slow_read, "abc") for _ in range(5)])
+    assert len(calls) == 1
+    assert all(r == {"id": "abc"} for r in results)
+    assert svc._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_run_shared_separates_by_arguments():
+    """인자가 다르면 별도 호출"""
+    svc = _make_service()
+    calls = []
+
+    def read(container_id):
+        calls.append(container_id)
+        time.sleep(0.01)
+        return container_id
+
+    results = await asyncio.gather(svc.run_shared(read, "a"), svc.run_shared(read, "b"))
+    assert sorted(calls) == ["a", "b"]
+    assert results == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_run_shared_propagates_exception_and_releases_key():
+    """예외는 모든 대기자에게 전달되고, 이후 호출은 새로 실행"""
+    svc = _make_service()
+    calls = []
+
+    def failing():
+        calls.append(1)
+        time.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        svc.run_shared(failing), svc.run_shared(failing), return_exceptions=True
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+    assert len(calls) == 1
+
+    with pytest.raises(ValueError):
+        await svc.run_shared(failing)
+    assert len(calls) == 2
@@ -0,0 +1,105 @@
+"""
+일괄 exec 테스트 (socketpair로 다중화된 exec 출력 대체)
+"""
+import socket
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from services.exec_service import ExecService
+
+
+def _frame(stream: int, data: bytes) -> bytes:
+    return struct.pack(">BxxxL", stream, len(data)) + data
+
+
+@pytest.fixture
+def service():
+    """컨테이너별 출력/종료 코드를 정의하는 가짜 Docker 클라이언트"""
+    scripts = {
+        "web1": ([(1, b"ID=alpine\n"), (2, "경고\n".encode()[:4]), (2, "경고\n".encode()[4:])], 0),
+        "web2": ([(1, b"ID=debian\n")], 1),
+    }
+    exec_ids = {}
+
+    client = MagicMock()
+
+    def exec_create(container_id, **kwargs):
+        if container_id not in scripts:
+            raise RuntimeError(f"No such container: {container_id}")
+        exec_ids[f"exec-{container_id}"] = container_id
+        return {"Id": f"exec-{container_id}"}
+
+    def exec_start(exec_id, **kwargs):
+        ours, theirs = socket.socketpair()
+        frames, _ = scripts[exec_ids[exec_id]]
+        theirs.sendall(b"".join(_frame(s, d) for s, d in frames))
+        theirs.close()
+        return ours
+
+    client.api.exec_create.side_effect = exec_create
+    client.api.exec_start.side_effect = exec_start
+    client.api.exec_inspect.side_effect = lambda exec_id: {"ExitCode": scripts[exec_ids[exec_id]][1]}
+    client.ping.return_value = True
+
+    svc = ExecService()
+    pool = ThreadPoolExecutor(4)
+    svc.set_client(client, pool, mutation_executor=pool, stream_executor=pool)
+    yield svc
+    pool.shutdown(wait=False)
+
+
+async def _collect(svc, targets, **kwargs):
+    return [e async for e in svc.run_batch(targets, "cat /etc/os-release", **kwargs)]
+
+
+async def test_batch_streams_tagged_output_and_summary(service):
+    targets = [{"id": c, "name": c} for c in ("web1", "web2", "gone")]
+    events = await _collect(service, targets, parallelism=2)
+
+    output = {}
+    for e in events:
+        if e["type"] == "output":
+            output.setdefault((e["id"], e["stream"]), "")
+            output[(e["id"], e["stream"])] += e["data"]
+    assert output[("web1", "stdout")] == "ID=alpine\n"
+    assert output[("web1", "stderr")] == "경고\n"  # 프레임 경계에서 잘린 UTF-8도 복원
+    assert output[("web2", "stdout")] == "ID=debian\n"
+
+    exits = {e["id"]: e for e in events if e["type"] == "exit"}
+    assert exits["web1"]["exit_code"] == 0
+    assert exits["web2"]["exit_code"] == 1
+    assert "No such container" in exits["gone"]["error"]
+    assert events[-1] == {"type": "done", "total": 3, "succeeded": 1, "failed": 2}
+
+    # 컨테이너별 이벤트 순서: start → output... → exit
+    web1 = [e["type"] for e in events if e.get("id") == "web1"]
+    assert web1[0] == "start" and web1[-1] == "exit"
+    cmd = service.client.api.exec_create.call_args_list[0].kwargs["cmd"]
+    assert cmd == ["/bin/sh", "-c", "cat /etc/os-release"]
+
+
+async def test_batch_timeout_marks_only_slow_container(service):
+    """출력이 끝나지 않는 컨테이너만 타임아웃으로 실패"""
+    hold = []
+
+    def exec_start(exec_id, **kwargs):
+        ours, theirs = socket.socketpair()
+        if exec_id == "exec-web1":
+            hold.append(theirs)  # 닫지 않음 → 계속 실행 중
+            theirs.sendall(_frame(1, b"partial\n"))
+        else:
+            theirs.sendall(_frame(1, b"ok\n"))
+            theirs.close()
+        return ours
+
+    service.client.api.exec_start.side_effect = exec_start
+    events = await _collect(service, [{"id": c, "name": c} for c in ("web1", "web2")], timeout=0.3)
+    exits = {e["id"]: e for e in events if e["type"] == "exit"}
+    assert "Timed out" in exits["web1"]["error"]
+    assert exits["web2"]["error"] is None
+    assert any(e["type"] == "output" and e["data"] == "partial\n" for e in events)
+    for s in hold:
+        s.close()
@@ -0,0 +1,85 @@
+"""
+컨테이너 일괄 액션 테스트
+"""
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from services.container_service import ContainerService
+from core.exceptions import ContainerNotFoundError
+
+
+@pytest.mark.asyncio
+async def test_bulk_action_isolates_failures():
+    """컨테이너별 실패는 해당 항목에만 기록"""
+    svc = ContainerService()
+
+    async def fake_action(container_id, action):
+        if container_id == "missing":
+            raise ContainerNotFoundError(container_id)
+        return True
+
+    targets = [{"id": cid, "name": cid} for cid in ["a", "missing", "b"]]
+    with patch.object(svc, "perform_action", side_effect=fake_action):
+        result = await svc.bulk_action(targets, "restart")
+
+    assert result["total"] == 3
+    assert result["succeeded"] == 2
+    assert result["failed"] == 1
+    failed = [r for r in result["results"] if not r["success"]]
+    assert failed[0]["id"] == "missing"
+    assert "missing" in failed[0]["error"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_action_respects_parallelism_and_timeout():
+    """병렬도 상한과 컨테이너별 타임아웃 적용"""
+    svc = ContainerService()
+    running = 0
+    peak = 0
+
+    async def fake_action(container_id, action):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            await asyncio.sleep(1 if container_id == "slow" else 0.01)
+        finally:
+            running -= 1
+        return True
+
+    targets = [{"id": cid, "name": cid} for cid in ["a", "b", "c", "d", "slow"]]
+    with patch.object(svc, "perform_action", side_effect=fake_action):
+        result = await svc.bulk_action(targets, "stop", parallelism=2, timeout=0.2)
+
+    assert peak <= 2
+    slow = next(r for r in result["results"] if r["id"] == "slow")
+    assert slow["success"] is False and slow["timed_out"] is True
+    assert "still running" in slow["error"]
+    assert result["succeeded"] == 4
+    assert result["timed_out"] == 1 and result["failed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_action_timeout_does_not_cancel_action():
+    """타임아웃은 대기만 멈추고 액션은 끝까지 실행됨"""
+    svc = ContainerService()
+    completed = asyncio.Event()
+
+    async def fake_action(container_id, action):
+        await asyncio.sleep(0.2)
+        completed.set()
+        return True
+
+    with patch.object(svc, "perform_action", side_effect=fake_action):
+        result = await svc.bulk_action([{"id": "a", "name": "a"}], "restart", timeout=0.05)
+        assert result["results"][0]["timed_out"] is True
+        await asyncio.wait_for(completed.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_resolve_targets_by_ids_deduplicates():
+    """id 목록은 순서를 유지하며 중복 제거"""
+    svc = ContainerService()
+    targets = await svc.resolve_targets(ids=["a", "b", "a"])
+    assert [t["id"] for t in targets] == ["a", "b"]
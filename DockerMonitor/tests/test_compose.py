@@ -0,0 +1,130 @@
+"""
+Compose 프로젝트 조회 테스트 (컨테이너 라벨 기반)
+"""
+import asyncio
+import os
+import sys
+import textwrap
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.compose_service import ComposeService
+
+
+def _container(name, project, service, state, config="/srv/app/docker-compose.yml", ports=None, oneoff="False"):
+    return {
+        "Names": [f"/{name}"],
+        "Image": f"{service}:latest",
+        "State": state,
+        "Status": "Up 2 hours" if state == "running" else "Exited (0) 1 hour ago",
+        "Ports": ports or [],
+        "Labels": {
+            "com.docker.compose.project": project,
+            "com.docker.compose.service": service,
+            "com.docker.compose.project.config_files": config,
+            "com.docker.compose.oneoff": oneoff,
+        },
+    }
+
+
+@pytest.fixture
+def compose():
+    container_service = MagicMock()
+    container_service.list_compose_containers = AsyncMock(return_value=[
+        _container("app-web-1", "app", "web", "running",
+                   ports=[{"IP": "0.0.0.0", "PrivatePort": 80, "PublicPort": 8080, "Type": "tcp"}]),
+        _container("app-db-1", "app", "db", "exited"),
+        _container("app-web-run-1", "app", "web", "running", oneoff="True"),
+        _container("mon-grafana-1", "mon", "grafana", "running", config="/srv/mon/compose.yml"),
+    ])
+    return ComposeService(container_service)
+
+
+async def test_list_projects_from_labels(compose):
+    projects = await compose.list_projects()
+    assert projects == [
+        {"name": "app", "status": "exited(1), running(1)", "config_files": "/srv/app/docker-compose.yml"},
+        {"name": "mon", "status": "running(1)", "config_files": "/srv/mon/compose.yml"},
+    ]
+
+
+async def test_project_services_by_config_file_or_name(compose):
+    services = await compose.get_project_services(config_file="/srv/app/docker-compose.yml")
+    assert [s["name"] for s in services] == ["app-db-1", "app-web-1"]  # oneoff 제외
+    web = services[1]
+    assert web["state"] == "running"
+    assert web["ports"] == [{"URL": "0.0.0.0", "TargetPort": 80, "PublishedPort": 8080, "Protocol": "tcp"}]
+
+    services = await compose.get_project_services(project="mon")
+    assert [s["service"] for s in services] == ["grafana"]
+
+
+# ---- 변경 액션 실행 (CLI 대신 파이썬 스크립트) ----
+
+def _script(compose, code: str):
+    compose.COMMAND = [sys.executable, "-c", textwrap.dedent(code)]
+
+
+async def test_action_output_streams_line_by_line(compose):
+    _script(compose, r"""
+        import sys, time
+        sys.stdout.write("Pulling web\n"); sys.stdout.flush()
+        time.sleep(0.3)
+        sys.stderr.write("10%\r50%\r100%\n")
+        sys.exit(0)
+    """)
+    lines = []
+    task = asyncio.create_task(compose.project_action("/srv/app/docker-compose.yml", "pull", on_line=lines.append))
+    await asyncio.sleep(0.2)
+    assert lines == ["Pulling web"]  # 프로세스가 끝나기 전에 전달됨
+    result = await task
+    assert result["success"]
+    assert lines == ["Pulling web", "10%", "50%", "100%"]
+
+
+async def test_same_project_actions_are_serialized(compose):
+    _script(compose, r"""
+        import sys, time
+        print("start", flush=True); time.sleep(0.2); print("end", flush=True)
+    """)
+    lines = []
+    await asyncio.gather(
+        compose.project_action("/a.yml", "up", on_line=lines.append),
+        compose.project_action("/a.yml", "down", on_line=lines.append),
+    )
+    assert lines == ["start", "end", "start", "end"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="프로세스 그룹은 POSIX 전용")
+async def test_cancel_kills_process_group(compose):
+    _script(compose, r"""
+        import subprocess, sys, time
+        child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        print(child.pid, flush=True)
+        time.sleep(60)
+    """)
+    lines = []
+    task = asyncio.create_task(compose.project_action("/a.yml", "up", on_line=lines.append))
+    for _ in range(100):
+        if lines:
+            break
+        await asyncio.sleep(0.05)
+    child_pid = int(lines[0])
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    def _alive(pid):
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                return f.read().split()[2] != "Z"
+        except FileNotFoundError:
+            return False
+
+    for _ in range(50):
+        if not _alive(child_pid):
+            break
+        await asyncio.sleep(0.05)
+    assert not _alive(child_pid)
+    assert not compose._project_lock("/a.yml").locked()
@@ -0,0 +1,244 @@
+"""
+Compose 파일 파싱 캐시 / 의존성 그래프 테스트
+"""
+import asyncio
+import os
+import sys
+import textwrap
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.exceptions import ComposeFileError
+from services.compose_file import ComposeFileCache, dependency_layers, parse_compose
+from services.compose_service import ComposeService
+
+COMPOSE_YAML = textwrap.dedent("""
+    services:
+      web:
+        image: nginx
+        depends_on:
+          api:
+            condition: service_healthy
+        networks: [front]
+      api:
+        build: .
+        depends_on: [db, cache]
+        networks:
+          front: {}
+          back: {}
+        volumes:
+          - ./src:/app
+          - uploads:/data
+      db:
+        image: postgres
+        healthcheck:
+          test: ["CMD", "pg_isready"]
+        volumes:
+          - type: volume
+            source: pgdata
+            target: /var/lib/postgresql/data
+      cache:
+        image: redis
+    networks:
+      front:
+      back:
+    volumes:
+      pgdata:
+      uploads:
+""")
+
+
+def _write(path, text):
+    path.write_text(text)
+    return str(path)
+
+
+def test_parse_dependency_forms_and_layers():
+    import yaml
+    model = parse_compose([yaml.safe_load(COMPOSE_YAML)])
+    services = model["services"]
+    assert services["web"]["depends_on"] == {"api": "service_healthy"}
+    assert services["api"]["depends_on"] == {"db": "service_started", "cache": "service_started"}
+    assert services["api"]["networks"] == ["front", "back"]
+    assert services["api"]["volumes"] == ["uploads"]  # 바인드 마운트 제외
+    assert services["db"]["volumes"] == ["pgdata"]
+    assert services["db"]["networks"] == ["default"]
+    assert services["db"]["healthcheck"] and not services["cache"]["healthcheck"]
+    assert model["layers"] == [["cache", "db"], ["api"], ["web"]]
+    assert model["networks"] == ["front", "back"]
+
+
+def test_override_file_merges_services():
+    base = {"services": {"web": {"image": "nginx"}, "db": {"image": "postgres"}}}
+    override = {"services": {"web": {"depends_on": ["db"]}}}
+    model = parse_compose([base, override])
+    assert model["services"]["web"]["image"] == "nginx"
+    assert model["layers"] == [["db"], ["web"]]
+
+
+def test_cycle_and_unknown_dependency_are_errors():
+    with pytest.raises(ComposeFileError, match="순환"):
+        dependency_layers({"a": ["b"], "b": ["a"], "c": []})
+    with pytest.raises(ComposeFileError, match="missing"):
+        parse_compose([{"services": {"a": {"depends_on": ["missing"]}}}])
+
+
+async def test_cache_parses_once_until_file_changes(tmp_path):
+    path = _write(tmp_path / "docker-compose.yml", COMPOSE_YAML)
+    cache = ComposeFileCache()
+    try:
+        first = await cache.get(path)
+        assert await cache.get(path) is first
+        assert cache.parse_count == 1
+
+        # mtime 해상도와 무관하게 변경이 감지되어야 함
+        _write(tmp_path / "docker-compose.yml", "services:\n  solo:\n    image: busybox\n")
+        os.utime(path, (1, 1))
+        for _ in range(50):
+            model = await cache.get(path)
+            if model is not first:
+                break
+            await asyncio.sleep(0.01)
+        assert list(model["services"]) == ["solo"]
+        assert cache.parse_count == 2
+    finally:
+        cache.clear()
+
+
+async def test_cache_evicts_least_recently_used_and_closes_watches(tmp_path, monkeypatch):
+    """캐시 크기를 넘으면 가장 오래 쓰지 않은 항목을 제거하고 그 inotify 감시를 닫음"""
+    monkeypatch.setattr("services.compose_file.settings.compose_file_cache_size", 2)
+    paths = [_write(tmp_path / f"c{i}.yml", COMPOSE_YAML) for i in range(3)]
+    cache = ComposeFileCache()
+    try:
+        await cache.get(paths[0])
+        await cache.get(paths[1])
+        first = cache._entries[(paths[0],)]
+        await cache.get(paths[0])  # 최근 사용 → paths[1]이 가장 오래됨
+        second = cache._entries[(paths[1],)]
+        fds = [w.fd for w in second.watches]
+        await cache.get(paths[2])
+        assert list(cache._entries) == [(paths[0],), (paths[2],)]
+        assert cache._entries[(paths[0],)] is first
+        assert second.watches == []
+        for fd in fds:
+            with pytest.raises(OSError):
+                os.fstat(fd)
+    finally:
+        cache.clear()
+
+
+async def test_cache_missing_and_invalid_files(tmp_path):
+    cache = ComposeFileCache()
+    with pytest.raises(ComposeFileError, match="찾을 수 없습니다"):
+        await cache.get(str(tmp_path / "nope.yml"))
+    bad = _write(tmp_path / "bad.yml", "services: [\n")
+    with pytest.raises(ComposeFileError, match="파싱"):
+        await cache.get(bad)
+
+
+async def test_graph_by_project_name(tmp_path):
+    path = _write(tmp_path / "docker-compose.yml", COMPOSE_YAML)
+    container_service = MagicMock()
+    container_service.list_compose_containers = AsyncMock(return_value=[{
+        "Names": ["/app-db-1"],
+        "Image": "postgres",
+        "State": "running",
+        "Status": "Up 1 minute (healthy)",
+        "Labels": {
+            "com.docker.compose.project": "app",
+            "com.docker.compose.service": "db",
+            "com.docker.compose.project.config_files": path,
+        },
+    }])
+    compose = ComposeService(container_service)
+    try:
+        graph = await compose.get_graph(project="app")
+    finally:
+        compose.files.clear()
+
+    assert graph["config_file"] == path
+    assert {"from": "web", "to": "api", "condition": "service_healthy"} in graph["edges"]
+    db = next(n for n in graph["services"] if n["name"] == "db")
+    assert db["containers"] == [{"name": "app-db-1", "state": "running", "status": "Up 1 minute (healthy)"}]
+    assert graph["layers"][0] == ["cache", "db"]
+
+    with pytest.raises(ComposeFileError):
+        await compose.get_graph(project="unknown")
+
+
+class _FakeContainers:
+    """재시작 후 상태 전이를 흉내 - 컨테이너별로 get_state가 순서대로 반환할 상태 목록"""
+
+    def __init__(self, containers, states):
+        self.containers = containers
+        self.states = states
+        self.order = []
+        self.list_compose_containers = AsyncMock(return_value=containers)
+
+    async def perform_action(self, container_id, action):
+        self.order.append(container_id)
+        await asyncio.sleep(0.01)
+        return True
+
+    async def get_state(self, container_id):
+        seq = self.states.get(container_id, [{"status": "running", "health": None}])
+        state = seq.pop(0) if len(seq) > 1 else seq[0]
+        return {"exit_code": 0, **state}
+
+
+def _labelled(path, service, index=1):
+    return {
+        "Names": [f"/app-{service}-{index}"],
+        "State": "running",
+        "Labels": {
+            "com.docker.compose.project": "app",
+            "com.docker.compose.service": service,
+            "com.docker.compose.project.config_files": path,
+        },
+    }
+
+
+async def test_rolling_restart_follows_layers_and_waits_for_health(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys.modules["services.compose_service"], "_READY_POLL_SECONDS", 0)
+    path = _write(tmp_path / "docker-compose.yml", COMPOSE_YAML)
+    fake = _FakeContainers(
+        [_labelled(path, "db"), _labelled(path, "cache"), _labelled(path, "api"),
+         _labelled(path, "api", 2), _labelled(path, "web")],
+        {"app-db-1": [{"status": "running", "health": "starting"}] * 3 + [{"status": "running", "health": "healthy"}]},
+    )
+    compose = ComposeService(fake)
+    try:
+        report = await compose.rolling_restart(path, parallelism=2)
+    finally:
+        compose.files.clear()
+
+    # 단계 순서: {cache, db} → api(레플리카 하나씩) → web
+    assert set(fake.order[:2]) == {"app-cache-1", "app-db-1"}
+    assert fake.order[2:] == ["app-api-1", "app-api-2", "app-web-1"]
+    assert report["restarted"] == 4 and report["failed"] == 0
+    db = next(r for r in report["services"] if r["service"] == "db")
+    assert db["containers"][0]["health"] == "healthy"
+    assert db["downtime_ms"] > 0
+    api = next(r for r in report["services"] if r["service"] == "api")
+    assert [c["name"] for c in api["containers"]] == ["app-api-1", "app-api-2"]
+
+
+async def test_rolling_restart_stops_after_unready_service(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys.modules["services.compose_service"], "_READY_POLL_SECONDS", 0)
+    path = _write(tmp_path / "docker-compose.yml", COMPOSE_YAML)
+    fake = _FakeContainers(
+        [_labelled(path, "db"), _labelled(path, "api"), _labelled(path, "web")],
+        {"app-db-1": [{"status": "running", "health": "starting"}]},
+    )
+    compose = ComposeService(fake)
+    try:
+        report = await compose.rolling_restart(path, ready_timeout=0.05)
+    finally:
+        compose.files.clear()
+
+    status = {r["service"]: r["status"] for r in report["services"]}
+    assert status == {"cache": "skipped", "db": "failed", "api": "skipped", "web": "skipped"}
+    assert "not ready" in report["services"][1]["containers"][0]["error"]
+    assert fake.order == ["app-db-1"]
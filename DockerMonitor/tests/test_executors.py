@@ -0,0 +1,86 @@
+"""
+lane별 Executor 풀 테스트
+"""
+import threading
+import pytest
+
+from core.executors import LaneExecutor
+from core.exceptions import ExecutorSaturatedError
+
+
+def test_lane_executor_rejects_when_queue_full():
+    """워커 + 대기열 상한을 넘는 제출은 거부"""
+    ex = LaneExecutor("test", max_workers=1, queue_limit=1)
+    gate = threading.Event()
+    try:
+        f1 = ex.submit(gate.wait)
+        f2 = ex.submit(gate.wait)
+        assert ex.available() == 0
+        with pytest.raises(ExecutorSaturatedError):
+            ex.submit(gate.wait)
+
+        metrics = ex.metrics()
+        assert metrics["rejected"] == 1
+        assert metrics["submitted"] == 2
+        assert metrics["queued"] + metrics["active"] == 2
+    finally:
+        gate.set()
+        f1.result(timeout=1)
+        f2.result(timeout=1)
+        ex.shutdown(wait=True)
+
+    metrics = ex.metrics()
+    assert metrics["completed"] == 2
+    assert metrics["active"] == 0
+    assert metrics["queued"] == 0
+
+
+def test_lane_executor_counts_failures():
+    """실패한 작업도 완료로 집계되고 failed 카운트 증가"""
+    ex = LaneExecutor("test", max_workers=1, queue_limit=0)
+
+    def boom():
+        raise RuntimeError("boom")
+
+    future = ex.submit(boom)
+    with pytest.raises(RuntimeError):
+        future.result(timeout=1)
+    ex.shutdown(wait=True)
+
+    metrics = ex.metrics()
+    assert metrics["failed"] == 1
+    assert metrics["completed"] == 1
+    # 완료 후에는 다시 제출 가능해야 하는 상태
+    assert metrics["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_list_methods_propagate_saturation():
+    """read lane 포화는 빈 목록이 아니라 ExecutorSaturatedError(503)로 전달"""
+    from unittest.mock import MagicMock
+    from services.container_service import ContainerService
+    from services.image_service import ImageService
+    from services.network_service import NetworkService
+
+    ex = LaneExecutor("read", max_workers=1, queue_limit=0)
+    gate = threading.Event()
+    blocker = ex.submit(gate.wait)
+    try:
+        for cls, method in (
+            (ContainerService, "list_containers"),
+            (ContainerService, "get_stats"),
+            (ImageService, "list_images"),
+            (NetworkService, "list_networks"),
+        ):
+            svc = cls()
+            svc.set_client(MagicMock(), ex)
+            with pytest.raises(ExecutorSaturatedError):
+                await getattr(svc, method)()
+        svc = ContainerService()
+        svc.set_client(MagicMock(), ex)
+        with pytest.raises(ExecutorSaturatedError):
+            await svc.get_container_stats("abc")
+    finally:
+        gate.set()
+        blocker.result(timeout=1)
+        ex.shutdown(wait=True)
@@ -0,0 +1,103 @@
+"""
+이미지 Pull 스트리밍/중복 제거 테스트
+"""
+import asyncio
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from core.jobs import JobManager
+from services.image_service import ImageService
+from routers.images import _split_image
+
+
+@pytest.fixture(autouse=True)
+def fresh_job_manager():
+    with patch("services.image_service.job_manager", JobManager()):
+        yield
+
+
+def _make_service(events, gate: threading.Event = None):
+    client = MagicMock()
+
+    def fake_pull(repository, tag=None, stream=False, decode=False):
+        if gate:
+            gate.wait(timeout=2)
+        yield from events
+
+    client.api.pull.side_effect = fake_pull
+    image = MagicMock()
+    image.short_id = "sha256:abc"
+    image.tags = ["nginx:latest"]
+    image.attrs = {"Size": 1024 * 1024}
+    client.images.get.return_value = image
+
+    svc = ImageService()
+    ex = ThreadPoolExecutor(max_workers=2)
+    svc.set_client(client, ex, long_executor=ex)
+    return svc, client
+
+
+@pytest.mark.asyncio
+async def test_pull_streams_layer_progress():
+    """레이어 진행 이벤트가 구독자에게 전달되고 완료 이벤트로 끝남"""
+    events = [
+        {"status": "Pulling fs layer", "id": "l1"},
+        {"status": "Downloading", "id": "l1", "progressDetail": {"current": 50, "total": 100}},
+        {"status": "Pull complete", "id": "l1"},
+    ]
+    gate = threading.Event()
+    svc, _ = _make_service(events, gate)
+
+    job = svc.start_pull("nginx", "latest")
+    queue = job.subscribe()
+    gate.set()
+    await job.task
+
+    messages = []
+    while not queue.empty():
+        messages.append(queue.get_nowait())
+    progress = [m for m in messages if m["type"] == "job_progress"]
+    assert len(progress) == 3
+    assert progress[1]["progress"] == 50.0
+    assert progress[1]["layer"] == "l1"
+    assert messages[-1]["type"] == "job_done"
+    assert job.status == "succeeded"
+    assert job.detail["layers"]["l1"]["status"] == "Pull complete"
+    assert job.result["tags"] == ["nginx:latest"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_pulls_of_same_image_are_deduplicated():
+    """같은 repo:tag 요청은 진행 중인 Pull 하나에 합류"""
+    gate = threading.Event()
+    svc, client = _make_service([{"status": "Downloading", "id": "l1"}], gate)
+
+    first = svc.start_pull("nginx", "latest")
+    second = svc.start_pull("nginx", "latest")
+    other = svc.start_pull("redis", "7")
+    assert first is second
+    assert other is not first
+
+    gate.set()
+    await asyncio.gather(first.task, other.task)
+    assert client.api.pull.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_pull_error_event_marks_failed():
+    """스트림의 error 이벤트는 Pull 실패로 기록"""
+    svc, _ = _make_service([{"error": "manifest unknown"}])
+    job = svc.start_pull("nginx", "nope")
+    await job.task
+    assert job.status == "failed"
+    assert "manifest unknown" in job.error
+
+
+def test_split_image():
+    """이미지 문자열 파싱 - 레지스트리 포트는 태그로 취급하지 않음"""
+    assert _split_image("nginx") == ("nginx", "latest")
+    assert _split_image("nginx:1.25") == ("nginx", "1.25")
+    assert _split_image("registry:5000/app") == ("registry:5000/app", "latest")
+    assert _split_image("registry:5000/app:v1") == ("registry:5000/app", "v1")
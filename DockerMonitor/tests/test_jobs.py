@@ -0,0 +1,164 @@
+"""
+백그라운드 Job 매니저 테스트
+"""
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from core.jobs import JobManager
+
+
+@pytest.mark.asyncio
+async def test_job_success_records_result_and_logs():
+    """성공한 Job은 결과와 로그를 보관"""
+    jm = JobManager()
+
+    async def work(job):
+        job.log("step 1")
+        job.set_progress(50, message="half")
+        return {"ok": True}
+
+    job = jm.submit("test", "target", work)
+    assert job.status == "queued"
+    await job.task
+
+    assert job.status == "succeeded"
+    assert job.result == {"ok": True}
+    assert job.progress == 100.0
+    assert list(job.logs) == ["step 1"]
+    assert jm.get(job.id) is job
+
+
+@pytest.mark.asyncio
+async def test_job_failure_is_recorded():
+    """예외는 failed 상태와 에러 메시지로 기록"""
+    jm = JobManager()
+
+    async def work(job):
+        raise RuntimeError("daemon exploded")
+
+    job = jm.submit("test", "target", work)
+    await job.task
+    assert job.status == "failed"
+    assert job.error == "daemon exploded"
+
+
+@pytest.mark.asyncio
+async def test_job_dedup_by_key_until_finished():
+    """같은 key의 Job은 진행 중일 때만 공유"""
+    jm = JobManager()
+    gate = asyncio.Event()
+
+    async def work(job):
+        await gate.wait()
+
+    first = jm.submit("test", "t", work, key="k")
+    assert jm.submit("test", "t", work, key="k") is first
+
+    gate.set()
+    await first.task
+    second = jm.submit("test", "t", work, key="k")
+    assert second is not first
+    await second.task
+
+
+@pytest.mark.asyncio
+async def test_job_cancel():
+    """실행 중/대기 중인 Job 취소"""
+    jm = JobManager()
+
+    async def work(job):
+        await asyncio.sleep(10)
+
+    running = jm.submit("test", "t", work, key="k")
+    await asyncio.sleep(0)
+    queued = jm.submit("test", "t2", work)
+    assert jm.cancel(queued.id) is True
+    assert jm.cancel(running.id) is True
+    await asyncio.gather(running.task, queued.task, return_exceptions=True)
+
+    assert running.status == "cancelled"
+    assert queued.status == "cancelled"
+    assert jm.find_active("k") is None
+    assert jm.cancel(running.id) is False
+
+
+@pytest.mark.asyncio
+async def test_job_subscriber_receives_done_event():
+    """구독자는 로그와 job_done 이벤트를 받음"""
+    jm = JobManager()
+
+    async def work(job):
+        job.log("hello")
+
+    job = jm.submit("test", "t", work)
+    queue = job.subscribe()
+    await job.task
+
+    types = []
+    while not queue.empty():
+        types.append(queue.get_nowait()["type"])
+    assert types == ["job_state", "job_log", "job_done"]
+
+
+@pytest.mark.asyncio
+async def test_job_history_is_bounded():
+    """완료된 Job 이력은 job_history_size까지만 보관"""
+    jm = JobManager()
+
+    async def work(job):
+        return None
+
+    with patch("core.jobs.settings.job_history_size", 2):
+        jobs = [jm.submit("test", str(i), work) for i in range(3)]
+        await asyncio.gather(*(j.task for j in jobs))
+        jm.submit("test", "last", work)
+
+    assert jm.get(jobs[0].id) is None
+    assert len(jm.list()) == 3
+
+
+@pytest.mark.asyncio
+async def test_job_websocket_unsubscribes_on_client_disconnect():
+    """이벤트가 없는 동안 클라이언트가 끊겨도 핸들러가 끝나고 구독이 해제됨"""
+    from fastapi import FastAPI
+    from routers import jobs as jobs_router
+
+    jm = JobManager()
+    release = asyncio.Event()
+
+    async def work(job):
+        await release.wait()
+
+    job = jm.submit("test", "t", work)
+    app = FastAPI()
+    app.include_router(jobs_router.router)
+
+    sent = []
+    state_sent = asyncio.Event()
+    incoming = asyncio.Queue()
+    incoming.put_nowait({"type": "websocket.connect"})
+
+    async def receive():
+        return await incoming.get()
+
+    async def send(message):
+        sent.append(message)
+        if message.get("text") and "job_state" in message["text"]:
+            state_sent.set()
+
+    scope = {
+        "type": "websocket", "path": f"/ws/jobs/{job.id}", "raw_path": f"/ws/jobs/{job.id}".encode(),
+        "query_string": b"", "headers": [], "root_path": "", "scheme": "ws", "server": ("test", 80),
+        "subprotocols": [],
+    }
+    with patch.object(jobs_router, "job_manager", jm):
+        handler = asyncio.create_task(app(scope, receive, send))
+        await asyncio.wait_for(state_sent.wait(), timeout=2)
+        assert len(job._subscribers) == 1
+
+        incoming.put_nowait({"type": "websocket.disconnect", "code": 1001})
+        await asyncio.wait_for(handler, timeout=2)
+    assert job._subscribers == []
+    release.set()
+    await job.task
@@ -0,0 +1,113 @@
+"""
+로그 아카이브 (압축 세그먼트 + 시간 인덱스) 테스트
+"""
+import datetime
+import gzip
+import os
+from unittest.mock import patch
+
+import pytest
+
+from services.log_service import LogService
+from services.log_archive_service import LogArchiveService, _read_index, segment_key
+from core.exceptions import ArchiveSegmentNotFoundError, LogArchiveError
+
+# 2026-01-01 00:00:00 UTC
+_BASE = 1767225600
+
+
+def _record(offset: float, line: str):
+    ts = datetime.datetime.fromtimestamp(_BASE + offset, datetime.timezone.utc)
+    return {"ts": ts.strftime("%Y-%m-%dT%H:%M:%S.%fZ"), "stream": "stdout", "line": line}
+
+
+@pytest.fixture
+def archive(tmp_path):
+    with patch("services.log_archive_service.settings.log_archive_dir", str(tmp_path)):
+        yield LogArchiveService(LogService())
+
+
+@pytest.mark.asyncio
+async def test_collect_writes_blocks_per_hour_segment(archive, tmp_path):
+    """시간 단위 세그먼트에 블록별 gzip 멤버로 기록하고 인덱스 추가"""
+    await archive._collect("abc", "web", [_record(10, "a"), _record(20, "b")])
+    await archive._writer("web").flush()
+    await archive._collect("abc", "web", [_record(30, "c"), _record(3600 + 5, "next hour")])
+    await archive._writer("web").flush()
+
+    segments = await archive.list_segments("web")
+    assert [s["segment"] for s in segments] == ["2026010100", "2026010101"]
+    assert segments[0]["blocks"] == 2 and segments[0]["lines"] == 3
+
+    # 세그먼트 파일 전체가 그대로 유효한 gzip
+    raw = gzip.decompress((tmp_path / "web" / "2026010100.jsonl.gz").read_bytes())
+    assert raw.count(b"\n") == 3
+
+
+@pytest.mark.asyncio
+async def test_read_range_decompresses_only_overlapping_blocks(archive, tmp_path):
+    await archive._collect("abc", "web", [_record(10, "old")])
+    await archive._writer("web").flush()
+    await archive._collect("abc", "web", [_record(100, "new1"), _record(110, "new2")])
+    await archive._writer("web").flush()
+
+    path = tmp_path / "web" / "2026010100.jsonl.gz"
+    with patch("services.log_archive_service.gzip.decompress", wraps=gzip.decompress) as decompress:
+        result = await archive.read_range("web", start=_BASE + 50, end=_BASE + 105)
+    assert [r["line"] for r in result["lines"]] == ["new1"]
+    assert decompress.call_count == 1
+    assert len(_read_index(str(path).replace(".jsonl.gz", ".idx"))) == 2
+
+
+@pytest.mark.asyncio
+async def test_read_range_flushes_pending_lines_and_limits(archive):
+    await archive._collect("abc", "web", [_record(i, f"line {i}") for i in range(5)])
+    result = await archive.read_range("web", limit=3)
+    assert [r["line"] for r in result["lines"]] == ["line 0", "line 1", "line 2"]
+    assert result["truncated"] is True
+
+
+@pytest.mark.asyncio
+async def test_resume_epoch_from_existing_segments(archive):
+    await archive._collect("abc", "web", [_record(42, "x")])
+    await archive._writer("web").flush()
+    archive._writers.clear()
+    assert await archive._resume_epoch("other-id", "web") == pytest.approx(_BASE + 42)
+    assert segment_key(_BASE + 42) == "2026010100"
+
+
+def test_segment_path_rejects_unknown_or_unsafe_names(archive):
+    with pytest.raises(ArchiveSegmentNotFoundError):
+        archive.segment_path("web", "../../etc/passwd")
+    with pytest.raises(ArchiveSegmentNotFoundError):
+        archive.segment_path("web", "2026010100")
+
+
+@pytest.mark.asyncio
+async def test_dot_names_cannot_escape_archive_root(archive, tmp_path):
+    """".", ".."은 아카이브 루트 밖(또는 루트 자체)을 가리키므로 거부"""
+    (tmp_path / "2026010100.jsonl.gz").write_bytes(b"")
+    for name in ("..", ".", "/..", "..."):
+        with pytest.raises(LogArchiveError):
+            await archive.list_segments(name)
+        with pytest.raises(LogArchiveError):
+            await archive.read_range(name)
+        with pytest.raises(LogArchiveError):
+            archive.segment_path(name, "2026010100")
+
+
+@pytest.mark.asyncio
+async def test_symlinked_container_dir_outside_root_is_rejected(archive, tmp_path_factory):
+    outside = tmp_path_factory.mktemp("outside")
+    (outside / "2026010100.jsonl.gz").write_bytes(b"")
+    os.symlink(outside, os.path.join(archive.root, "link"))
+    with pytest.raises(LogArchiveError):
+        archive.segment_path("link", "2026010100")
+
+
+def test_disabled_archive_rejects_targets():
+    with patch("services.log_archive_service.settings.log_archive_dir", ""):
+        svc = LogArchiveService(LogService())
+        assert svc.enabled is False
+        with pytest.raises(LogArchiveError):
+            svc.add_selector("web")
@@ -0,0 +1,150 @@
+"""
+json-file 로그 직접 읽기 백엔드 테스트
+"""
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services import log_file_backend
+from services.log_file_backend import JsonLogFile, FileLogFollower
+from services.log_service import LogService, parse_docker_timestamp
+
+_ID = "a" * 64
+
+
+def _entry(second: int, log: str, stream: str = "stdout") -> str:
+    return json.dumps({"log": log, "stream": stream, "time": f"2026-01-01T00:00:{second:02d}.000000001Z"}) + "\n"
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    directory = tmp_path / _ID
+    directory.mkdir()
+    path = directory / f"{_ID}-json.log"
+    path.write_text("".join(_entry(i, f"line {i}\n", "stderr" if i == 3 else "stdout") for i in range(10)))
+    return path
+
+
+def _lines(records):
+    return [r["line"] for r in records]
+
+
+def test_read_tail_and_time_range(log_path):
+    log_file = JsonLogFile(str(log_path))
+    assert _lines(log_file.read(tail=2)[0]) == ["line 8", "line 9"]
+
+    since = parse_docker_timestamp("2026-01-01T00:00:03Z")
+    until = parse_docker_timestamp("2026-01-01T00:00:04.5Z")
+    records, _ = log_file.read(since=since, until=until)
+    assert _lines(records) == ["line 3", "line 4"]
+    assert records[0]["stream"] == "stderr"
+    assert records[0]["ts"] == "2026-01-01T00:00:03.000000001Z"
+
+
+def test_sparse_index_seeks_to_since(log_path):
+    """인덱스 간격이 작을 때도 since 위치를 정확히 찾음"""
+    with patch.object(log_file_backend, "INDEX_STRIDE", 100):
+        log_file = JsonLogFile(str(log_path))
+        records, _ = log_file.read(since=parse_docker_timestamp("2026-01-01T00:00:07Z"))
+        assert 1 < len(log_file._index) < 10
+    assert _lines(records) == ["line 7", "line 8", "line 9"]
+
+
+def test_partial_entries_are_joined(tmp_path):
+    path = tmp_path / "p.log"
+    path.write_text(_entry(1, "long ") + _entry(1, "message\n") + _entry(2, "next\n"))
+    assert _lines(JsonLogFile(str(path)).read()[0]) == ["long message", "next"]
+
+
+def test_read_from_returns_only_complete_new_lines(log_path):
+    log_file = JsonLogFile(str(log_path))
+    _, offset = log_file.read(tail=1)
+    with open(log_path, "a") as f:
+        f.write(_entry(20, "new\n") + '{"log":"half')
+    records, offset2, rotated = log_file.read_from(offset)
+    assert _lines(records) == ["new"] and not rotated
+    assert log_file.read_from(offset2)[0] == []
+
+
+@pytest.mark.asyncio
+async def test_file_follower_streams_appended_lines(log_path):
+    follower = FileLogFollower(JsonLogFile(str(log_path)), tail=1, streams=("stdout",))
+    await follower.start()
+    try:
+        assert _lines(await asyncio.wait_for(follower.queue.get(), 2)) == ["line 9"]
+        with open(log_path, "a") as f:
+            f.write(_entry(30, "err\n", "stderr") + _entry(31, "appended\n"))
+        assert _lines(await asyncio.wait_for(follower.queue.get(), 3)) == ["appended"]
+    finally:
+        follower.close()
+
+
+@pytest.mark.asyncio
+async def test_log_service_reads_file_without_daemon(log_path):
+    """파일을 읽을 수 있으면 데몬 logs API를 호출하지 않고, 없으면 API로 대체"""
+    client = MagicMock()
+    svc = LogService()
+    svc.set_client(client, MagicMock())
+    with patch("services.log_service.settings.docker_containers_dir", str(log_path.parent.parent)):
+        records = svc._read_logs_sync(_ID, 3, None, None)
+        assert _lines(records) == ["line 7", "line 8", "line 9"]
+        client.containers.get.assert_not_called()
+        container = client.containers.get.return_value
+        container.logs.assert_not_called()
+
+        # 짧은 ID / 이름은 데몬에 전체 ID만 한 번 조회 (이후 캐시)
+        container.id = _ID
+        for _ in range(2):
+            assert _lines(svc._read_logs_sync(_ID[:12], 1, None, None)) == ["line 9"]
+        client.containers.get.assert_called_once_with(_ID[:12])
+        container.logs.assert_not_called()
+
+        client.containers.get.side_effect = Exception("404 No such container")
+        assert svc._json_log_file("missing") is None
+
+
+def test_hex_name_is_resolved_by_daemon_not_by_directory_prefix(log_path):
+    """16진수 이름("aaa")이 다른 컨테이너 ID 접두사와 겹쳐도 그 로그를 읽지 않음"""
+    other_id = "b" * 64
+    (log_path.parent.parent / other_id).mkdir()
+    (log_path.parent.parent / other_id / f"{other_id}-json.log").write_text(_entry(1, "other\n"))
+    client = MagicMock()
+    client.containers.get.return_value.id = other_id
+    svc = LogService()
+    svc.set_client(client, MagicMock())
+    with patch("services.log_service.settings.docker_containers_dir", str(log_path.parent.parent)):
+        assert _lines(svc._read_logs_sync("aaa", "all", None, None)) == ["other"]
+
+
+def _long_entry(second: int, parts: list) -> str:
+    """16KB 단위로 나뉜 긴 로그 - 마지막 조각만 줄바꿈으로 끝남"""
+    return "".join(_entry(second, p) for p in parts)
+
+
+def test_follow_keeps_partial_line_across_polls(tmp_path):
+    """폴링 경계가 partial 묶음 중간이면 다음 폴링에서 묶음 처음부터 다시 합침"""
+    path = tmp_path / "p.log"
+    path.write_text(_entry(1, "first\n"))
+    log_file = JsonLogFile(str(path))
+    _, offset = log_file.read()
+    with open(path, "a") as f:
+        f.write(_entry(2, "head-"))
+    records, offset, _ = log_file.read_from(offset)
+    assert records == []
+    with open(path, "a") as f:
+        f.write(_entry(2, "middle-") + _entry(2, "tail\n"))
+    records, _, _ = log_file.read_from(offset)
+    assert _lines(records) == ["head-middle-tail"]
+
+
+def test_tail_counts_joined_lines_and_starts_at_group_boundary(tmp_path):
+    path = tmp_path / "p.log"
+    path.write_text(_entry(1, "a\n") + _long_entry(2, ["b1-", "b2-", "b3\n"]) + _entry(3, "c\n") + _entry(4, "unfinished-"))
+    log_file = JsonLogFile(str(path))
+    records, offset = log_file.read(tail=2)
+    assert _lines(records) == ["b1-b2-b3", "c"]
+    # follow는 끝나지 않은 partial 묶음의 첫 항목부터
+    assert offset == path.read_bytes().rfind(b'{"log": "unfinished-')
+    assert log_file.read(tail=0)[1] == offset
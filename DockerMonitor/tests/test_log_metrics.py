@@ -0,0 +1,95 @@
+"""
+로그 패턴 카운터 테스트
+"""
+import time
+from unittest.mock import patch
+
+import pytest
+
+from services.log_service import LogService
+from services.log_metrics_service import LogMetricsService, PatternMatcher
+
+
+def _record(epoch: float, line: str):
+    ts = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(epoch)) + ".000000000Z"
+    return {"ts": ts, "stream": "stdout", "line": line}
+
+
+def test_matcher_returns_each_label_once_per_line():
+    matcher = PatternMatcher({"error": r"ERROR|FATAL", "traceback": r"Traceback", "http5xx": r"\" 5\d\d "})
+    assert matcher.match("ERROR x ERROR Traceback (most recent call last)") == {"error", "traceback"}
+    assert matcher.match('"GET / HTTP/1.1" 502 12') == {"http5xx"}
+    assert matcher.match("all good") == set()
+
+
+def test_uncombinable_patterns_fall_back_to_separate_search():
+    """그룹 이름 중복 / 번호 역참조는 합친 정규식으로 만들 수 없어도 시작이 막히지 않음"""
+    matcher = PatternMatcher({"5xx": r"(?P<code>5\d\d)", "4xx": r"(?P<code>4\d\d)"})
+    assert matcher._regex is None
+    assert matcher.match("status 503") == {"5xx"}
+    assert matcher.match("status 404 then 500") == {"4xx", "5xx"}
+
+    matcher = PatternMatcher({"error": "ERROR", "repeat": r"(\w+) \1"})
+    assert matcher._regex is not None and [label for label, _ in matcher._separate] == ["repeat"]
+    assert matcher.match("ERROR retry retry") == {"error", "repeat"}
+    assert matcher.match("ERROR once") == {"error"}
+
+
+def _service(patterns):
+    with patch("services.log_metrics_service.settings.log_patterns", patterns):
+        return LogMetricsService(LogService())
+
+
+def test_invalid_patterns_are_skipped_and_empty_disables():
+    svc = _service({"ok": "ERROR", "bad": "(unclosed"})
+    assert svc.matcher.labels == ["ok"]
+    assert _service({}).enabled is False
+
+
+@pytest.mark.asyncio
+async def test_counts_per_container_per_minute():
+    svc = _service({"error": "ERROR", "traceback": "Traceback"})
+    minute = int(time.time() // 60 * 60)
+    await svc._collect("id1", "web", [
+        _record(minute - 60 + 1, "ERROR a"),
+        _record(minute + 1, "ERROR b"),
+        _record(minute + 2, "Traceback ERROR"),
+        _record(minute + 3, "fine"),
+    ])
+    await svc._collect("id2", "db", [_record(minute + 5, "ERROR c")])
+
+    history = svc.history(minutes=2)
+    assert history["minutes"] == [minute - 60, minute]
+    assert history["containers"]["web"] == {"error": [1, 2], "traceback": [0, 1]}
+    assert history["totals"]["error"] == [1, 3]
+    assert list(svc.history(minutes=2, container="db")["containers"]) == ["db"]
+
+
+@pytest.mark.asyncio
+async def test_old_buckets_are_pruned():
+    svc = _service({"error": "ERROR"})
+    old = time.time() - 3 * 3600
+    with patch("services.log_metrics_service.settings.log_metrics_history_minutes", 60):
+        await svc._collect("id1", "web", [_record(old, "ERROR old"), _record(time.time(), "ERROR new")])
+    assert len(svc._counts["web"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_entries_of_containers_no_longer_collected_are_dropped():
+    """삭제/이름 변경된 컨테이너는 버킷이 모두 만료되면 카운트와 재개 시각 항목까지 제거"""
+    svc = _service({"error": "ERROR"})
+    old = time.time() - 3 * 3600
+    await svc._collect("gone", "old-name", [_record(old + 60, "ERROR x")])
+    with patch("services.log_metrics_service.settings.log_metrics_history_minutes", 60):
+        await svc._collect("id1", "web", [_record(time.time(), "ERROR new")])
+        assert set(svc._counts) == {"web"}
+        assert "gone" not in svc._last_epoch
+
+        with patch("services.log_metrics_service.time.time", return_value=time.time() + 2 * 3600):
+            svc.history()
+    assert svc._counts == {} and svc._last_epoch == {}
+
+
+def test_service_starts_with_conflicting_group_names():
+    svc = _service({"5xx": r"(?P<code>5\d\d)", "4xx": r"(?P<code>4\d\d)", "bad": "(unclosed"})
+    assert svc.enabled and svc.matcher.labels == ["5xx", "4xx"]
@@ -0,0 +1,179 @@
+"""
+로그 검색 색인 테스트
+"""
+import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.log_service import LogService
+from services.log_search_service import LogIndex, LogSearchService, tokenize
+from core.exceptions import InvalidSearchQueryError, LogSearchTimeoutError
+
+
+# 보존 기간 안에 들도록 현재 시각 기준
+_BASE = int(time.time()) - 60
+
+
+def _record(second: int, line: str, stream: str = "stdout"):
+    ts = datetime.datetime.fromtimestamp(_BASE + second, datetime.timezone.utc)
+    return {"ts": ts.strftime("%Y-%m-%dT%H:%M:%S.000000000Z"), "stream": stream, "line": line}
+
+
+def _service_with_lines() -> LogSearchService:
+    svc = LogSearchService(LogService())
+    svc.index.add("aaa111", "web", [
+        _record(1, "GET /health 200"),
+        _record(2, "ERROR database timeout", "stderr"),
+        _record(3, "GET /users 200"),
+    ])
+    svc.index.add("bbb222", "worker", [
+        _record(4, "job 42 failed: database timeout"),
+        _record(5, "job 43 done"),
+    ])
+    return svc
+
+
+def test_tokenize_lowercases_and_skips_short_tokens():
+    assert tokenize("ERROR: a db_conn Timeout!") == {"error", "db_conn", "timeout"}
+
+
+@pytest.mark.asyncio
+async def test_search_matches_all_tokens_newest_first():
+    """모든 토큰을 포함하는 줄만, 최신 순으로 반환"""
+    svc = _service_with_lines()
+    result = await svc.search("Database TIMEOUT")
+    assert result["mode"] == "index"
+    assert [m["container"] for m in result["matches"]] == ["worker", "web"]
+    assert result["matches"][1]["stream"] == "stderr"
+
+
+@pytest.mark.asyncio
+async def test_search_filters_by_container_and_time():
+    svc = _service_with_lines()
+    result = await svc.search("timeout", containers=["web"])
+    assert [m["container"] for m in result["matches"]] == ["web"]
+
+    result = await svc.search("timeout", start=_BASE + 3)
+    assert [m["container"] for m in result["matches"]] == ["worker"]
+
+
+@pytest.mark.asyncio
+async def test_search_limit_marks_truncated():
+    svc = _service_with_lines()
+    result = await svc.search("get", limit=1)
+    assert result["truncated"] is True
+    assert result["matches"][0]["line"] == "GET /users 200"
+
+
+@pytest.mark.asyncio
+async def test_search_rejects_query_without_tokens():
+    svc = _service_with_lines()
+    with pytest.raises(InvalidSearchQueryError):
+        await svc.search("!")
+
+
+def test_index_evicts_oldest_lines_beyond_limit():
+    """줄 수 한도를 넘으면 오래된 줄과 해당 postings 제거"""
+    index = LogIndex()
+    with patch("services.log_search_service.settings.log_index_max_lines", 2), \
+            patch("services.log_search_service.settings.log_index_retention_seconds", 10 ** 10):
+        index.add("aaa", "web", [_record(1, "alpha"), _record(2, "beta"), _record(3, "gamma")])
+    assert len(index) == 2
+    assert index.search({"alpha"})[0] == []
+    assert [e[3]["line"] for e in index.search({"gamma"})[0]] == ["gamma"]
+    assert "alpha" not in index._postings
+
+
+@pytest.mark.asyncio
+async def test_regex_search_runs_in_process_pool():
+    svc = _service_with_lines()
+    try:
+        with patch("services.log_search_service.settings.log_search_processes", 1):
+            result = await svc.search(r"job \d+ (failed|done)", regex=True)
+        assert result["mode"] == "regex"
+        assert [m["line"] for m in result["matches"]] == ["job 43 done", "job 42 failed: database timeout"]
+
+        with pytest.raises(InvalidSearchQueryError):
+            await svc.search("(unclosed", regex=True)
+    finally:
+        await svc.stop()
+
+
+@pytest.mark.asyncio
+async def test_reconcile_starts_ingesters_for_matching_containers():
+    svc = LogSearchService(LogService())
+    client = MagicMock()
+    web, db = MagicMock(id="aaa111"), MagicMock(id="bbb222")
+    web.name, db.name = "web", "db"
+    client.containers.list.return_value = [web, db]
+    client.ping.return_value = True
+    svc.set_client(client, ThreadPoolExecutor(max_workers=2))
+    svc._ingest = MagicMock(side_effect=lambda cid, name: _noop())
+
+    svc.add_selector("web")
+    await svc.reconcile()
+    assert list(svc._ingesters) == ["aaa111"]
+    await svc.stop()
+
+
+async def _noop():
+    return None
+
+
+@pytest.mark.asyncio
+async def test_reconcile_defers_ingesters_when_stream_lane_is_busy():
+    """"*" 대상이어도 STREAM lane 여유만큼만 수집을 시작하고 나머지는 다음 확인으로 미룸"""
+    import threading
+    from core.executors import LaneExecutor
+
+    lane = LaneExecutor("stream", 8, 0)
+    gate = threading.Event()
+    busy = [lane.submit(gate.wait) for _ in range(4)]
+    log_service = LogService()
+    log_service.set_client(MagicMock(), ThreadPoolExecutor(max_workers=2), stream_executor=lane)
+    svc = LogSearchService(log_service)
+    client = MagicMock()
+    containers = [MagicMock(id=f"{i}" * 6) for i in range(3)]
+    for i, c in enumerate(containers):
+        c.name = f"c{i}"
+    client.containers.list.return_value = containers
+    svc.set_client(client, ThreadPoolExecutor(max_workers=2))
+    svc._ingest = MagicMock(side_effect=lambda cid, name: _noop())
+    try:
+        with patch("services.log_service.settings.stream_pool_workers", 8):
+            svc.add_selector("*")
+            await svc.reconcile()
+        # 여유 4 - 예비 2 = 2 스레드 → follow 1개
+        assert len(svc._ingesters) == 1
+    finally:
+        gate.set()
+        for future in busy:
+            future.result(timeout=1)
+        lane.shutdown(wait=True)
+        await svc.stop()
+
+
+@pytest.mark.asyncio
+async def test_regex_timeout_kills_scan_and_reports_503_error():
+    """시간 초과된 스캔은 워커를 종료하고, 다음 검색은 새 풀에서 바로 실행"""
+    svc = LogSearchService(LogService())
+    svc.index.add("aaa111", "web", [_record(1, "a" * 40 + "!"), _record(2, "job 7 done")])
+    try:
+        with patch("services.log_search_service.settings.log_search_processes", 1), \
+                patch("services.log_search_service.settings.log_search_regex_timeout", 1):
+            await svc.search("warm", regex=True)  # spawn 시간을 타임아웃에서 제외
+            workers = list(svc._pool._processes.values())
+            with pytest.raises(LogSearchTimeoutError):
+                await svc.search(r"^(a+)+$", regex=True)  # 역행 폭증
+            assert svc._pool is None
+            for process in workers:
+                process.join(timeout=2)
+                assert not process.is_alive()
+
+            result = await svc.search(r"job \d+", regex=True)
+        assert [m["line"] for m in result["matches"]] == ["job 7 done"]
+    finally:
+        await svc.stop()
@@ -0,0 +1,432 @@
+"""
+로그 서비스 (follow 스트림, 타임스탬프 파싱) 테스트
+"""
+import asyncio
+import gzip
+import json
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from core.config import settings
+from core.exceptions import TooManyLogTargetsError
+from core.executors import STREAM, LaneExecutor
+from services.log_service import LogService, LogBuffer, LogMerger, parse_since, parse_docker_timestamp, split_log_line
+
+
+class FakeStream:
+    """docker CancellableStream 대용 - 청크 목록을 순서대로 반환"""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self.closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.closed:
+            raise StopIteration
+        return next(self._chunks)
+
+    def close(self):
+        self.closed = True
+
+
+def _make_service(stdout_chunks, stderr_chunks=()):
+    client = MagicMock()
+    container = MagicMock()
+
+    def fake_logs(stdout, stderr, timestamps, tail, since, until=None, stream=False, follow=False):
+        if not stream:
+            return b""  # 초기 줄 없음 - follow 스트림으로만 전달
+        return FakeStream(stdout_chunks if stdout else stderr_chunks)
+
+    container.logs.side_effect = fake_logs
+    client.containers.get.return_value = container
+    svc = LogService()
+    ex = ThreadPoolExecutor(max_workers=4)
+    svc.set_client(client, ex, stream_executor=ex)
+    return svc
+
+
+async def _drain(follower):
+    records = []
+    while True:
+        item = await asyncio.wait_for(follower.queue.get(), timeout=2)
+        if item is None:
+            return records
+        records.extend(item)
+
+
+def test_parse_docker_timestamp_nanoseconds():
+    """나노초 타임스탬프도 epoch 초로 변환"""
+    ts = parse_docker_timestamp("2026-01-01T00:00:00.123456789Z")
+    assert ts == pytest.approx(1767225600.123456)
+    assert parse_docker_timestamp("garbage") is None
+
+
+def test_parse_since():
+    assert parse_since(None) is None
+    assert parse_since("1700000000.5") == 1700000000.5
+    assert parse_since("2026-01-01T00:00:00Z") == 1767225600.0
+
+
+def test_parse_since_ignores_non_positive_values():
+    """0 이하 since는 Docker가 거부하므로 지정 없음으로 처리"""
+    assert parse_since(0) is None
+    assert parse_since(-5) is None
+    assert parse_since("0") is None
+    assert parse_since("1970-01-01T00:00:00Z") is None
+
+
+def test_split_log_line():
+    rec = split_log_line(b"2026-01-01T00:00:00.1Z hello world\r", "stdout")
+    assert rec == {"ts": "2026-01-01T00:00:00.1Z", "stream": "stdout", "line": "hello world"}
+    assert split_log_line(b"no timestamp", "stderr")["ts"] is None
+
+
+@pytest.mark.asyncio
+async def test_follow_splits_chunks_into_lines():
+    """청크 경계와 무관하게 완성된 줄 단위로 전달"""
+    svc = _make_service([
+        b"2026-01-01T00:00:00Z first\n2026-01-01T00:00:01Z sec",
+        b"ond\n2026-01-01T00:00:02Z third",
+    ])
+    follower = await svc.follow("abc", stderr=False)
+    records = await _drain(follower)
+    follower.close()
+
+    assert [r["line"] for r in records] == ["first", "second", "third"]
+    assert all(r["stream"] == "stdout" for r in records)
+
+
+@pytest.mark.asyncio
+async def test_follow_separates_stdout_and_stderr():
+    """stdout/stderr는 별도 스트림으로 태깅"""
+    svc = _make_service(
+        [b"2026-01-01T00:00:00Z out\n"],
+        [b"2026-01-01T00:00:00Z err\n"],
+    )
+    follower = await svc.follow("abc")
+    records = await _drain(follower)
+    follower.close()
+
+    by_stream = {r["stream"]: r["line"] for r in records}
+    assert by_stream == {"stdout": "out", "stderr": "err"}
+
+
+@pytest.mark.asyncio
+async def test_follow_initial_lines_are_time_ordered_and_trimmed_to_tail():
+    """교차 출력된 stdout/stderr의 초기 줄은 시각 순으로 tail개만, 이후 follow는 새 줄만"""
+    out = [f"2026-01-01T00:00:0{i}Z out{i}".encode() for i in (1, 3, 5)]
+    err = [f"2026-01-01T00:00:0{i}Z err{i}".encode() for i in (2, 4, 6)]
+    follow_calls = []
+
+    def fake_logs(stdout, stderr, timestamps, tail, since, until=None, stream=False, follow=False):
+        lines = out if stdout else err
+        if not stream:
+            return b"\n".join(lines[-tail:]) + b"\n"
+        follow_calls.append((tail, since))
+        if stdout:
+            return FakeStream([b"2026-01-01T00:00:07Z out7\n"])
+        return FakeStream([err[-1] + b"\n"])  # since 경계의 줄은 다시 옴
+
+    client = MagicMock()
+    client.containers.get.return_value.logs.side_effect = fake_logs
+    svc = LogService()
+    ex = ThreadPoolExecutor(max_workers=4)
+    svc.set_client(client, ex, stream_executor=ex)
+
+    follower = await svc.follow("abc", tail=2)
+    first = await asyncio.wait_for(follower.queue.get(), timeout=2)
+    rest = await _drain(follower)
+    follower.close()
+
+    assert [r["line"] for r in first] == ["out5", "err6"]
+    assert [r["line"] for r in rest] == ["out7"]
+    assert follow_calls == [("all", parse_docker_timestamp("2026-01-01T00:00:06Z"))] * 2
+
+
+@pytest.mark.asyncio
+async def test_read_logs_returns_cursor_and_skips_boundary_line():
+    """cursor는 마지막 줄 타임스탬프, since=cursor 재조회 시 경계 줄 제외"""
+    client = MagicMock()
+    container = MagicMock()
+
+    def fake_logs(stdout, stderr, timestamps, tail, since, until):
+        if stdout:
+            return b"2026-01-01T00:00:01Z one\n2026-01-01T00:00:03Z three\n"
+        return b"2026-01-01T00:00:02Z two\n"
+
+    container.logs.side_effect = fake_logs
+    client.containers.get.return_value = container
+    svc = LogService()
+    svc.set_client(client, ThreadPoolExecutor(max_workers=2))
+
+    with patch("services.log_service.settings.log_buffer_lines", 0):
+        result = await svc.read_logs("abc", tail=100)
+        assert [r["line"] for r in result["lines"]] == ["one", "two", "three"]
+        assert result["lines"][1]["stream"] == "stderr"
+        assert result["cursor"] == "2026-01-01T00:00:03Z"
+
+        again = await svc.read_logs("abc", tail=100, since="2026-01-01T00:00:03Z")
+        assert "2026-01-01T00:00:03Z" not in [r["ts"] for r in again["lines"]]
+
+
+async def test_read_logs_pages_forward_from_cursor_when_more_than_tail_arrive():
+    """폴링 사이에 tail보다 많은 줄이 생기면 cursor 이후 오래된 줄부터 tail줄씩 이어 받음"""
+    client = MagicMock()
+    container = MagicMock()
+    produced = [f"2026-01-01T00:00:0{i}Z line{i}" for i in range(1, 8)]
+
+    def fake_logs(stdout, stderr, timestamps, tail, since, until):
+        if not stdout:
+            return b""
+        lines = [l for l in produced if since is None or parse_since(l.split(" ")[0]) >= since]
+        if tail != "all":
+            lines = lines[-tail:]
+        return "".join(l + "\n" for l in lines).encode()
+
+    container.logs.side_effect = fake_logs
+    client.containers.get.return_value = container
+    svc = LogService()
+    svc.set_client(client, ThreadPoolExecutor(max_workers=2))
+
+    with patch("services.log_service.settings.log_buffer_lines", 0):
+        first = await svc.read_logs("abc", tail=2, since="2026-01-01T00:00:01Z")
+        assert [r["line"] for r in first["lines"]] == ["line2", "line3"]
+        assert first["truncated"] is True
+
+        polled = []
+        result = first
+        while True:
+            polled += [r["line"] for r in result["lines"]]
+            if not result["truncated"]:
+                break
+            result = await svc.read_logs("abc", tail=2, since=result["cursor"])
+        assert polled == [f"line{i}" for i in range(2, 8)]
+        assert result["cursor"] == "2026-01-01T00:00:07Z"
+
+
+def _filled_buffer(complete: bool) -> LogBuffer:
+    buffer = LogBuffer(LogService(), "abc", size=3)
+    for i in range(1, 4):
+        buffer._append({"ts": f"2026-01-01T00:00:0{i}Z", "stream": "stdout", "line": str(i)})
+    buffer.ready = True
+    buffer.complete = complete
+    return buffer
+
+
+def test_buffer_serves_tail_and_since_within_range():
+    """버퍼 범위 안의 tail/since 조회는 버퍼에서 응답"""
+    buffer = _filled_buffer(complete=False)
+    assert [r["line"] for r in buffer.query(2)] == ["2", "3"]
+
+    since = parse_since("2026-01-01T00:00:02Z")
+    lines = buffer.query(100, since=since, since_raw="2026-01-01T00:00:02Z")
+    assert [r["line"] for r in lines] == ["3"]
+
+
+def test_buffer_defers_to_daemon_outside_range():
+    """버퍼보다 오래된 구간이나 버퍼 크기를 넘는 tail은 None (데몬 조회)"""
+    buffer = _filled_buffer(complete=False)
+    assert buffer.query(10) is None
+    assert buffer.query(10, since=parse_since("2026-01-01T00:00:00Z")) is None
+    assert buffer.query("all") is None
+
+    # 전체 로그가 버퍼 안에 있으면 응답 가능
+    complete = _filled_buffer(complete=True)
+    assert len(complete.query("all")) == 3
+
+
+def test_buffer_append_drops_oldest():
+    """링 버퍼는 크기를 넘으면 가장 오래된 줄부터 버림"""
+    buffer = _filled_buffer(complete=True)
+    buffer._append({"ts": "2026-01-01T00:00:04Z", "stream": "stdout", "line": "4"})
+    assert [r["line"] for r in buffer.query(3)] == ["2", "3", "4"]
+    assert buffer.complete is False
+
+
+async def _collect_download(body) -> bytes:
+    return b"".join([chunk async for chunk in body])
+
+
+@pytest.mark.asyncio
+async def test_download_merges_streams_in_time_order():
+    """stdout/stderr를 별도 스트림으로 읽어 타임스탬프 순으로 병합 (청크 경계 무관)"""
+    svc = _make_service(
+        [b"2026-01-01T00:00:01Z out1\n2026-01-01T00:00:0", b"3Z out3\n"],
+        [b"2026-01-01T00:00:02Z err2\n"],
+    )
+    body = await svc.open_download("abc", fmt="ndjson")
+    records = [json.loads(l) for l in (await _collect_download(body)).splitlines()]
+    assert [(r["stream"], r["line"]) for r in records] == [
+        ("stdout", "out1"), ("stderr", "err2"), ("stdout", "out3"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_download_text_gzip_and_closes_streams():
+    svc = _make_service([b"2026-01-01T00:00:01Z hello\n"])
+    body = await svc.open_download("abc", timestamps=False, compress=True, stderr=False)
+    assert gzip.decompress(await _collect_download(body)) == b"hello\n"
+    container = svc.client.containers.get.return_value
+    assert container.logs.call_args.kwargs["follow"] is False
+
+
+class FakeFollower:
+    def __init__(self):
+        self.queue = asyncio.Queue()
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _rec(second, line):
+    return {"ts": f"2026-01-01T00:00:{second:02d}Z", "stream": "stdout", "line": line}
+
+
+async def _merged(merger, count):
+    out = []
+    async for batch in merger.batches():
+        out.extend(batch)
+        if len(out) >= count:
+            break
+    return out
+
+
+@pytest.mark.asyncio
+async def test_merger_orders_across_sources_within_window():
+    """window 안에 늦게 도착한 이른 줄도 시각 순 위치에 끼워짐"""
+    a, b = FakeFollower(), FakeFollower()
+    merger = LogMerger([a, b], ["web", "db"], window=0.2)
+    a.queue.put_nowait([_rec(1, "a1"), _rec(3, "a3")])
+    task = asyncio.create_task(_merged(merger, 4))
+    await asyncio.sleep(0.05)
+    b.queue.put_nowait([_rec(2, "b2"), _rec(4, "b4")])
+    a.queue.put_nowait(None)
+    b.queue.put_nowait(None)
+
+    out = await asyncio.wait_for(task, 2)
+    assert [(r["container"], r["line"]) for r in out] == [
+        ("web", "a1"), ("db", "b2"), ("web", "a3"), ("db", "b4"),
+    ]
+    assert a.closed and b.closed
+
+
+@pytest.mark.asyncio
+async def test_merger_backpressure_is_per_source():
+    """한 소스가 한도를 넘으면 그 소스의 큐만 읽기를 멈춤"""
+    busy, quiet = FakeFollower(), FakeFollower()
+    merger = LogMerger([busy, quiet], ["busy", "quiet"], window=10, max_pending=2)
+    for i in range(5):
+        busy.queue.put_nowait([_rec(i, f"x{i}")])
+    quiet.queue.put_nowait([_rec(1, "q")])
+
+    gen = merger.batches()
+    task = asyncio.create_task(gen.__anext__())
+    await asyncio.sleep(0.05)
+    assert busy.queue.qsize() == 3  # 2줄만 힙에 들어가고 나머지는 큐에 남음
+    assert quiet.queue.qsize() == 0
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    await gen.aclose()
+
+
+class BlockingStream:
+    """follow 스트림 대용 - 닫힐 때까지 읽기 스레드를 붙잡음"""
+
+    def __init__(self):
+        self._closed = threading.Event()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        self._closed.wait()
+        raise StopIteration
+
+    def close(self):
+        self._closed.set()
+
+
+async def test_full_log_buffer_leaves_stream_lane_for_live_follow(monkeypatch):
+    """버퍼를 가득 채워도 STREAM lane에 실시간 follow 자리가 남아야 함"""
+    monkeypatch.setattr(settings, "stream_pool_workers", 32)
+    monkeypatch.setattr(settings, "log_buffer_max_containers", 20)
+    streams = []
+
+    def fake_logs(stdout, stderr, timestamps, tail, since, until=None, stream=False, follow=False):
+        if not stream:
+            return b""
+        if not follow:
+            return iter(())  # 비-follow 스트림은 바로 끝남
+        streams.append(BlockingStream())
+        return streams[-1]
+
+    client = MagicMock()
+    client.containers.get.return_value.logs.side_effect = fake_logs
+    lane = LaneExecutor(STREAM, settings.stream_pool_workers, 0)
+    svc = LogService()
+    svc.set_client(client, ThreadPoolExecutor(max_workers=4), stream_executor=lane)
+    live = []
+    try:
+        for i in range(20):
+            await svc.read_logs(f"c{i}", tail=10)
+        await asyncio.sleep(0.1)
+        assert len(svc._buffers) == svc.buffer_limit() <= 4
+        assert lane.metrics()["active"] <= settings.stream_pool_workers // 4
+
+        for i in range(8):
+            live.append(await svc.follow(f"live{i}"))
+        assert lane.metrics()["rejected"] == 0
+    finally:
+        for buffer in list(svc._buffers.values()):
+            buffer.close()
+        for follower in live:
+            follower.close()
+        for stream in streams:
+            stream.close()
+        lane.shutdown(wait=True)
+
+
+async def test_follow_many_rejects_more_targets_than_stream_lane_fits(monkeypatch):
+    """lane 여유를 넘는 병합 요청은 스트림을 열기 전에 거부하고, 실행 중인 스트림은 그대로 둠"""
+    monkeypatch.setattr(settings, "stream_pool_workers", 32)
+    monkeypatch.setattr(settings, "log_merge_max_containers", 50)
+    streams = []
+
+    def fake_logs(stdout, stderr, timestamps, tail, since, until=None, stream=False, follow=False):
+        if not stream:
+            return b""
+        if not follow:
+            return iter(())  # 비-follow 스트림은 바로 끝남
+        streams.append(BlockingStream())
+        return streams[-1]
+
+    client = MagicMock()
+    client.containers.get.return_value.logs.side_effect = fake_logs
+    lane = LaneExecutor(STREAM, settings.stream_pool_workers, 0)
+    svc = LogService()
+    svc.set_client(client, ThreadPoolExecutor(max_workers=4), stream_executor=lane)
+    existing = await svc.follow("running")
+    try:
+        # 32 - 2(실행 중) - 8(예비) = 22 스레드 → 11개
+        assert svc.merge_capacity() == 11
+        targets = [{"id": f"c{i}", "name": f"c{i}"} for i in range(17)]
+        with pytest.raises(TooManyLogTargetsError) as exc:
+            await svc.follow_many(targets)
+        assert exc.value.limit == 11
+        assert len(streams) == 2 and lane.metrics()["rejected"] == 0
+
+        merger = await svc.follow_many(targets[:11])
+        assert lane.metrics()["rejected"] == 0
+        merger.close()
+    finally:
+        existing.close()
+        for stream in streams:
+            stream.close()
+        lane.shutdown(wait=True)
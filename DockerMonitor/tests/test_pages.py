@@ -0,0 +1,87 @@
+"""
+페이지 초기 데이터 주입 / 템플릿 사전 컴파일 테스트
+"""
+import asyncio
+import json
+import re
+import time
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+
+from core.config import settings
+from core.monitor import monitor
+from routers import pages
+from services import container_service, image_service
+
+
+def _initial_state(html: str) -> dict:
+    match = re.search(r'<script id="initial-state" type="application/json">(.*?)</script>', html, re.S)
+    return json.loads(match.group(1))
+
+
+@pytest.fixture
+async def ac(monkeypatch):
+    monkeypatch.setattr(type(container_service), "is_connected", property(lambda self: True))
+    monkeypatch.setattr(monitor, "_snapshot", None)
+    app = FastAPI()
+    app.include_router(pages.router)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+async def test_dashboard_renders_monitor_snapshot(ac, monkeypatch):
+    containers = [{"id": "abc", "name": "</script><b>web", "status": "running"}]
+    monkeypatch.setattr(monitor, "_snapshot", {"containers": containers, "stats": [{"id": "abc", "cpu_percent": 1.5}]})
+    monkeypatch.setattr(monitor, "_snapshot_at", time.time())
+
+    res = await ac.get("/")
+    assert res.status_code == 200
+    assert "</script><b>" not in res.text  # JSON은 HTML 이스케이프되어 삽입
+    state = _initial_state(res.text)
+    assert state["containers"] == containers
+    assert state["stats"][0]["cpu_percent"] == 1.5
+
+    # 로그 페이지는 같은 스냅샷에서 컨테이너 목록만
+    assert _initial_state((await ac.get("/logs")).text) == {"containers": containers}
+
+
+async def test_stale_snapshot_falls_back_to_listing(ac, monkeypatch):
+    monkeypatch.setattr(monitor, "_snapshot", {"containers": [{"id": "old"}], "stats": []})
+    monkeypatch.setattr(monitor, "_snapshot_at", time.time() - settings.monitor_interval * 10)
+
+    async def list_containers():
+        return [{"id": "fresh", "name": "web", "status": "exited"}]
+
+    monkeypatch.setattr(container_service, "list_containers", list_containers)
+    assert _initial_state((await ac.get("/")).text) == {"containers": [{"id": "fresh", "name": "web", "status": "exited"}]}
+
+
+async def test_resource_list_is_injected_or_left_to_the_browser(ac, monkeypatch):
+    delay = 0
+
+    async def list_images():
+        await asyncio.sleep(delay)
+        return [{"id": "sha256:1", "repository": "nginx", "tag": "latest"}]
+
+    monkeypatch.setattr(image_service, "list_images", list_images)
+    state = _initial_state((await ac.get("/images")).text)
+    assert state["images"][0]["repository"] == "nginx"
+
+    # 조회가 PAGE_STATE_TIMEOUT을 넘으면 비워 두고 브라우저가 API로 조회
+    delay = 0.5
+    monkeypatch.setattr(settings, "page_state_timeout", 0.05)
+    assert _initial_state((await ac.get("/images")).text) == {}
+
+
+async def test_disconnected_docker_injects_nothing(ac, monkeypatch):
+    monkeypatch.setattr(type(container_service), "is_connected", property(lambda self: False))
+    assert _initial_state((await ac.get("/networks")).text) == {}
+
+
+def test_templates_are_precompiled():
+    assert pages.templates.env.auto_reload is False
+    pages.warm_templates()
+    cached = {key[1] for key in pages.templates.env.cache.keys()}
+    assert {"base.html", "index.html", "compose.html"} <= cached
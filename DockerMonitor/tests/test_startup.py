@@ -0,0 +1,76 @@
+"""
+시작 시간 벤치마크 / readiness 테스트
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from core import connection
+from core.readiness import readiness
+
+# import 시간 상한 (초) - 느린 CI에서는 STARTUP_IMPORT_BUDGET으로 조정
+IMPORT_BUDGET = float(os.environ.get("STARTUP_IMPORT_BUDGET", "5"))
+# Docker 데몬 없이 lifespan 시작이 끝나야 하는 시간 (초)
+LIFESPAN_BUDGET = 2.0
+
+_BENCH = """
+import json, sys, time
+started = time.perf_counter()
+import main
+print(json.dumps({
+    "import_s": time.perf_counter() - started,
+    "docker_loaded": "docker" in sys.modules,
+    "requests_loaded": "requests" in sys.modules,
+}))
+"""
+
+
+def test_import_benchmark():
+    """main import - docker-py(requests 포함)는 첫 연결 전까지 로드하지 않음"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run(
+        [sys.executable, "-c", _BENCH], cwd=root, capture_output=True, text=True, timeout=60, check=True
+    )
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    print(f"\nmain import: {result['import_s'] * 1000:.0f}ms")
+    assert not result["docker_loaded"]
+    assert not result["requests_loaded"]
+    assert result["import_s"] < IMPORT_BUDGET
+
+
+@pytest.fixture
+def docker_down(monkeypatch):
+    def _fail():
+        raise ConnectionError("daemon unavailable")
+    monkeypatch.setattr(connection, "_create_client_sync", _fail)
+    monkeypatch.setattr(connection, "_client", None)
+
+
+async def test_lifespan_does_not_wait_for_docker(docker_down, monkeypatch):
+    import main
+
+    started = time.perf_counter()
+    async with main.lifespan(main.app):
+        elapsed = time.perf_counter() - started
+        print(f"\nlifespan startup without Docker: {elapsed * 1000:.0f}ms")
+        assert elapsed < LIFESPAN_BUDGET
+        assert readiness.startup_complete
+        assert all(state == "ok" for state in readiness.subsystems.values())
+        assert {"monitor", "templates", "static_assets"} <= set(readiness.subsystems)
+
+        async with AsyncClient(transport=ASGITransport(app=main.app), base_url="http://test") as ac:
+            # 인증 없이 접근 가능 (프로브용)
+            assert (await ac.get("/healthz")).json() == {"status": "ok"}
+            res = await ac.get("/readyz")
+            assert res.status_code == 503
+            assert res.json()["http"] is True and res.json()["docker"] is False
+
+            monkeypatch.setattr(connection, "_client", object())
+            res = await ac.get("/readyz")
+            assert res.status_code == 200 and res.json()["ready"] is True
+            monkeypatch.setattr(connection, "_client", None)
@@ -0,0 +1,88 @@
+"""
+정적 파일 핑거프린트 / 사전 압축 테스트
+"""
+import gzip
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+from core import static_assets
+from core.static_assets import FingerprintedStaticFiles
+
+APP_JS = "function hello() { return 'hello'; }\n" * 100
+
+
+@pytest.fixture
+def files(tmp_path):
+    (tmp_path / "app.js").write_text(APP_JS)
+    (tmp_path / "style.css").write_text("body { color: red; }\n")
+    return FingerprintedStaticFiles(directory=str(tmp_path))
+
+
+@pytest.fixture
+async def ac(files):
+    app = Starlette(routes=[Mount("/static", files, name="static")])
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+async def test_fingerprinted_url_is_immutable_and_precompressed(files, ac):
+    url = files.url("app.js")
+    assert url.startswith("/static/app.") and url.endswith(".js") and url != "/static/app.js"
+
+    res = await ac.get(url, headers={"Accept-Encoding": "gzip"})
+    assert res.status_code == 200
+    assert res.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert res.headers["content-encoding"] == "gzip"
+    assert res.headers["vary"] == "Accept-Encoding"
+    assert int(res.headers["content-length"]) < len(APP_JS)
+    assert res.text == APP_JS  # httpx가 압축 해제
+
+    res = await ac.get(url, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in res.headers and res.text == APP_JS
+
+    res = await ac.get(url, headers={"If-None-Match": res.headers["etag"]})
+    assert res.status_code == 304 and res.content == b""
+
+
+async def test_small_files_and_plain_paths(files, ac):
+    # 작은 파일은 압축본 없이 원본만
+    res = await ac.get(files.url("style.css"), headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in res.headers
+    assert res.headers["content-type"].startswith("text/css")
+
+    # 해시 없는 경로는 재검증 캐시, 모르는 파일은 원래 경로 그대로
+    res = await ac.get("/static/app.js")
+    assert res.status_code == 200 and res.headers["cache-control"] == "no-cache"
+    assert files.url("missing.js") == "/static/missing.js"
+    assert (await ac.get("/static/missing.js")).status_code == 404
+
+
+def test_fingerprint_follows_content(tmp_path, files):
+    before = files.url("app.js")
+    (tmp_path / "app.js").write_text(APP_JS + "// changed\n")
+    files.build()
+    assert files.url("app.js") != before
+
+
+def test_brotli_variant_when_available(files, monkeypatch):
+    brotli = pytest.importorskip("brotli")
+    files.build()
+    asset = files._assets["app.js"]
+    assert brotli.decompress(asset.variants["br"]).decode() == APP_JS
+    assert asset.select("gzip, deflate, br") == "br"
+    assert asset.select("gzip, br;q=0") == "gzip"
+
+
+def test_gzip_only_without_brotli(tmp_path, monkeypatch):
+    monkeypatch.setattr(static_assets, "brotli", None)
+    (tmp_path / "app.js").write_text(APP_JS)
+    files = FingerprintedStaticFiles(directory=str(tmp_path))
+    files.build()
+    asset = files._assets["app.js"]
+    assert set(asset.variants) == {"identity", "gzip"}
+    assert gzip.decompress(asset.variants["gzip"]).decode() == APP_JS
+    assert asset.select("br, gzip") == "gzip"
+    assert asset.select("") == "identity"
@@ -0,0 +1,234 @@
+"""
+터미널 exec 세션 테스트 (socketpair로 Docker 소켓 대체)
+"""
+import asyncio
+import socket
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.config import settings
+from core.exceptions import TerminalSessionLimitError
+from routers.terminal import parse_resize
+from services.exec_service import ExecSession
+from services.terminal_service import Scrollback, TerminalService
+
+
+@pytest.fixture
+def sockets():
+    server, client = socket.socketpair()
+    yield server, client
+    for s in (server, client):
+        s.close()
+
+
+async def test_session_reads_via_event_loop(sockets):
+    server, client = sockets
+    session = ExecSession("exec1", server)
+    session.start()
+    try:
+        assert session.uses_event_loop
+        client.sendall(b"\x1b[1mhello\x00")
+        assert await asyncio.wait_for(session.read(), 1) == b"\x1b[1mhello\x00"
+
+        await session.write(b"ls\r")
+        assert client.recv(16) == b"ls\r"
+
+        client.shutdown(socket.SHUT_WR)
+        assert await asyncio.wait_for(session.read(), 1) is None
+        assert not session._reader_registered
+    finally:
+        session.close()
+
+
+async def test_session_falls_back_to_thread_reader(sockets):
+    """fd를 이벤트 루프에 등록할 수 없는 소켓은 블로킹 recv 스레드로 읽음"""
+    server, client = sockets
+    wrapper = MagicMock(spec=["recv", "sendall", "setblocking", "close"])
+    wrapper.recv.side_effect = server.recv
+    wrapper.sendall.side_effect = server.sendall
+    session = ExecSession("exec1", wrapper)
+    session.start()
+    try:
+        assert not session.uses_event_loop
+        client.sendall(b"out")
+        assert await asyncio.wait_for(session.read(), 1) == b"out"
+        await session.write(b"in")
+        assert client.recv(16) == b"in"
+        client.shutdown(socket.SHUT_WR)
+        assert await asyncio.wait_for(session.read(), 1) is None
+    finally:
+        session.close()
+
+
+def test_parse_resize():
+    assert parse_resize('{"type": "resize", "cols": 120, "rows": 40}') == (40, 120)
+    assert parse_resize('{"type": "resize", "cols": 0, "rows": 40}') is None
+    assert parse_resize('{"type": "other"}') is None
+    assert parse_resize("{not json") is None
+    assert parse_resize("ls -la\r") is None
+
+
+async def test_output_is_coalesced(sockets):
+    """flush 창 안에 도착한 작은 출력들은 한 번에 반환"""
+    server, client = sockets
+    session = ExecSession("exec1", server)
+    session.start()
+    try:
+        with patch.object(settings, "terminal_flush_ms", 50):
+            for i in range(20):
+                client.sendall(b"x")
+                await asyncio.sleep(0.001)
+            assert await asyncio.wait_for(session.read(), 1) == b"x" * 20
+    finally:
+        session.close()
+
+
+async def test_reads_pause_when_consumer_falls_behind(sockets):
+    server, client = sockets
+    client.setblocking(False)
+    session = ExecSession("exec1", server)
+    session.start()
+    try:
+        with patch.object(settings, "terminal_max_buffer_bytes", 1024), \
+             patch.object(settings, "terminal_flush_bytes", 256), \
+             patch.object(settings, "terminal_flush_ms", 0):
+            client.sendall(b"a" * 4096)
+            for _ in range(50):
+                await asyncio.sleep(0.01)
+                if session.paused:
+                    break
+            assert session.paused
+            assert not session._reader_registered
+
+            received = b""
+            while len(received) < 4096:
+                received += await asyncio.wait_for(session.read(), 1)
+            assert received == b"a" * 4096
+            assert not session.paused
+    finally:
+        session.close()
+
+
+# ---- 서버 측 세션 (재연결 / 스크롤백) ----
+
+def test_scrollback_ring_offsets():
+    scrollback = Scrollback(limit=8)
+    scrollback.append(b"hello")
+    scrollback.append(b"world")
+    assert (scrollback.start, scrollback.end) == (2, 10)
+    assert scrollback.since(7) == b"rld"
+    assert scrollback.since(0) == b"lloworld"  # 밀려난 앞부분은 제외
+    assert scrollback.since(10) == b""
+
+
+@pytest.fixture
+def terminal(sockets):
+    server, client = sockets
+    exec_service = MagicMock()
+
+    async def open_session(container_id):
+        session = ExecSession("exec1", server)
+        session.start()
+        return session
+
+    exec_service.open_session = open_session
+    return TerminalService(exec_service), client
+
+
+class _Client:
+    def __init__(self):
+        self.received = b""
+        self.offsets = []
+
+    async def send(self, data: bytes):
+        self.received += data
+
+    async def announce(self, offset: int):
+        self.offsets.append(offset)
+
+
+async def _until(predicate):
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not met")
+
+
+async def test_reattach_replays_only_missed_output(terminal):
+    service, client_sock = terminal
+    term = await service.open("abc123")
+    first = _Client()
+    token = await term.attach(first.send, first.announce)
+    client_sock.sendall(b"one ")
+    await _until(lambda: first.received == b"one ")
+
+    # 연결이 끊긴 동안 출력은 스크롤백에 쌓임
+    term.detach(token)
+    assert token.is_set()
+    client_sock.sendall(b"two ")
+    await _until(lambda: term.scrollback.end == 8)
+
+    second = _Client()
+    assert service.get(term.id, "abc") is term
+    await term.attach(second.send, second.announce, offset=len(first.received))
+    assert second.offsets == [4]
+    assert second.received == b"two "
+
+    client_sock.sendall(b"three")
+    await _until(lambda: second.received == b"two three")
+    assert first.received == b"one "
+
+    service.terminate(term.id)
+    await asyncio.wait_for(term.ended.wait(), 1)
+    assert service.get(term.id) is None
+    assert service.list() == []
+
+
+async def test_new_client_displaces_previous(terminal):
+    service, _ = terminal
+    term = await service.open("abc123")
+    first, second = _Client(), _Client()
+    token = await term.attach(first.send, first.announce)
+    await term.attach(second.send, second.announce)
+    assert token.is_set()
+    term.detach(token)  # 밀려난 연결의 해제는 새 클라이언트에 영향 없음
+    assert term.attached
+    await service.stop()
+
+
+async def test_stalled_client_does_not_block_attach(terminal):
+    """전송이 멈춘 클라이언트가 있어도 새 클라이언트는 붙고 이후 출력을 받음"""
+    service, client_sock = terminal
+    term = await service.open("abc123")
+    stalled = asyncio.Event()
+
+    async def stuck_send(data: bytes):
+        stalled.set()
+        await asyncio.Event().wait()
+
+    token = await term.attach(stuck_send, _Client().announce)
+    client_sock.sendall(b"one ")
+    await asyncio.wait_for(stalled.wait(), 1)
+
+    second = _Client()
+    await asyncio.wait_for(term.attach(second.send, second.announce), 1)
+    assert token.is_set()
+    assert second.received == b"one "
+
+    client_sock.sendall(b"two")
+    await _until(lambda: second.received == b"one two")
+    await service.stop()
+
+
+async def test_session_limit_and_idle_timeout(terminal):
+    service, _ = terminal
+    with patch.object(settings, "terminal_max_sessions", 1), \
+         patch.object(settings, "terminal_idle_timeout", 0.05):
+        term = await service.open("abc123")
+        with pytest.raises(TerminalSessionLimitError):
+            await service.open("abc123")
+        # 클라이언트가 붙지 않은 세션은 유휴 시간 후 종료
+        await asyncio.wait_for(term.ended.wait(), 1)
+        assert service.list() == []